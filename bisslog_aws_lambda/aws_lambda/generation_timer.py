@@ -0,0 +1,149 @@
+"""
+Module for timing the phases of a handler generation run.
+
+This module defines a timer that accumulates the time spent reading the service
+metadata, discovering the use cases, generating, validating and resolving each
+handler, and renders the totals and the slowest use cases as text or JSON.
+"""
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Optional
+
+
+class GenerationTimer:
+    """
+    Accumulates the time of each phase of a generation run.
+
+    The phases are "metadata" (reading the metadata file, or the metadata cache),
+    "discovery" (walking and importing the use case modules), "generation" (building
+    each handler), "validation" (checking the handlers, when requested) and
+    "resolver" (saving, printing or packaging each handler).
+    Generation and resolver times are also kept per use case.
+    """
+
+    phases = ("metadata", "discovery", "generation", "validation", "resolver")
+
+    def __init__(self):
+        self.totals: Dict[str, float] = dict.fromkeys(self.phases, 0.0)
+        self.use_cases: Dict[str, Dict[str, float]] = {}
+        self._start = time.perf_counter()
+
+    def add(self, phase: str, seconds: float, use_case: Optional[str] = None) -> None:
+        """
+        Adds time to a phase.
+
+        Parameters
+        ----------
+        phase : str
+            One of `phases`.
+        seconds : float
+            Elapsed time.
+        use_case : str, optional
+            Keyname of the use case the time belongs to.
+        """
+        self.totals[phase] += seconds
+        if use_case is not None:
+            times = self.use_cases.setdefault(use_case, {"generation": 0.0, "resolver": 0.0})
+            times[phase] = times.get(phase, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, phase: str, use_case: Optional[str] = None) -> Iterator[None]:
+        """
+        Times the enclosed block as part of a phase.
+
+        Parameters
+        ----------
+        phase : str
+            One of `phases`.
+        use_case : str, optional
+            Keyname of the use case the time belongs to.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(phase, time.perf_counter() - start, use_case)
+
+    def timed(self, phase: str, function: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Wraps a function so that every call is timed as part of a phase.
+
+        Parameters
+        ----------
+        phase : str
+            One of `phases`.
+        function : Callable[..., Any]
+            Function to wrap.
+
+        Returns
+        -------
+        Callable[..., Any]
+            Function with the same behavior.
+        """
+        def timed_function(*args, **kwargs):
+            with self.phase(phase):
+                return function(*args, **kwargs)
+
+        return timed_function
+
+    def report(self, top: int = 5) -> Dict[str, Any]:
+        """
+        Summarizes the timings.
+
+        Parameters
+        ----------
+        top : int, optional
+            Number of slowest use cases listed (default is 5).
+
+        Returns
+        -------
+        Dict[str, Any]
+            `total_ms` since the timer was created, `phases` with the milliseconds of
+            each phase, the number of `use_cases` and the `slowest_use_cases` by
+            generation plus resolver time.
+        """
+        slowest = sorted(self.use_cases.items(),
+                         key=lambda item: item[1]["generation"] + item[1]["resolver"],
+                         reverse=True)[:top]
+        return {
+            "total_ms": (time.perf_counter() - self._start) * 1000,
+            "phases": {phase: seconds * 1000 for phase, seconds in self.totals.items()},
+            "use_cases": len(self.use_cases),
+            "slowest_use_cases": [{
+                "use_case": use_case,
+                "generation_ms": times["generation"] * 1000,
+                "resolver_ms": times["resolver"] * 1000,
+                "total_ms": (times["generation"] + times["resolver"]) * 1000,
+            } for use_case, times in slowest],
+        }
+
+
+def format_generation_timing(report: Dict[str, Any]) -> str:
+    """
+    Renders a generation timing report as text.
+
+    Parameters
+    ----------
+    report : Dict[str, Any]
+        Report produced by `GenerationTimer.report`.
+
+    Returns
+    -------
+    str
+        Human-readable tables of the phases and of the slowest use cases.
+    """
+    total = report["total_ms"]
+    header = f"{'phase':<28}{'ms':>12}{'%':>8}"
+    lines = [header, "-" * len(header)]
+    for phase, milliseconds in report["phases"].items():
+        share = milliseconds / total * 100 if total else 0.0
+        lines.append(f"{phase:<28}{milliseconds:>12.2f}{share:>8.1f}")
+    lines.append(f"{'total':<28}{total:>12.2f}")
+    if report["slowest_use_cases"]:
+        header = f"{'use case':<28}{'generation ms':>16}{'resolver ms':>14}{'total ms':>12}"
+        lines.extend(["", f"Slowest of {report['use_cases']} use cases", header,
+                      "-" * len(header)])
+        for row in report["slowest_use_cases"]:
+            lines.append(f"{row['use_case']:<28}{row['generation_ms']:>16.2f}"
+                         f"{row['resolver_ms']:>14.2f}{row['total_ms']:>12.2f}")
+    return "\n".join(lines)
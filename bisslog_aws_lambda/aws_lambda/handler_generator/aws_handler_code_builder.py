@@ -0,0 +1,110 @@
+"""
+Module defining an accumulating builder for AWS Lambda handler code.
+
+This module provides a builder that collects the fragments produced by the handler
+generators in line lists, renders the module once at the end and validates it with
+`compile()`, instead of concatenating the whole code on every merge.
+"""
+from typing import Dict, List, Optional, Set
+
+from .aws_handler_gen_response import AWSHandlerGenResponse
+
+
+class AWSHandlerCodeBuilder:
+    """
+    Accumulates handler fragments and joins them once.
+
+    Merging `AWSHandlerGenResponse` objects with `+` or `+=` copies the accumulated body
+    and build on every step, which is quadratic in the number of fragments. The builder
+    only appends each fragment to a list, so assembling a handler with many triggers
+    stays linear.
+    """
+
+    def __init__(self):
+        self._preamble: List[str] = []
+        self._build: List[str] = []
+        self._body: List[str] = []
+        self._importing: Dict[str, Set[str]] = {}
+
+    def add(self, response: Optional[AWSHandlerGenResponse]) -> "AWSHandlerCodeBuilder":
+        """
+        Appends the fragments of a generator response.
+
+        Parameters
+        ----------
+        response : AWSHandlerGenResponse, optional
+            Response to append. None is ignored, as generators return it when they do
+            not apply to the triggers of the use case.
+
+        Returns
+        -------
+        AWSHandlerCodeBuilder
+            The builder itself, to chain calls.
+        """
+        if response is None:
+            return self
+        if response.preamble:
+            self._preamble.append(response.preamble)
+        if response.build:
+            self._build.append(response.build)
+        if response.body:
+            self._body.append(response.body)
+        for module, symbols in response.importing.items():
+            self._importing.setdefault(module, set()).update(symbols)
+        return self
+
+    def to_response(self) -> AWSHandlerGenResponse:
+        """
+        Joins the accumulated fragments into a single response.
+
+        Returns
+        -------
+        AWSHandlerGenResponse
+            A response equivalent to merging every added response with `+`.
+        """
+        return AWSHandlerGenResponse(
+            body="\n".join(self._body) or None,
+            build="\n".join(self._build) or None,
+            importing={module: set(symbols) for module, symbols in self._importing.items()},
+            preamble="\n".join(self._preamble) or None
+        )
+
+    def render(self) -> str:
+        """
+        Renders the complete handler module.
+
+        Returns
+        -------
+        str
+            The full source code of the handler.
+        """
+        return self.to_response().generate_handler_code()
+
+    @staticmethod
+    def validate(code: str, filename: str = "lambda_function.py") -> str:
+        """
+        Checks that the handler code compiles.
+
+        Parameters
+        ----------
+        code : str
+            Handler source code.
+        filename : str, optional
+            File name reported in the error (default is "lambda_function.py").
+
+        Returns
+        -------
+        str
+            The same code, to chain the call.
+
+        Raises
+        ------
+        ValueError
+            If the code is not valid Python.
+        """
+        try:
+            compile(code, filename, "exec")
+        except SyntaxError as error:
+            raise ValueError(f"Generated handler {filename} is not valid Python: "
+                             f"{error.msg} (line {error.lineno})\n{error.text or ''}") from error
+        return code
@@ -39,11 +39,14 @@ class AWSHandlerGenResponse:
 
     extra : Dict[str, Any]
         Optional extra data provided by the generator.
+    preamble : Optional[str]
+        Optional code placed at the very top of the module, before the imports.
     """
     body: Optional[str] = None
     build: Optional[str] = None
     importing: Dict[str, Set[str]] = field(default_factory=dict)
     extra: Dict[str, Any] = field(default_factory=dict)
+    preamble: Optional[str] = None
 
     def add_imports(self, new_imports: Dict[str, Set[str]]) -> None:
         """
@@ -83,8 +86,8 @@ class AWSHandlerGenResponse:
         """
         Builds the final AWS Lambda handler code as a complete Python string.
 
-        This includes import statements, any pre-construction logic, and
-        the `lambda_handler` function definition.
+        This includes the preamble, import statements, any pre-construction logic,
+        and the `lambda_handler` function definition.
 
         Returns
         -------
@@ -92,6 +95,8 @@ class AWSHandlerGenResponse:
             The full source code of the handler as a string.
         """
         imports_chunk = self._generate_imports_string(self.importing)
+        if self.preamble:
+            imports_chunk = f"{self.preamble}\n{imports_chunk}"
         sep = "\n" * 3
         return (f"{imports_chunk}{sep}{self.build or ''}{sep}"
                 f"def lambda_handler(event, context):\n{self.body or ''}\n")
@@ -120,6 +125,7 @@ class AWSHandlerGenResponse:
 
         merged_body = "\n".join(filter(None, [self.body, other.body])) or None
         merged_build = "\n".join(filter(None, [self.build, other.build])) or None
+        merged_preamble = "\n".join(filter(None, [self.preamble, other.preamble])) or None
 
         merged_importing: Dict[str, Set[str]] = {}
         for module in set(self.importing) | set(other.importing):
@@ -131,7 +137,8 @@ class AWSHandlerGenResponse:
             body=merged_body,
             build=merged_build,
             importing=merged_importing,
-            extra={}
+            extra={},
+            preamble=merged_preamble
         )
 
     def __iadd__(self, other: "AWSHandlerGenResponse") -> "AWSHandlerGenResponse":
@@ -162,6 +169,7 @@ class AWSHandlerGenResponse:
 
         self.body = "\n".join(filter(None, [self.body, other.body])) or None
         self.build = "\n".join(filter(None, [self.build, other.build])) or None
+        self.preamble = "\n".join(filter(None, [self.preamble, other.preamble])) or None
 
         for module, symbols in other.importing.items():
             if module not in self.importing:
@@ -0,0 +1,234 @@
+"""
+Generator adding per-invocation timing instrumentation to AWS Lambda handlers.
+
+This module defines a generator that wraps the body of an already assembled handler
+with `time.perf_counter_ns` spans and emits them as one structured log line per
+invocation, either as plain JSON or as CloudWatch Embedded Metric Format (EMF).
+"""
+import re
+from typing import Tuple
+
+from ..aws_handler_gen_response import AWSHandlerGenResponse
+from ..aws_handler_generator import AWSHandlerGenerator
+
+_TIMING_HELPERS = '''\
+_SPANS = [0, 0]
+
+
+class _TimedMapper:
+    __slots__ = ("_mapper",)
+
+    def __init__(self, mapper):
+        self._mapper = mapper
+
+    def map(self, data):
+        start = perf_counter_ns()
+        try:
+            return self._mapper.map(data)
+        finally:
+            _SPANS[0] += perf_counter_ns() - start
+
+
+class _TimedUseCase:
+    __slots__ = ("_use_case",)
+
+    def __init__(self, use_case):
+        self._use_case = use_case
+
+    def __call__(self, *args, **kwargs):
+        start = perf_counter_ns()
+        try:
+            return self._use_case(*args, **kwargs)
+        finally:
+            _SPANS[1] += perf_counter_ns() - start'''
+
+_EMIT_JSON = '''\
+def _emit_metrics(duration_ns):
+    record = {{
+        "metric": "bisslog.invocation",
+        "use_case": {use_case!r},
+        "duration_ms": duration_ns / 1e6,
+        "routing_ms": (duration_ns - _SPANS[0] - _SPANS[1]) / 1e6,
+        "mapping_ms": _SPANS[0] / 1e6,
+        "use_case_ms": _SPANS[1] / 1e6,
+    }}{cold_start}
+    print(dumps(record))'''
+
+_JSON_COLD_START = '''
+    global _COLD_START
+    record["cold_start"] = _COLD_START
+    if _COLD_START:
+        _COLD_START = False
+        record["init_ms"] = _INIT_DURATION_NS / 1e6'''
+
+_EMIT_EMF = '''\
+_EMF_METRICS = {metrics}
+
+
+def _emit_metrics(duration_ns):
+    record = {{
+        "_aws": {{"Timestamp": int(time() * 1000), "CloudWatchMetrics": _EMF_METRICS}},
+        "UseCase": {use_case!r},
+        "Duration": duration_ns / 1e6,
+        "RoutingDuration": (duration_ns - _SPANS[0] - _SPANS[1]) / 1e6,
+        "MappingDuration": _SPANS[0] / 1e6,
+        "UseCaseDuration": _SPANS[1] / 1e6,
+    }}{cold_start}
+    print(dumps(record))'''
+
+_EMF_COLD_START = '''
+    global _COLD_START
+    record["ColdStart"] = int(_COLD_START)
+    if _COLD_START:
+        _COLD_START = False
+        record["_aws"]["CloudWatchMetrics"] = _EMF_COLD_START_METRICS
+        record["InitDuration"] = _INIT_DURATION_NS / 1e6'''
+
+_INIT_PREAMBLE = '''\
+from time import perf_counter_ns
+_INIT_START_NS = perf_counter_ns()'''
+
+
+class InstrumentationGenerator(AWSHandlerGenerator):
+    """
+    Wraps a generated handler with timing spans for routing, mapping and use case.
+
+    Mappers and the use case are replaced at module level by thin proxies that
+    accumulate the time spent in them, so every trigger generator is instrumented
+    without changes. Routing time is what remains of the invocation. Handlers
+    generated without instrumentation are left untouched and pay no overhead.
+
+    With cold start tracking, the module also measures its own initialization, from
+    before the first import to the end of the build section, and the first invocation
+    served by the container is flagged as a cold start and reports that duration.
+
+    Parameters
+    ----------
+    namespace : str, optional
+        CloudWatch namespace of the EMF metrics (default is "Bisslog").
+    """
+
+    log_formats = ("json", "emf")
+    _mapper_regex = re.compile(r"^(\w+) = Mapper\(", re.MULTILINE)
+
+    def __init__(self, namespace: str = "Bisslog"):
+        self.namespace = namespace
+
+    def _emf_metrics(self, *extra_metrics: Tuple[str, str]) -> str:
+        """
+        Builds the `CloudWatchMetrics` directive of the EMF log lines.
+
+        Parameters
+        ----------
+        extra_metrics : Tuple[str, str]
+            Name and unit of the metrics reported besides the invocation durations.
+
+        Returns
+        -------
+        str
+            Python literal of the directive.
+        """
+        metrics = [(name, "Milliseconds") for name in (
+            "Duration", "RoutingDuration", "MappingDuration", "UseCaseDuration")]
+        return repr([{
+            "Namespace": self.namespace,
+            "Dimensions": [["UseCase"]],
+            "Metrics": [{"Name": name, "Unit": unit}
+                        for name, unit in metrics + list(extra_metrics)],
+        }])
+
+    def _emit_function(self, use_case_keyname: str, log_format: str, cold_start: bool) -> str:
+        """
+        Generates the function printing the metrics of each invocation.
+
+        Parameters
+        ----------
+        use_case_keyname : str
+            Keyname of the use case, reported with every metric.
+        log_format : str
+            "json" or "emf".
+        cold_start : bool
+            Whether to report cold starts and the module init duration.
+
+        Returns
+        -------
+        str
+            Source of `_emit_metrics` and the constants it uses.
+        """
+        if log_format == "json":
+            return _EMIT_JSON.format(use_case=use_case_keyname,
+                                     cold_start=_JSON_COLD_START if cold_start else "")
+        code = _EMIT_EMF.format(
+            metrics=self._emf_metrics(*([("ColdStart", "Count")] if cold_start else [])),
+            use_case=use_case_keyname, cold_start=_EMF_COLD_START if cold_start else "")
+        if cold_start:
+            cold_metrics = self._emf_metrics(("ColdStart", "Count"),
+                                             ("InitDuration", "Milliseconds"))
+            code = f"_EMF_COLD_START_METRICS = {cold_metrics}\n{code}"
+        return code
+
+    def __call__(self, response: AWSHandlerGenResponse, var_name: str, use_case_keyname: str,
+                 log_format: str = "json", cold_start: bool = False) -> AWSHandlerGenResponse:
+        """
+        Instruments an assembled handler response.
+
+        Parameters
+        ----------
+        response : AWSHandlerGenResponse
+            Complete handler response, including the default error handler.
+        var_name : str
+            Name of the variable holding the use case.
+        use_case_keyname : str
+            Keyname of the use case, reported with every metric.
+        log_format : str, optional
+            "json" for a plain structured log line or "emf" for CloudWatch Embedded
+            Metric Format (default is "json").
+        cold_start : bool, optional
+            Whether to measure the module init duration and flag cold starts
+            (default is False).
+
+        Returns
+        -------
+        AWSHandlerGenResponse
+            A new response whose body is wrapped with timing spans.
+
+        Raises
+        ------
+        ValueError
+            If the log format is not supported.
+        """
+        if log_format not in self.log_formats:
+            raise ValueError(f"Unknown instrumentation format '{log_format}', expected one of "
+                             f"{list(self.log_formats)}")
+        mapper_names = self._mapper_regex.findall(response.build or "")
+        build_lines = [_TIMING_HELPERS, "\n"]
+        build_lines.extend(f"{name} = _TimedMapper({name})" for name in mapper_names)
+        build_lines.append(f"{var_name} = _TimedUseCase({var_name})")
+        build_lines.append("\n")
+        build_lines.append(self._emit_function(use_case_keyname, log_format, cold_start))
+        if cold_start:
+            build_lines.append("\n")
+            build_lines.append("_COLD_START = True")
+            build_lines.append("_INIT_DURATION_NS = perf_counter_ns() - _INIT_START_NS")
+
+        body = "\n".join(self.indent + line if line else line
+                         for line in (response.body or self.indent + "pass").split("\n"))
+        head = self.join_with_depth([("_SPANS[0] = _SPANS[1] = 0", 1),
+                                     ("_start = perf_counter_ns()", 1),
+                                     ("try:", 1)])
+        tail = self.join_with_depth([("finally:", 1),
+                                     ("_emit_metrics(perf_counter_ns() - _start)", 2)])
+
+        instrumented = AWSHandlerGenResponse(
+            body="\n".join([head, body, tail]),
+            build="\n".join(filter(None, [response.build, "\n".join(build_lines)])),
+            importing={module: set(symbols) for module, symbols in response.importing.items()},
+            preamble="\n".join(filter(None, [_INIT_PREAMBLE if cold_start else None,
+                                              response.preamble]))
+        )
+        instrumented.add_imports({"json": {"dumps"}})
+        if not cold_start:
+            instrumented.add_imports({"time": {"perf_counter_ns"}})
+        if log_format == "emf":
+            instrumented.add_imports({"time": {"time"}})
+        return instrumented
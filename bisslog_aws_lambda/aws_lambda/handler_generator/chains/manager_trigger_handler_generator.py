@@ -8,6 +8,7 @@ from typing import List, Iterable, Optional
 
 from bisslog_schema.schema import TriggerInfo
 
+from .mapper_interner import MapperInterner
 from .trigger_generator.aws_handler_trigger_generator import AWSHandlerTriggerGenerator
 from .trigger_generator.consumer_aws_event_bridge_handler_generator import \
     ConsumerAWSEventBridgeHandlerGenerator
@@ -16,6 +17,7 @@ from .trigger_generator.consumer_aws_sqs_handler_generator import ConsumerAWSSQS
 from .trigger_generator.http_aws_handler_generator import HttpAWSHandlerGenerator
 from .trigger_generator.schedule_aws_handler_generator import ScheduleAWSHandlerGenerator
 from .trigger_generator.websocket_aws_handler_generator import WebSocketAWSHandlerGenerator
+from ..aws_handler_code_builder import AWSHandlerCodeBuilder
 from ..aws_handler_gen_response import AWSHandlerGenResponse
 from ..aws_handler_generator import AWSHandlerGenerator
 
@@ -36,6 +38,8 @@ class ManagerTriggerHandlerGenerator(AWSHandlerGenerator):
     ----------
     trigger_generator : Optional[Iterable[AWSHandlerTriggerGenerator]]
         Custom list of generators to use instead of the default ones.
+    mapper_interner : Optional[MapperInterner]
+        Deduplicates the identical mappers declared by different triggers.
     """
     triggers_sorted_generators = (  # DO NOT CHANGE ORDER
         HttpAWSHandlerGenerator(),
@@ -46,15 +50,18 @@ class ManagerTriggerHandlerGenerator(AWSHandlerGenerator):
         WebSocketAWSHandlerGenerator()
     )
 
-    def __init__(self, trigger_generator: Optional[Iterable[AWSHandlerTriggerGenerator]] = None):
+    def __init__(self, trigger_generator: Optional[Iterable[AWSHandlerTriggerGenerator]] = None,
+                 mapper_interner: Optional[MapperInterner] = None):
         self._trigger_generators = trigger_generator or self.triggers_sorted_generators
+        self._mapper_interner = mapper_interner or MapperInterner()
 
     def __call__(self, triggers: List[TriggerInfo], var_name: str) -> AWSHandlerGenResponse:
         """
         Processes a list of trigger metadata using available generators.
 
         Each registered generator is invoked with the full list of triggers and
-        the variable name to bind the use case. Their responses are merged.
+        the variable name to bind the use case. Their responses are merged, and
+        mappers with identical definitions are shared.
 
         Parameters
         ----------
@@ -68,10 +75,10 @@ class ManagerTriggerHandlerGenerator(AWSHandlerGenerator):
         AWSHandlerGenResponse
             A merged response from all matching generators.
         """
-        res = AWSHandlerGenResponse()
+        builder = AWSHandlerCodeBuilder()
 
         for trigger_generator in self._trigger_generators:
             res_trigger: AWSHandlerGenResponse = trigger_generator(triggers, var_name)
-            res += res_trigger
+            builder.add(res_trigger)
 
-        return res
+        return self._mapper_interner(builder.to_response())
@@ -0,0 +1,143 @@
+"""
+Generator deduplicating identical `Mapper` definitions of a generated handler.
+
+This module defines a generator that canonicalises the `Mapper(...)` constructor lines
+emitted by the trigger generators and keeps a single instance per distinct mapping,
+rewriting the handler body to use it.
+"""
+import ast
+import re
+from json import dumps
+from typing import Dict, List, Optional, Tuple
+
+from ..aws_handler_gen_response import AWSHandlerGenResponse
+from ..aws_handler_generator import AWSHandlerGenerator
+
+
+class MapperInterner(AWSHandlerGenerator):
+    """
+    Shares one `Mapper` instance among every trigger that declares the same mapping.
+
+    Each trigger generator builds its own mappers, so a consumer trigger with a mapper
+    gets one copy per event source and a schedule shares the EventBridge standard
+    mapping. Mappings are compared by their canonical form, serialized with sorted
+    source paths, and only the first definition of each is kept. Other build statements
+    are left untouched.
+    """
+
+    @staticmethod
+    def canonical_mapping(node: ast.stmt) -> Optional[Tuple[str, str]]:
+        """
+        Extracts the variable name and canonical mapping of a `Mapper` definition.
+
+        Parameters
+        ----------
+        node : ast.stmt
+            Top-level statement of the build section.
+
+        Returns
+        -------
+        Optional[Tuple[str, str]]
+            The variable name and the mapping serialized with sorted keys, or None if the
+            statement is not a `name = Mapper("name", {...})` definition with a literal mapping.
+        """
+        if not (isinstance(node, ast.Assign) and len(node.targets) == 1
+                and isinstance(node.targets[0], ast.Name)
+                and isinstance(node.value, ast.Call)
+                and isinstance(node.value.func, ast.Name) and node.value.func.id == "Mapper"
+                and len(node.value.args) == 2 and not node.value.keywords):
+            return None
+        try:
+            mapping = ast.literal_eval(node.value.args[1])
+        except ValueError:
+            return None
+        if not isinstance(mapping, dict):
+            return None
+        return node.targets[0].id, dumps(mapping, sort_keys=True)
+
+    def intern_build(self, build: str) -> Tuple[str, Dict[str, str]]:
+        """
+        Removes the duplicated mapper definitions of a build section.
+
+        Parameters
+        ----------
+        build : str
+            Build section of a response.
+
+        Returns
+        -------
+        Tuple[str, Dict[str, str]]
+            The build section without duplicated definitions and the name of the kept
+            mapper for each removed one. The build is returned unchanged, with no
+            renames, if it cannot be parsed.
+        """
+        try:
+            nodes = ast.parse(build).body
+        except SyntaxError:
+            return build, {}
+        lines = build.split("\n")
+        starts = [node.lineno - 1 for node in nodes]
+
+        interned: Dict[str, str] = {}
+        renames: Dict[str, str] = {}
+        kept: List[str] = ["\n".join(lines[:starts[0]])] if starts and starts[0] else []
+        for node, start, end in zip(nodes, starts, starts[1:] + [len(lines)]):
+            definition = self.canonical_mapping(node)
+            if definition is not None:
+                name, mapping = definition
+                if mapping in interned:
+                    renames[name] = interned[mapping]
+                    continue
+                interned[mapping] = name
+            kept.append("\n".join(lines[start:end]))
+        return "\n".join(kept), renames
+
+    @staticmethod
+    def rename_usages(body: Optional[str], renames: Dict[str, str]) -> Optional[str]:
+        """
+        Makes the handler body use the kept mappers instead of the removed ones.
+
+        Parameters
+        ----------
+        body : str, optional
+            Body of a response.
+        renames : Dict[str, str]
+            Name of the kept mapper for each removed one.
+
+        Returns
+        -------
+        Optional[str]
+            The body with every `removed.` attribute access renamed.
+        """
+        if not body:
+            return body
+        usage_regex = re.compile(r"\b(" + "|".join(map(re.escape, renames)) + r")\b(?=\.)")
+        return usage_regex.sub(lambda match: renames[match.group(1)], body)
+
+    def __call__(self, response: AWSHandlerGenResponse) -> AWSHandlerGenResponse:
+        """
+        Removes duplicated mappers from a response and renames their usages.
+
+        Parameters
+        ----------
+        response : AWSHandlerGenResponse
+            Response whose build section holds the mapper definitions.
+
+        Returns
+        -------
+        AWSHandlerGenResponse
+            The same response if nothing is shared, otherwise a new one with the
+            duplicated definitions removed and the body using the kept instances.
+        """
+        if not response.build:
+            return response
+        build, renames = self.intern_build(response.build)
+        if not renames:
+            return response
+        return AWSHandlerGenResponse(
+            body=self.rename_usages(response.body, renames),
+            build=build,
+            importing=response.importing,
+            extra=response.extra,
+            preamble=response.preamble
+        )
@@ -57,22 +57,20 @@ class ConsumerAWSEventBridgeHandlerGenerator(AWSHandlerTriggerGenerator):
         pre_build_lines = [
             self.generate_mapper("mapper_consumer_event_bridge", {"detail": "event"})]
         lines.append(("response = []", depth))
+        lines.append(("mapped_standard_event = mapper_consumer_event_bridge.map(event)", depth))
+        if not is_single:
+            lines.append(('source = event.get("source", "")', depth))
 
         depth_before = depth
         for i, trigger in enumerate(triggers_ok):
             depth = depth_before
             keyname = trigger.keyname
             options = trigger.options
-            lines.append(("mapped_standard_event = mapper_consumer_event_bridge.map(event)", depth))
-
             mapper_name = self.generate_mapper_name(trigger.type.val + "_event_bridge", keyname, i)
-            conditional = f'if "{options.queue}" in event.get("source", ""):'
 
             if not is_single:
-                lines.append((conditional, depth))
+                lines.append((f'if "{options.queue}" in source:', depth))
                 depth += 1
-            else:
-                lines.append((self.comm(conditional), depth))
 
             if options.mapper:
                 pre_build_lines.append(self.generate_mapper(mapper_name, options.mapper))
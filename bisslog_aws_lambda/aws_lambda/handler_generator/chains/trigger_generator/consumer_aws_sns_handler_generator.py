@@ -62,25 +62,21 @@ class ConsumerAWSSNSHandlerGenerator(AWSHandlerTriggerGenerator):
         lines.append(("response = []", depth))
         lines.append(('for record in event["Records"]:', depth))
         depth += 1
+        lines.append(
+            ("mapped_standard_event_sns = mapper_consumer_sns.map(record['Sns'])", depth))
+        if not is_single:
+            lines.append((self._line_queue_arn, depth))
 
         depth_before = depth
         for i, trigger in enumerate(triggers_ok):
             depth = depth_before
             keyname = trigger.keyname
             options = trigger.options
-            lines.append(
-                ("mapped_standard_event_sns = mapper_consumer_sns.map(record['Sns'])", depth))
-
             mapper_name = self.generate_mapper_name(trigger.type.val + "_sns", keyname, i)
-            conditional = f'if "{options.queue}" in queue_arn:'
 
             if not is_single:
-                lines.append((self._line_queue_arn, depth))
-                lines.append((conditional, depth))
+                lines.append((f'if "{options.queue}" in queue_arn:', depth))
                 depth += 1
-            else:
-                lines.append((self.comm(self._line_queue_arn), depth))
-                lines.append((self.comm(conditional), depth))
 
             if options.mapper:
                 pre_build_lines.append(self.generate_mapper(mapper_name, options.mapper))
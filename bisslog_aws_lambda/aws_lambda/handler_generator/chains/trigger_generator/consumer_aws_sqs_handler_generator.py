@@ -68,22 +68,19 @@ class ConsumerAWSSQSHandlerGenerator(AWSHandlerTriggerGenerator):
         lines.append(("response = []", depth))
         lines.append(('for record in event["Records"]:', depth))
         depth += 1
+        lines.append(("mapped_standard_event_sqs = mapper_consumer_sqs.map(record)", depth))
+        if not is_single:
+            lines.append((self._line_queue_arn, depth))
 
         depth_before = depth
         for i, trigger in enumerate(triggers_ok):
             depth = depth_before
             keyname = trigger.keyname
             options = trigger.options
-            lines.append(("mapped_standard_event_sqs = mapper_consumer_sqs.map(record)", depth))
 
-            conditional = f'if "{options.queue}" in queue_arn:'
             if not is_single:
-                lines.append((self._line_queue_arn, depth))
-                lines.append((conditional, depth))
+                lines.append((f'if "{options.queue}" in queue_arn:', depth))
                 depth += 1
-            else:
-                lines.append((self.comm(self._line_queue_arn), depth))
-                lines.append((self.comm(conditional), depth))
 
             if options.mapper:
                 mapper_name = self.generate_mapper_name(trigger.type.val + "_sqs", keyname, i)
@@ -32,6 +32,10 @@ class HttpAWSHandlerGenerator(AWSHandlerTriggerGenerator):
         """
         Generates an `if` condition that matches both path and HTTP method.
 
+        The condition reads the `resource` and `http_method` locals, which are extracted
+        once per invocation instead of once per trigger. The method is compared first
+        since the equality check is cheaper than the suffix check.
+
         Parameters
         ----------
         path : str
@@ -46,8 +50,8 @@ class HttpAWSHandlerGenerator(AWSHandlerTriggerGenerator):
         """
         path_standard = path.replace("<", "{").replace(">", "}")
 
-        return (f'if event.get("resource", "").endswith("{path_standard}")'
-                f' and event.get("httpMethod") == "{method.upper()}":')
+        return (f'if http_method == "{method.upper()}"'
+                f' and resource.endswith("{path_standard}"):')
 
     @classmethod
     def _generate_http_mapper(cls, required_source: Set[str], depth: int = 0,
@@ -124,6 +128,9 @@ class HttpAWSHandlerGenerator(AWSHandlerTriggerGenerator):
         lines.append(
             ('mapped_standard_request = mapper_http.map({"event": event, "context": context})',
              depth))
+        if not is_one_trigger:
+            lines.append(('resource = event.get("resource", "")', depth))
+            lines.append(('http_method = event["httpMethod"]', depth))
         mapper_in_each = not all(trigger.options.mapper for trigger in triggers)
 
         before_depth = depth
@@ -132,13 +139,10 @@ class HttpAWSHandlerGenerator(AWSHandlerTriggerGenerator):
             keyname = trigger.keyname
             options = trigger.options
 
-            conditional = self._generate_conditional_by_path_method(options.path, options.method)
-
-            if is_one_trigger:
-                conditional = "# " + conditional
-                lines.append((conditional, depth))
-            else:
-                lines.append((conditional, depth))
+            if not is_one_trigger:
+                lines.append(
+                    (self._generate_conditional_by_path_method(options.path, options.method),
+                     depth))
                 depth += 1
 
             if options.mapper:
@@ -152,13 +156,13 @@ class HttpAWSHandlerGenerator(AWSHandlerTriggerGenerator):
             else:
                 lines.append(('request_to_uc = mapped_standard_request', depth))
                 lines.append(
-                    ('request_to_uc.update(mapped_standard_request.get("params"))', depth))
+                    ('request_to_uc.update(mapped_standard_request["params"] or ())', depth))
                 lines.append(
-                    ('request_to_uc.update(mapped_standard_request.get("path_query"))', depth))
+                    ('request_to_uc.update(mapped_standard_request["path_query"] or ())', depth))
             lines.append((f"uc_response = {uc_var_name}(**request_to_uc)", depth))
             lines.append(("""return {"statusCode": 200, "body": uc_response}""", depth))
 
         pre_build_lines.append(
-            self._generate_http_mapper(required_mapper_source, full=not mapper_in_each))
+            self._generate_http_mapper(required_mapper_source, full=mapper_in_each))
 
         return AWSHandlerGenResponse(self.join_with_depth(lines), "\n".join(pre_build_lines), {})
@@ -72,11 +72,11 @@ class ScheduleAWSHandlerGenerator(AWSHandlerTriggerGenerator):
         pre_build_lines = [
             self.generate_mapper("mapper_schedule_event_bridge", {"detail": "event"})]
         lines.append(("response = []", depth))
+        lines.append(("request_to_uc = mapper_schedule_event_bridge.map(event)", depth))
 
         depth_before = depth
         for _ in schedule_triggers:
             depth = depth_before
-            lines.append(("request_to_uc = mapper_schedule_event_bridge.map(event)", depth))
             lines.append((f"uc_response = {uc_var_name}(**request_to_uc)", depth))
             lines.append(("response.append(uc_response)", depth))
 
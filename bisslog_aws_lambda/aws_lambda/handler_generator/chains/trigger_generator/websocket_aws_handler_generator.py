@@ -30,6 +30,8 @@ class WebSocketAWSHandlerGenerator(AWSHandlerTriggerGenerator):
         """
         Constructs a conditional to match a specific WebSocket route key.
 
+        The condition reads the `route_key` local, extracted once per invocation.
+
         Parameters
         ----------
         route_key : str
@@ -41,7 +43,7 @@ class WebSocketAWSHandlerGenerator(AWSHandlerTriggerGenerator):
             Python code string for conditional matching.
         """
 
-        return f'if "{route_key}" in event["requestContext"]["routeKey"]:'
+        return f'if "{route_key}" in route_key:'
 
     @classmethod
     def _generate_ws_mapper(cls, required_source: Set[str], depth: int = 0,
@@ -117,6 +119,8 @@ class WebSocketAWSHandlerGenerator(AWSHandlerTriggerGenerator):
             depth
         ))
 
+        if not is_one_trigger:
+            lines.append(('route_key = event["requestContext"]["routeKey"]', depth))
         mapper_in_each = not all(trigger.options.mapper for trigger in triggers)
         before_depth = depth
 
@@ -125,12 +129,8 @@ class WebSocketAWSHandlerGenerator(AWSHandlerTriggerGenerator):
             keyname = trigger.keyname
             options = trigger.options
 
-            conditional = self._generate_conditional_by_route(options.route_key)
-            if is_one_trigger:
-                conditional = "# " + conditional
-                lines.append((conditional, depth))
-            else:
-                lines.append((conditional, depth))
+            if not is_one_trigger:
+                lines.append((self._generate_conditional_by_route(options.route_key), depth))
                 depth += 1
 
             if options.mapper:
@@ -149,7 +149,7 @@ class WebSocketAWSHandlerGenerator(AWSHandlerTriggerGenerator):
             lines.append(('return {"statusCode": 200, "body": uc_response}', depth))
 
         pre_build_lines.append(
-            self._generate_ws_mapper(required_mapper_source, full=not mapper_in_each)
+            self._generate_ws_mapper(required_mapper_source, full=mapper_in_each)
         )
 
         return AWSHandlerGenResponse(self.join_with_depth(lines), "\n".join(pre_build_lines), {})
@@ -4,14 +4,16 @@ Module for orchestrating the generation of complete AWS Lambda handler code.
 This module defines a class that coordinates multiple generator components to
 produce a fully functional Lambda handler for a given use case based on its triggers.
 """
-from typing import Callable
+from typing import Callable, Optional
 
 from bisslog_schema.schema import ServiceInfo
 from bisslog_schema.use_case_code_inspector.use_case_code_metadata import UseCaseCodeInfo
 
+from .aws_handler_code_builder import AWSHandlerCodeBuilder
 from .aws_handler_gen_response import AWSHandlerGenResponse
 from .chains.build_use_case_object import BuildUseCaseObject
 from .chains.default_error_handler_generator import DefaultHandlerGenerator
+from .chains.instrumentation_generator import InstrumentationGenerator
 from .chains.manager_trigger_handler_generator import ManagerTriggerHandlerGenerator
 
 
@@ -23,6 +25,8 @@ class HandlerGenerator:
     - Builds the use case object.
     - Generates trigger-specific dispatch logic.
     - Appends a fallback error handler.
+    - Optionally wraps the handler with timing instrumentation.
+    - Checks that the rendered module compiles, so malformed code is never written.
 
     Parameters
     ----------
@@ -32,16 +36,22 @@ class HandlerGenerator:
         Generator that constructs the use case object.
     default_handler_gen : Callable[..., AWSHandlerGenResponse]
         Generator that provides a fallback error handler.
+    instrumentation_gen : Callable[..., AWSHandlerGenResponse], optional
+        Generator that wraps the handler with timing spans when instrumentation is
+        requested (default: `InstrumentationGenerator()`).
     """
 
     def __init__(self, manager_trigger_gen: Callable[..., AWSHandlerGenResponse],
                  build_use_case_obj_gen: Callable[..., AWSHandlerGenResponse],
-                 default_handler_gen: Callable[..., AWSHandlerGenResponse]):
+                 default_handler_gen: Callable[..., AWSHandlerGenResponse],
+                 instrumentation_gen: Optional[Callable[..., AWSHandlerGenResponse]] = None):
         self._manager_trigger_gen = manager_trigger_gen
         self._build_use_case_obj_gen = build_use_case_obj_gen
         self._default_handler_gen = default_handler_gen
+        self._instrumentation_gen = instrumentation_gen or InstrumentationGenerator()
 
-    def __call__(self, service_info: ServiceInfo, use_case_code_info: UseCaseCodeInfo) -> str:
+    def __call__(self, service_info: ServiceInfo, use_case_code_info: UseCaseCodeInfo,
+                 instrument: Optional[str] = None, cold_start: bool = False) -> str:
         """
         Generates full handler code for a given use case based on its trigger metadata.
 
@@ -51,6 +61,13 @@ class HandlerGenerator:
             Metadata of the service including all use cases and their triggers.
         use_case_code_info : UseCaseCodeInfo
             Static code metadata for the specific use case.
+        instrument : str, optional
+            Log format of the per-invocation timing metrics ("json" or "emf").
+            Handlers are not instrumented by default.
+        cold_start : bool, optional
+            Whether the handler also measures its module init duration and flags the
+            first invocation of each container as a cold start. Implies "json"
+            instrumentation when `instrument` is not given (default is False).
 
         Returns
         -------
@@ -62,7 +79,8 @@ class HandlerGenerator:
         RuntimeError
             If required metadata is missing.
         ValueError
-            If the `BuildUseCaseObject` generator fails to produce a `var_name`.
+            If the `BuildUseCaseObject` generator fails to produce a `var_name`, or if
+            the generated code is not valid Python.
         """
         if service_info is None or use_case_code_info is None:
             raise RuntimeError("service_info and use_case_code_info cannot be None")
@@ -71,10 +89,11 @@ class HandlerGenerator:
 
         triggers = use_case_metadata.triggers
 
-        res = AWSHandlerGenResponse(importing={"bisslog.utils.mapping": {"Mapper"}})
+        builder = AWSHandlerCodeBuilder()
+        builder.add(AWSHandlerGenResponse(importing={"bisslog.utils.mapping": {"Mapper"}}))
 
         res_build_use_obj = self._build_use_case_obj_gen(use_case_code_info)
-        res += res_build_use_obj
+        builder.add(res_build_use_obj)
         if not isinstance(res_build_use_obj.extra, dict) \
                 or "var_name" not in res_build_use_obj.extra:
             raise ValueError(
@@ -83,10 +102,16 @@ class HandlerGenerator:
         # Variable name
         var_name = res_build_use_obj.extra["var_name"]
 
-        res += self._manager_trigger_gen(triggers, var_name)
-        res += self._default_handler_gen()
+        builder.add(self._manager_trigger_gen(triggers, var_name))
+        builder.add(self._default_handler_gen())
+        res = builder.to_response()
 
-        return res.generate_handler_code()
+        if instrument or cold_start:
+            res = self._instrumentation_gen(res, var_name, use_case_keyname,
+                                            instrument or "json", cold_start)
+
+        return AWSHandlerCodeBuilder.validate(res.generate_handler_code(),
+                                              f"{use_case_keyname}.py")
 
 
 generate_handler = HandlerGenerator(
@@ -4,13 +4,23 @@ Module for packaging AWS Lambda deployment artifacts.
 This module defines a class responsible for generating `.zip` packages
 for AWS Lambda functions by bundling Python source files and a specified
 handler file, renaming it to `lambda_function.py` for deployment compatibility.
+Sources can optionally be shipped as precompiled bytecode to avoid compiling
+them during the Lambda init phase, and third-party wheels from a local
+wheelhouse can be vendored into the same archive.
 """
 import os
 import tempfile
+import time
 import zipfile
 from pathlib import Path
-from shutil import move
-from typing import Optional, List, Union, Set
+from typing import Callable, Optional, List, Union, Set, Dict, Tuple
+from uuid import uuid4
+
+from .lambda_bytecode_compiler import LambdaBytecodeCompiler
+from .lambda_source_walker import LambdaSourceWalker
+from .lambda_wheel_vendor import LambdaWheelVendor
+from .lambda_zip_compression import LambdaZipCompression, default_benchmark_strategies
+from .lambda_zip_writer import LambdaZipWriter
 
 
 class LambdaAWSPackager:
@@ -27,7 +37,9 @@ class LambdaAWSPackager:
             handler_name: str = None,
             src_folders: Union[str, List[str]] = "src",
             handlers_folder: str = "framework/lambda_aws",
-            zip_name: Optional[str] = None
+            zip_name: Optional[str] = None,
+            shard: Optional[Callable[[str], bool]] = None,
+            **kwargs
     ) -> List[str]:
         """
         Builds one or more Lambda deployment packages.
@@ -45,6 +57,11 @@ class LambdaAWSPackager:
             Directory where handler files are located (default is "framework/lambda_aws").
         zip_name : str, optional
             Custom name for the output zip file. Ignored in batch mode.
+        shard : Callable[[str], bool], optional
+            Predicate over handler names, such as a `ShardSelector`, selecting the
+            handlers packaged in batch mode. All are packaged by default.
+        kwargs : Any
+            Additional packaging options forwarded to `generate_zip_file`.
 
         Returns
         -------
@@ -64,62 +81,293 @@ class LambdaAWSPackager:
                     continue
                 if handler_py_module_name.startswith("__"):
                     continue
+                if shard is not None and not shard(handler_py_module_name[:-3]):
+                    continue
                 zip_file = self.generate_zip_file(
                     handler_py_module_name[:-3],
                     zip_name=zip_name,
                     src_folders=src_folders,
-                    handlers_folder=handlers_folder)
+                    handlers_folder=handlers_folder,
+                    **kwargs)
                 res.append(zip_file)
             return res
         return [self.generate_zip_file(handler_name=handler_name, src_folders=src_folders,
-                                       handlers_folder=handlers_folder, zip_name=zip_name)]
+                                       handlers_folder=handlers_folder, zip_name=zip_name,
+                                       **kwargs)]
 
     def generate_zip_file(
             self,
             handler_name: str,
             src_folders: Union[str, List[str]] = "src",
             handlers_folder: str = "framework/lambda_aws",
-            zip_name: Optional[str] = None
+            zip_name: Optional[str] = None,
+            *,
+            bytecode_compiler: Optional[LambdaBytecodeCompiler] = None,
+            strip_sources: bool = False,
+            output_dir: Optional[str] = None,
+            wheel_vendor: Optional[LambdaWheelVendor] = None,
+            compression: Optional[LambdaZipCompression] = None,
+            source_walker: Optional[LambdaSourceWalker] = None
     ) -> str:
         """
         Builds a deployment package for AWS Lambda.
 
+        The archive is written straight into `output_dir` under a temporary name and
+        atomically renamed once complete, so a partially written zip is never visible.
+
         Parameters
         ----------
         handler_name : str
             Name of the handler file (without `.py`) located in `handlers_folder`.
         src_folders : Union[str, List[str]], optional
-            One or more folders containing `.py` files (default is "src").
+            One or more folders containing source files (default is "src").
         handlers_folder : str, optional
             Folder containing handler files (default is "framework/lambda_aws").
         zip_name : str, optional
             Output zip filename (defaults to "{handler_name}.zip").
+        bytecode_compiler : LambdaBytecodeCompiler, optional
+            When given, every `.py` file is also included as precompiled bytecode.
+        strip_sources : bool, optional
+            Whether to leave source files out of the zip, shipping only their bytecode.
+            Requires `bytecode_compiler`. The handler source is always kept.
+        output_dir : str, optional
+            Folder where the zip is written (defaults to the current working directory).
+            It is created if it does not exist.
+        wheel_vendor : LambdaWheelVendor, optional
+            When given, the third-party wheels it resolves are vendored at the root
+            of the zip, next to `lambda_function.py`.
+        compression : LambdaZipCompression, optional
+            Compression strategy per entry (default: deflate at zlib's default level).
+        source_walker : LambdaSourceWalker, optional
+            Selects the files of each source folder, applying include/exclude rules
+            (default: every `.py` file). Non-Python files it yields are bundled as
+            assets, without bytecode compilation or stripping.
 
         Returns
         -------
         str
             Absolute path to the generated zip file.
+
+        Raises
+        ------
+        ValueError
+            If `strip_sources` is requested without a `bytecode_compiler`.
         """
         handler_file = self._resolve_handler(handler_name, handlers_folder)
-        src_folders = self._resolve_src_paths(src_folders, handlers_folder)
+        sources = self.scan_sources(src_folders, handlers_folder, source_walker)
+        return self.package_handler_source(
+            handler_file.read_bytes(), zip_name or f"{handler_name}.zip", sources,
+            bytecode_compiler=bytecode_compiler, strip_sources=strip_sources,
+            output_dir=output_dir, wheel_vendor=wheel_vendor, compression=compression)
+
+    def scan_sources(
+            self,
+            src_folders: Union[str, List[str]] = "src",
+            handlers_folder: Optional[str] = "framework/lambda_aws",
+            source_walker: Optional[LambdaSourceWalker] = None
+    ) -> List[Tuple[Path, str]]:
+        """
+        Lists the source files bundled in every zip.
+
+        The result can be passed to `package_handler_source` for many handlers, so the
+        source folders are walked once.
+
+        Parameters
+        ----------
+        src_folders : Union[str, List[str]], optional
+            One or more folders containing source files (default is "src").
+        handlers_folder : str, optional
+            Folder containing handler files, skipped when listed as a source folder
+            (default is "framework/lambda_aws").
+        source_walker : LambdaSourceWalker, optional
+            Selects the files of each source folder (default: every `.py` file).
+
+        Returns
+        -------
+        List[Tuple[Path, str]]
+            Each file with its path inside the zip.
+
+        Raises
+        ------
+        FileNotFoundError
+            If a source folder is missing.
+        """
+        source_walker = source_walker or LambdaSourceWalker()
+        return [entry for src_path in self._resolve_src_paths(src_folders, handlers_folder)
+                for entry in source_walker(src_path)]
+
+    def package_handler_source(
+            self,
+            handler_source: Union[str, bytes],
+            zip_name: str,
+            sources: List[Tuple[Path, str]],
+            *,
+            bytecode_compiler: Optional[LambdaBytecodeCompiler] = None,
+            strip_sources: bool = False,
+            output_dir: Optional[str] = None,
+            wheel_vendor: Optional[LambdaWheelVendor] = None,
+            compression: Optional[LambdaZipCompression] = None
+    ) -> str:
+        """
+        Builds a deployment package from handler code held in memory.
+
+        The handler code is written as `lambda_function.py` without being saved to
+        disk first. The archive is written straight into `output_dir` under a
+        temporary name and atomically renamed once complete, so a partially written
+        zip is never visible.
+
+        Parameters
+        ----------
+        handler_source : Union[str, bytes]
+            Code of the handler.
+        zip_name : str
+            Output zip filename.
+        sources : List[Tuple[Path, str]]
+            Source files and their paths inside the zip, as returned by `scan_sources`.
+            Non-Python files are bundled as assets, without bytecode compilation or
+            stripping.
+        bytecode_compiler : LambdaBytecodeCompiler, optional
+            When given, every `.py` file is also included as precompiled bytecode.
+        strip_sources : bool, optional
+            Whether to leave source files out of the zip, shipping only their bytecode.
+            Requires `bytecode_compiler`. The handler source is always kept.
+        output_dir : str, optional
+            Folder where the zip is written (defaults to the current working directory).
+            It is created if it does not exist.
+        wheel_vendor : LambdaWheelVendor, optional
+            When given, the third-party wheels it resolves are vendored at the root
+            of the zip, next to `lambda_function.py`.
+        compression : LambdaZipCompression, optional
+            Compression strategy per entry (default: deflate at zlib's default level).
+
+        Returns
+        -------
+        str
+            Absolute path to the generated zip file.
 
+        Raises
+        ------
+        ValueError
+            If `strip_sources` is requested without a `bytecode_compiler`.
+        """
+        if isinstance(handler_source, str):
+            handler_source = handler_source.encode("utf-8")
+        output_path = Path(output_dir).resolve() if output_dir else Path.cwd()
+        output_path.mkdir(parents=True, exist_ok=True)
+        final_zip = output_path / zip_name
+        partial_zip = output_path / f".{final_zip.name}.{uuid4().hex}.tmp"
+
+        try:
+            with zipfile.ZipFile(partial_zip, 'w', zipfile.ZIP_DEFLATED) as zipf:
+                self._write_entries(
+                    LambdaZipWriter(zipf, bytecode_compiler, strip_sources, compression),
+                    handler_source, sources, wheel_vendor)
+            os.replace(partial_zip, final_zip)
+        finally:
+            if partial_zip.exists():
+                partial_zip.unlink()
+        return str(final_zip)
+
+    @staticmethod
+    def _write_entries(writer: LambdaZipWriter, handler_source: bytes,
+                       sources: List[Tuple[Path, str]],
+                       wheel_vendor: Optional[LambdaWheelVendor] = None) -> None:
+        """Writes the sources, the vendored wheels and the handler of a package."""
+        for file, rel_path in sources:
+            if file.suffix == ".py":
+                writer.write_python_file(file, rel_path)
+            else:
+                writer.write_file(file, rel_path)
+        if wheel_vendor is not None:
+            writer.write_vendored(wheel_vendor())
+        writer.write_python_source(handler_source, "lambda_function.py", keep_source=True)
+
+    def benchmark_compression(
+            self,
+            handler_name: str,
+            src_folders: Union[str, List[str]] = "src",
+            handlers_folder: str = "framework/lambda_aws",
+            strategies: Optional[Dict[str, LambdaZipCompression]] = None,
+            repeat: int = 3,
+            **kwargs
+    ) -> List[dict]:
+        """
+        Measures zip size, build time and extraction time per compression strategy.
+
+        Each strategy builds the package of `handler_name` in a scratch folder; the
+        best of `repeat` runs is reported for both timings.
+
+        Parameters
+        ----------
+        handler_name : str
+            Name of the handler file (without `.py`) to package.
+        src_folders : Union[str, List[str]], optional
+            Folders containing Python source files to include (default is "src").
+        handlers_folder : str, optional
+            Directory where handler files are located (default is "framework/lambda_aws").
+        strategies : Dict[str, LambdaZipCompression], optional
+            Strategies by label (defaults to store and deflate levels 1, 6 and 9).
+        repeat : int, optional
+            Number of runs per strategy (default is 3).
+        kwargs : Any
+            Additional packaging options forwarded to `generate_zip_file`.
+
+        Returns
+        -------
+        List[dict]
+            One row per strategy with `strategy`, `zip_size`, `uncompressed_size`,
+            `build_ms` and `extract_ms`.
+        """
+        strategies = strategies or default_benchmark_strategies()
+        rows = []
         with tempfile.TemporaryDirectory() as tmpdir:
-            tmpdir_path = Path(tmpdir)
-            lambda_file = tmpdir_path / "lambda_function.py"
-            lambda_file.write_text(handler_file.read_text(encoding="utf-8"), encoding="utf-8")
-
-            zip_output = tmpdir_path / (zip_name or f"{handler_name}.zip")
-            with zipfile.ZipFile(zip_output, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                for src_path in src_folders:
-                    for py_file in src_path.rglob("*.py"):
-                        rel_path = py_file.relative_to(src_path.parent)
-                        zipf.write(py_file, arcname=rel_path)
-                zipf.write(lambda_file, arcname="lambda_function.py")
-
-            # Move zip to the current working directory
-            final_zip = Path.cwd() / zip_output.name
-            move(str(zip_output), str(final_zip))
-            return str(final_zip)
+            for label, compression in strategies.items():
+                rows.append({"strategy": label, **self._benchmark_strategy(
+                    Path(tmpdir) / str(len(rows)), repeat, compression, handler_name,
+                    src_folders, handlers_folder, **kwargs)})
+        return rows
+
+    def _benchmark_strategy(self, scratch_dir: Path, repeat: int,
+                            compression: LambdaZipCompression, *args, **kwargs) -> dict:
+        """
+        Builds and extracts a package `repeat` times with one compression strategy.
+
+        Parameters
+        ----------
+        scratch_dir : Path
+            Folder where the runs write their zips and extract them.
+        repeat : int
+            Number of runs.
+        compression : LambdaZipCompression
+            Compression strategy.
+        args : Any
+            Positional arguments of `generate_zip_file`.
+        kwargs : Any
+            Additional packaging options forwarded to `generate_zip_file`.
+
+        Returns
+        -------
+        dict
+            `zip_size`, `uncompressed_size` and the best `build_ms` and `extract_ms`.
+        """
+        build_times, extract_times = [], []
+        for i in range(max(repeat, 1)):
+            run_dir = scratch_dir / str(i)
+            start = time.perf_counter()
+            zip_path = self.generate_zip_file(*args, output_dir=str(run_dir),
+                                              compression=compression, **kwargs)
+            build_times.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            with zipfile.ZipFile(zip_path) as zipf:
+                zipf.extractall(run_dir / "extracted")
+                uncompressed_size = sum(info.file_size for info in zipf.infolist())
+            extract_times.append(time.perf_counter() - start)
+        return {
+            "zip_size": os.path.getsize(zip_path),
+            "uncompressed_size": uncompressed_size,
+            "build_ms": min(build_times) * 1000,
+            "extract_ms": min(extract_times) * 1000,
+        }
 
     @staticmethod
     def _resolve_handler(handler_name: str, handlers_folder: str) -> Path:
@@ -150,14 +398,15 @@ class LambdaAWSPackager:
         return handler_path
 
     @staticmethod
-    def _resolve_src_paths(src_folders: Union[str, List[str]], handlers_folder: str) -> Set[Path]:
+    def _resolve_src_paths(src_folders: Union[str, List[str]],
+                           handlers_folder: Optional[str]) -> Set[Path]:
         """Resolves and validates source folders to include in the zip.
 
         Parameters
         ----------
         src_folders : Union[str, List[str]]
             One or more directories containing Python source files.
-        handlers_folder : str
+        handlers_folder : str, optional
             Folder containing the handler file (will be excluded if present).
 
         Returns
@@ -173,7 +422,7 @@ class LambdaAWSPackager:
 
         if isinstance(src_folders, str):
             src_folders = [src_folders]
-        handlers_path = Path(handlers_folder).resolve()
+        handlers_path = Path(handlers_folder).resolve() if handlers_folder else None
         paths = set()
         for folder in src_folders:
             path_obj = Path(folder).resolve()
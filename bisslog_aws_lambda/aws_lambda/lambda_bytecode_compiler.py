@@ -0,0 +1,113 @@
+"""
+Module for compiling Python sources into bytecode for AWS Lambda packages.
+
+AWS Lambda extracts deployment packages into a read-only filesystem, so the
+interpreter cannot cache the bytecode it compiles while importing modules during
+the init phase. This module compiles sources ahead of time into hash-based `.pyc`
+files that can be shipped inside the deployment `.zip`.
+"""
+import importlib.util
+import marshal
+import os
+import sys
+from typing import Optional
+
+
+class LambdaBytecodeCompiler:
+    """
+    Compiles Python source code into hash-based `.pyc` payloads.
+
+    Hash-based pycs are used instead of timestamp-based ones because the
+    modification times of files extracted from a zip are not reliable.
+
+    Parameters
+    ----------
+    invalidation_mode : str, optional
+        Either "unchecked-hash" (default), where the interpreter never validates the
+        pyc against its source, or "checked-hash", where the source hash is verified
+        when the source file is present.
+    optimize : int, optional
+        Optimization level passed to `compile` (-1 uses the current interpreter level).
+    target_version : str, optional
+        Python version of the Lambda runtime (e.g. "3.11"). Bytecode is only valid for
+        the interpreter that produced it, so it must match the running interpreter.
+
+    Raises
+    ------
+    ValueError
+        If the invalidation mode or optimization level is unknown, or if the target
+        version does not match the running interpreter.
+    """
+
+    invalidation_modes = {
+        "unchecked-hash": 0b01,
+        "checked-hash": 0b11,
+    }
+
+    def __init__(self, invalidation_mode: str = "unchecked-hash", optimize: int = -1,
+                 target_version: Optional[str] = None):
+        if invalidation_mode not in self.invalidation_modes:
+            raise ValueError(
+                f"Unknown invalidation mode '{invalidation_mode}', "
+                f"expected one of {sorted(self.invalidation_modes)}")
+        if optimize not in (-1, 0, 1, 2):
+            raise ValueError(f"Unknown optimization level {optimize}")
+        if target_version is not None:
+            running_version = f"{sys.version_info.major}.{sys.version_info.minor}"
+            if target_version != running_version:
+                raise ValueError(
+                    f"Cannot compile bytecode for Python {target_version} using Python "
+                    f"{running_version}. Run the packager with the Lambda runtime version.")
+        self.invalidation_mode = invalidation_mode
+        self.optimize = sys.flags.optimize if optimize == -1 else optimize
+
+    def __call__(self, source: bytes, arcname: str) -> bytes:
+        """
+        Compiles a Python source into the content of a `.pyc` file.
+
+        Parameters
+        ----------
+        source : bytes
+            Raw content of the Python source file.
+        arcname : str
+            Path of the source inside the archive, used as the code filename.
+
+        Returns
+        -------
+        bytes
+            The `.pyc` file content (header followed by the marshalled code object).
+
+        Raises
+        ------
+        SyntaxError
+            If the source is not valid Python code.
+        """
+        code = compile(source, arcname, "exec", dont_inherit=True, optimize=self.optimize)
+        data = bytearray(importlib.util.MAGIC_NUMBER)
+        data.extend(self.invalidation_modes[self.invalidation_mode].to_bytes(4, "little"))
+        data.extend(importlib.util.source_hash(source))
+        data.extend(marshal.dumps(code))
+        return bytes(data)
+
+    def pyc_arcname(self, arcname: str, sourceless: bool = False) -> str:
+        """
+        Resolves the path of the compiled file inside the archive.
+
+        Parameters
+        ----------
+        arcname : str
+            Path of the `.py` source inside the archive.
+        sourceless : bool, optional
+            Whether the source will be stripped from the archive. Sourceless modules
+            must live next to where the source would be, instead of in `__pycache__`.
+
+        Returns
+        -------
+        str
+            Archive path for the compiled module.
+        """
+        if sourceless:
+            return arcname + "c"
+        cache_path = importlib.util.cache_from_source(
+            arcname, optimization=self.optimize or "")
+        return cache_path.replace(os.sep, "/")
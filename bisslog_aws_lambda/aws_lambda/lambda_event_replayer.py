@@ -0,0 +1,415 @@
+"""
+Module for load testing generated AWS Lambda handlers with recorded events.
+
+This module defines a replayer that reads a JSON Lines file of captured Lambda events
+and invokes a generated handler with them from several worker threads or processes,
+reporting the throughput, the latency percentiles and error rate overall and per
+event source, and the peak resident memory, so the memory size and the dispatch cost
+can be checked against real traffic before deploying.
+"""
+import importlib.util
+import json
+import multiprocessing
+import os
+import queue
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+from .latency_stats import percentile
+
+Sample = Tuple[str, float, Optional[str]]
+
+
+def event_source(event: Any) -> str:
+    """
+    Names the AWS service that delivered an event, from its shape.
+
+    Parameters
+    ----------
+    event : Any
+        Lambda event.
+
+    Returns
+    -------
+    str
+        "http", "websocket", "sqs", "sns", "s3", "dynamodb", "schedule", "eventbridge"
+        or "unknown".
+    """
+    if not isinstance(event, dict):
+        return "unknown"
+    records = event.get("Records")
+    request_context = event.get("requestContext")
+    if not isinstance(request_context, dict):
+        request_context = {}
+    if isinstance(records, list) and records and isinstance(records[0], dict):
+        source = (records[0].get("eventSource") or records[0].get("EventSource")
+                  or "unknown").replace("aws:", "")
+    elif "httpMethod" in event or "http" in request_context:
+        source = "http"
+    elif "routeKey" in request_context:
+        source = "websocket"
+    elif event.get("detail-type") == "Scheduled Event":
+        source = "schedule"
+    elif event.get("source") or event.get("detail-type"):
+        source = "eventbridge"
+    else:
+        source = "unknown"
+    return source
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Returns the peak resident memory of the current process in MiB, if available."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _replay_worker(index: int, handler_path: str, project_root: Optional[str], *,
+                   events: List[dict], barrier, results) -> None:
+    """
+    Loads the handler in a worker process, waits for the others and replays its events.
+
+    The samples, the wall clock start and end of the replay and the peak memory of the
+    process, or the loading error, are put in the `results` queue.
+    """
+    with open(os.devnull, "w", encoding="utf-8") as devnull, redirect_stdout(devnull):
+        try:
+            lambda_handler = LambdaEventReplayer.load_handler(handler_path, project_root)
+        except Exception as error:  # pylint: disable=broad-except
+            results.put((index, "error", f"{type(error).__name__}: {error}"))
+            barrier.abort()
+            return
+        try:
+            barrier.wait()
+        except threading.BrokenBarrierError:
+            results.put((index, "error", None))
+            return
+        start = time.time()
+        samples = LambdaEventReplayer.replay(lambda_handler, events)
+    results.put((index, "samples", samples, start, time.time(), peak_rss_mb()))
+
+
+class LambdaEventReplayer:
+    """
+    Replays recorded events against a generated Lambda handler.
+
+    Each line of the events file is one event, as received by `lambda_handler`. The
+    handler runs with its real use cases, so the figures include them. Events are
+    split round-robin among the workers:
+
+    - In "thread" mode, the handler is loaded once and invoked concurrently from
+      several threads of this process, and the peak memory is the one of this process.
+    - In "process" mode, every worker is a new interpreter that loads the handler as a
+      Lambda execution environment would, and the peak memory is the largest of the
+      workers. Workers start replaying once all of them have loaded the handler, so
+      loading is not timed.
+
+    Whatever the handler prints while loading or running, such as its metric log lines,
+    is discarded.
+
+    Parameters
+    ----------
+    workers : int, optional
+        Number of concurrent workers (default: 4).
+    mode : str, optional
+        "thread" (default) or "process".
+    repeat : int, optional
+        Times the events of the file are replayed (default: 1).
+    top_errors : int, optional
+        Number of distinct errors listed in the report (default: 5).
+
+    Raises
+    ------
+    ValueError
+        If the mode is unknown or `workers` or `repeat` are lower than 1.
+    """
+
+    modes = ("thread", "process")
+
+    def __init__(self, workers: int = 4, mode: str = "thread", repeat: int = 1,
+                 top_errors: int = 5):
+        if mode not in self.modes:
+            raise ValueError(f"Unknown mode '{mode}', expected one of {list(self.modes)}")
+        if workers < 1 or repeat < 1:
+            raise ValueError("workers and repeat must be at least 1")
+        self.workers = workers
+        self.mode = mode
+        self.repeat = repeat
+        self.top_errors = top_errors
+
+    @staticmethod
+    def read_events(path: str, encoding: str = "utf-8") -> List[dict]:
+        """
+        Reads the events of a JSON Lines file, ignoring blank lines.
+
+        Parameters
+        ----------
+        path : str
+            Path of the events file.
+        encoding : str, optional
+            File encoding (default: "utf-8").
+
+        Returns
+        -------
+        List[dict]
+            Events in file order.
+
+        Raises
+        ------
+        ValueError
+            If a line is not valid JSON or the file has no events.
+        """
+        events = []
+        with open(path, encoding=encoding) as file:
+            for number, line in enumerate(file, 1):
+                if not line.strip():
+                    continue
+                try:
+                    events.append(json.loads(line))
+                except ValueError as error:
+                    raise ValueError(f"Invalid event at {path}:{number}: {error}") from error
+        if not events:
+            raise ValueError(f"No events found in {path}")
+        return events
+
+    @staticmethod
+    def load_handler(handler_path: str, project_root: Optional[str] = None) -> Callable:
+        """
+        Imports a handler file as the `lambda_function` module.
+
+        Parameters
+        ----------
+        handler_path : str
+            Path of the generated handler.
+        project_root : str, optional
+            Folder added to `sys.path`, from which the use case modules are imported
+            (default: current folder).
+
+        Returns
+        -------
+        Callable[[dict, Any], Any]
+            The `lambda_handler` function of the handler.
+        """
+        project_root = str(Path(project_root or os.getcwd()).resolve())
+        if project_root not in sys.path:
+            sys.path.insert(0, project_root)
+        spec = importlib.util.spec_from_file_location("lambda_function", handler_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module.lambda_handler
+
+    @staticmethod
+    def replay(lambda_handler: Callable, events: List[dict]) -> List[Sample]:
+        """
+        Invokes a handler once per event.
+
+        Parameters
+        ----------
+        lambda_handler : Callable[[dict, Any], Any]
+            Handler function.
+        events : List[dict]
+            Events to replay, in order.
+
+        Returns
+        -------
+        List[Sample]
+            The source, the latency in milliseconds and the error, if the handler
+            raised one, of every invocation.
+        """
+        samples = []
+        for event in events:
+            error = None
+            start = time.perf_counter()
+            try:
+                lambda_handler(event, None)
+            except Exception as exception:  # pylint: disable=broad-except
+                error = f"{type(exception).__name__}: {str(exception)[:200]}"
+            samples.append((event_source(event), (time.perf_counter() - start) * 1000, error))
+        return samples
+
+    def _replay_threads(self, handler_path: str, project_root: Optional[str],
+                        events: List[dict]) -> Tuple[List[Sample], float, Optional[float]]:
+        """Replays the events from a pool of threads sharing one loaded handler."""
+        with open(os.devnull, "w", encoding="utf-8") as devnull, redirect_stdout(devnull):
+            lambda_handler = self.load_handler(handler_path, project_root)
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                futures = [executor.submit(self.replay, lambda_handler, events[i::self.workers])
+                           for i in range(self.workers)]
+            seconds = time.perf_counter() - start
+        samples = [sample for future in futures for sample in future.result()]
+        return samples, seconds, peak_rss_mb()
+
+    def _replay_processes(self, handler_path: str, project_root: Optional[str],
+                          events: List[dict]) -> Tuple[List[Sample], float, Optional[float]]:
+        """
+        Replays the events from worker processes started with "spawn", so each one
+        loads the handler from scratch. Workers start replaying together once all of
+        them have loaded it.
+        """
+        context = multiprocessing.get_context("spawn")
+        barrier = context.Barrier(self.workers)
+        results = context.Queue()
+        processes = [
+            context.Process(
+                target=_replay_worker, daemon=True,
+                args=(index, handler_path, project_root),
+                kwargs={"events": events[index::self.workers], "barrier": barrier,
+                        "results": results})
+            for index in range(self.workers)
+        ]
+        for process in processes:
+            process.start()
+        outputs = self._collect_outputs(processes, barrier, results)
+        errors = [output[2] for output in outputs
+                  if output[1] == "error" and output[2] is not None]
+        if errors:
+            raise RuntimeError(f"Handler could not be replayed: {errors[0]}")
+        samples = [sample for output in outputs for sample in output[2]]
+        seconds = max(output[4] for output in outputs) - min(output[3] for output in outputs)
+        peaks = [output[5] for output in outputs if output[5] is not None]
+        return samples, seconds, max(peaks) if peaks else None
+
+    @staticmethod
+    def _collect_outputs(processes: list, barrier, results) -> List[tuple]:
+        """
+        Waits for the output of every worker process, or its exit code if it died
+        without reporting, and joins them.
+        """
+        outputs = {}
+        while len(outputs) < len(processes):
+            try:
+                output = results.get(timeout=0.5)
+                outputs[output[0]] = output
+            except queue.Empty:
+                for index, process in enumerate(processes):
+                    if index not in outputs and not process.is_alive():
+                        barrier.abort()
+                        outputs[index] = (index, "error",
+                                          f"Worker exited with code {process.exitcode}")
+        for process in processes:
+            process.join()
+        return list(outputs.values())
+
+    @staticmethod
+    def _latency_stats(samples: List[Sample]) -> Dict[str, Any]:
+        """Computes the count, error rate and latency percentiles of some samples."""
+        latencies = sorted(ms for _, ms, _ in samples)
+        errors = sum(1 for _, _, error in samples if error is not None)
+        return {
+            "events": len(samples),
+            "errors": errors,
+            "error_rate": errors / len(samples),
+            "mean_ms": sum(latencies) / len(latencies),
+            "p50_ms": percentile(latencies, 50),
+            "p90_ms": percentile(latencies, 90),
+            "p99_ms": percentile(latencies, 99),
+            "max_ms": latencies[-1],
+        }
+
+    def __call__(self, handler_path: str, events_path: str,
+                 project_root: Optional[str] = None, encoding: str = "utf-8") -> dict:
+        """
+        Replays the events of a file against a handler and summarizes the results.
+
+        Parameters
+        ----------
+        handler_path : str
+            Path of the generated handler.
+        events_path : str
+            Path of the JSON Lines events file.
+        project_root : str, optional
+            Folder the use case modules are imported from (default: current folder).
+        encoding : str, optional
+            Encoding of the events file (default: "utf-8").
+
+        Returns
+        -------
+        dict
+            Report with the `handler`, `mode`, `workers`, `seconds`, `throughput_per_s`,
+            the overall latency statistics, the `peak_rss_mb`, the statistics of each
+            event source under `sources` and the most frequent `top_errors`.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the handler file does not exist.
+        RuntimeError
+            If a worker process cannot load the handler or exits unexpectedly.
+        """
+        if not Path(handler_path).is_file():
+            raise FileNotFoundError(f"Handler not found: {Path(handler_path).resolve()}")
+        events = self.read_events(events_path, encoding) * self.repeat
+        if self.mode == "process":
+            samples, seconds, peak_rss = self._replay_processes(handler_path, project_root,
+                                                                events)
+        else:
+            samples, seconds, peak_rss = self._replay_threads(handler_path, project_root,
+                                                              events)
+        by_source: Dict[str, List[Sample]] = {}
+        for sample in samples:
+            by_source.setdefault(sample[0], []).append(sample)
+        errors = Counter(error for _, _, error in samples if error is not None)
+        return {
+            "handler": str(handler_path),
+            "mode": self.mode,
+            "workers": self.workers,
+            "seconds": seconds,
+            "throughput_per_s": len(samples) / seconds if seconds else None,
+            **self._latency_stats(samples),
+            "peak_rss_mb": peak_rss,
+            "sources": [{"source": source, **self._latency_stats(source_samples)}
+                        for source, source_samples in sorted(by_source.items())],
+            "top_errors": [{"error": error, "count": count}
+                           for error, count in errors.most_common(self.top_errors)],
+        }
+
+
+def format_event_replay(report: dict) -> str:
+    """
+    Renders the report returned by `LambdaEventReplayer` as text.
+
+    Parameters
+    ----------
+    report : dict
+        Replay report.
+
+    Returns
+    -------
+    str
+        Human-readable summary, a table per event source and the most frequent errors.
+    """
+    throughput = report["throughput_per_s"]
+    peak_rss = report["peak_rss_mb"]
+    lines = [
+        f"{report['handler']} ({report['workers']} {report['mode']} workers)",
+        f"  {report['events']} events in {report['seconds']:.3f} s, "
+        f"{'-' if throughput is None else f'{throughput:.1f}'} events/s, "
+        f"{report['errors']} errors ({report['error_rate']:.2%}), "
+        f"peak RSS {'-' if peak_rss is None else f'{peak_rss:.1f} MiB'}",
+    ]
+    header = (f"  {'source':<14}{'events':>8}{'errors':>8}{'p50 ms':>10}{'p90 ms':>10}"
+              f"{'p99 ms':>10}{'max ms':>10}")
+    lines.extend([header, "  " + "-" * (len(header) - 2)])
+    for row in report["sources"] + [{**report, "source": "total"}]:
+        lines.append(f"  {row['source']:<14}{row['events']:>8}{row['errors']:>8}"
+                     f"{row['p50_ms']:>10.3f}{row['p90_ms']:>10.3f}{row['p99_ms']:>10.3f}"
+                     f"{row['max_ms']:>10.3f}")
+    if report["top_errors"]:
+        lines.append("  most frequent errors:")
+        for row in report["top_errors"]:
+            lines.append(f"  {row['count']:>8}  {row['error']}")
+    return "\n".join(lines)
@@ -0,0 +1,473 @@
+"""
+Module for benchmarking generated AWS Lambda handlers locally.
+
+This module defines the pieces needed to measure the overhead of a generated handler
+before deploying it: a synthesizer of representative AWS events built from the trigger
+metadata, a stub use case, and a benchmark that invokes `lambda_handler` many times
+and reports latency percentiles and memory allocations per invocation.
+"""
+import json
+import os
+import re
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from bisslog_schema.schema import TriggerConsumer, TriggerHttp, TriggerSchedule, TriggerWebsocket
+from bisslog_schema.schema.enums.trigger_type import TriggerEnum
+from bisslog_schema.schema.triggers.trigger_info import TriggerInfo
+
+from .handler_generator.aws_handler_gen_response import AWSHandlerGenResponse
+from .handler_generator.aws_handler_generator import AWSHandlerGenerator
+from .handler_generator.chains.default_error_handler_generator import DefaultHandlerGenerator
+from .handler_generator.chains.manager_trigger_handler_generator import \
+    ManagerTriggerHandlerGenerator
+from .handler_generator.handler_generator import HandlerGenerator
+from .lambda_handler_generator_manager import LambdaHandlerGeneratorManager
+from .latency_stats import percentile
+
+
+class LambdaEventSynthesizer:
+    """
+    Builds representative AWS events for the triggers of a use case.
+
+    Events follow the shape delivered by each AWS service and carry the fields read by
+    the trigger mappers, filled with sample values, so mapping is exercised as well as
+    dispatch.
+
+    Parameters
+    ----------
+    sample_value : str, optional
+        Value given to every field required by a mapper (default is "sample").
+    """
+
+    _path_param_regex = re.compile(r"[<{]([^>}]+)[>}]")
+
+    def __init__(self, sample_value: str = "sample"):
+        self.sample_value = sample_value
+
+    def _sample(self, mapper: Optional[Dict[str, str]], prefix: str) -> dict:
+        """
+        Builds a nested dict with the fields a mapper reads below a prefix.
+
+        Parameters
+        ----------
+        mapper : Dict[str, str], optional
+            Mapper of the trigger, from source path to target name.
+        prefix : str
+            First segment of the source paths to consider, e.g. "body".
+
+        Returns
+        -------
+        dict
+            Sample payload, e.g. `{"user": {"id": "sample"}}` for "body.user.id".
+        """
+        payload: dict = {}
+        for source in mapper or {}:
+            route = source.split(".")
+            if route[0] != prefix or len(route) == 1:
+                continue
+            buffer = payload
+            for part in route[1:-1]:
+                buffer = buffer.setdefault(part, {})
+            buffer[route[-1]] = self.sample_value
+        return payload
+
+    def http(self, trigger: TriggerInfo) -> dict:
+        """Builds an API Gateway proxy event for an HTTP trigger."""
+        options: TriggerHttp = trigger.options
+        path = options.path.replace("<", "{").replace(">", "}")
+        path_parameters = self._sample(options.mapper, "path_query")
+        for name in self._path_param_regex.findall(path):
+            path_parameters.setdefault(name, self.sample_value)
+        body = self._sample(options.mapper, "body")
+        return {
+            "resource": path,
+            "path": self._path_param_regex.sub(self.sample_value, path),
+            "httpMethod": options.method.upper(),
+            "headers": self._sample(options.mapper, "headers"),
+            "queryStringParameters": self._sample(options.mapper, "params"),
+            "pathParameters": path_parameters,
+            "body": json.dumps(body),
+            "payload": body,
+            "isBase64Encoded": False,
+        }
+
+    def sqs(self, trigger: TriggerInfo) -> dict:
+        """Builds an SQS batch event with a single record for a consumer trigger."""
+        options: TriggerConsumer = trigger.options
+        return {"Records": [{
+            "messageId": "00000000-0000-0000-0000-000000000000",
+            "eventSource": "aws:sqs",
+            "eventSourceARN": f"arn:aws:sqs:us-east-1:000000000000:{options.queue}",
+            "body": self._sample(options.mapper, "event"),
+        }]}
+
+    def sns(self, trigger: TriggerInfo) -> dict:
+        """Builds an SNS notification event with a single record for a consumer trigger."""
+        options: TriggerConsumer = trigger.options
+        return {"Records": [{
+            "EventSource": "aws:sns",
+            "EventSubscriptionArn": f"arn:aws:sns:us-east-1:000000000000:{options.queue}",
+            "Sns": {"Message": self._sample(options.mapper, "event")},
+        }]}
+
+    def event_bridge(self, trigger: TriggerInfo) -> dict:
+        """Builds an EventBridge event whose source is the consumer queue."""
+        options: TriggerConsumer = trigger.options
+        return {
+            "version": "0",
+            "source": options.queue,
+            "detail-type": trigger.keyname or options.queue,
+            "detail": self._sample(options.mapper, "event"),
+        }
+
+    @staticmethod
+    def schedule(_: TriggerInfo) -> dict:
+        """Builds an EventBridge scheduled event."""
+        return {
+            "version": "0",
+            "source": "aws.events",
+            "detail-type": "Scheduled Event",
+            "detail": {},
+        }
+
+    def websocket(self, trigger: TriggerInfo) -> dict:
+        """Builds an API Gateway WebSocket event for a route."""
+        options: TriggerWebsocket = trigger.options
+        return {
+            "requestContext": {"routeKey": options.route_key,
+                               "connectionId": "connection-id"},
+            "headers": self._sample(options.mapper, "headers"),
+            "body": self._sample(options.mapper, "body"),
+        }
+
+    def __call__(self, triggers: Iterable[TriggerInfo]) -> List[Tuple[str, dict]]:
+        """
+        Builds one event per trigger and AWS event source able to deliver it.
+
+        Consumer triggers produce SQS, SNS and EventBridge events, as the generated
+        handlers accept the three of them.
+
+        Parameters
+        ----------
+        triggers : Iterable[TriggerInfo]
+            Triggers of a use case.
+
+        Returns
+        -------
+        List[Tuple[str, dict]]
+            Label and event of each synthesized invocation.
+        """
+        events = []
+        for i, trigger in enumerate(triggers):
+            keyname = trigger.keyname or str(i)
+            options = trigger.options
+            if trigger.type == TriggerEnum.HTTP and isinstance(options, TriggerHttp):
+                events.append((f"http:{keyname}", self.http(trigger)))
+            elif isinstance(options, TriggerConsumer):
+                events.append((f"sqs:{keyname}", self.sqs(trigger)))
+                events.append((f"sns:{keyname}", self.sns(trigger)))
+                events.append((f"event_bridge:{keyname}", self.event_bridge(trigger)))
+            elif trigger.type == TriggerEnum.SCHEDULE and isinstance(options, TriggerSchedule):
+                events.append((f"schedule:{keyname}", self.schedule(trigger)))
+            elif trigger.type == TriggerEnum.WEBSOCKET and isinstance(options, TriggerWebsocket):
+                events.append((f"websocket:{keyname}", self.websocket(trigger)))
+        return events
+
+
+class StubUseCase:
+    """
+    Use case replacement that records its calls and returns immediately.
+
+    Attributes
+    ----------
+    calls : int
+        Number of times the stub was invoked.
+    """
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, *_, **kwargs):
+        self.calls += 1
+        return kwargs
+
+
+class BuildStubUseCaseObject(AWSHandlerGenerator):
+    """
+    Binds the generated handler to a stub use case instead of the real implementation.
+
+    The stub is expected in the handler globals under `var_name`, so the use case
+    module is neither imported nor built.
+
+    Parameters
+    ----------
+    var_name : str, optional
+        Global name of the stub (default is "USE_CASE_STUB").
+    """
+
+    def __init__(self, var_name: str = "USE_CASE_STUB"):
+        self.var_name = var_name
+
+    def __call__(self, _=None) -> AWSHandlerGenResponse:
+        """
+        Generates the reference to the stub use case.
+
+        Returns
+        -------
+        AWSHandlerGenResponse
+            Empty response with `var_name` in `extra`.
+        """
+        return AWSHandlerGenResponse(extra={"var_name": self.var_name})
+
+
+class LambdaHandlerBenchmark:
+    """
+    Measures the per-invocation overhead of generated Lambda handlers.
+
+    Handlers are generated in memory from the service metadata with their use case
+    replaced by a `StubUseCase`, so the figures reflect the event dispatch and the
+    mapping code only.
+
+    Parameters
+    ----------
+    iterations : int, optional
+        Timed invocations per event (default is 1000).
+    warmup : int, optional
+        Untimed invocations per event before measuring (default is 50).
+    alloc_samples : int, optional
+        Invocations traced with `tracemalloc` per event (default is 20).
+    synthesizer : LambdaEventSynthesizer, optional
+        Builder of the events (default: `LambdaEventSynthesizer()`).
+    """
+
+    stub_var_name = "USE_CASE_STUB"
+
+    def __init__(self, iterations: int = 1000, warmup: int = 50, alloc_samples: int = 20,
+                 synthesizer: Optional[LambdaEventSynthesizer] = None):
+        if iterations < 1:
+            raise ValueError("iterations must be at least 1")
+        self.iterations = iterations
+        self.warmup = warmup
+        self.alloc_samples = alloc_samples
+        self.synthesizer = synthesizer or LambdaEventSynthesizer()
+        self.generate_handler = HandlerGenerator(
+            ManagerTriggerHandlerGenerator(),
+            BuildStubUseCaseObject(self.stub_var_name),
+            DefaultHandlerGenerator()
+        )
+
+    def load_handler(self, handler_str: str, stub: StubUseCase):
+        """
+        Executes a handler source and returns its `lambda_handler` function.
+
+        Parameters
+        ----------
+        handler_str : str
+            Generated handler source.
+        stub : StubUseCase
+            Use case bound to the handler.
+
+        Returns
+        -------
+        Callable[[dict, Any], Any]
+            The `lambda_handler` function of the handler.
+        """
+        namespace = {"__name__": "lambda_function", self.stub_var_name: stub}
+        exec(compile(handler_str, "lambda_function.py", "exec"), namespace)  # pylint: disable=exec-used
+        return namespace["lambda_handler"]
+
+    def _measure(self, lambda_handler, event: dict) -> dict:
+        """
+        Invokes a handler repeatedly with the same event.
+
+        Parameters
+        ----------
+        lambda_handler : Callable[[dict, Any], Any]
+            Handler function.
+        event : dict
+            Event passed on each invocation.
+
+        Returns
+        -------
+        dict
+            Latency statistics in microseconds and allocated bytes per invocation.
+        """
+        for _ in range(self.warmup):
+            lambda_handler(event, None)
+        timings = []
+        for _ in range(self.iterations):
+            start = time.perf_counter()
+            lambda_handler(event, None)
+            timings.append((time.perf_counter() - start) * 1e6)
+        allocations = []
+        for _ in range(self.alloc_samples):
+            tracemalloc.start()
+            try:
+                lambda_handler(event, None)
+                allocations.append(tracemalloc.get_traced_memory()[1])
+            finally:
+                tracemalloc.stop()
+        timings.sort()
+        return {
+            "iterations": self.iterations,
+            "mean_us": sum(timings) / len(timings),
+            "p50_us": percentile(timings, 50),
+            "p90_us": percentile(timings, 90),
+            "p99_us": percentile(timings, 99),
+            "max_us": timings[-1],
+            "alloc_bytes": sum(allocations) / len(allocations) if allocations else None,
+        }
+
+    def benchmark_use_case(self, service_info, use_case_code_info,
+                           instrument: Optional[str] = None,
+                           cold_start: bool = False) -> List[dict]:
+        """
+        Benchmarks the handler of a single use case with every synthesized event.
+
+        Parameters
+        ----------
+        service_info : ServiceInfo
+            Declared service metadata.
+        use_case_code_info : UseCaseCodeInfo
+            Code metadata of the use case.
+        instrument : str, optional
+            Instrumentation log format of the generated handler ("json" or "emf"), to
+            measure its overhead. The log lines are discarded.
+        cold_start : bool, optional
+            Whether the generated handler tracks cold starts, to measure that overhead
+            as well (default is False).
+
+        Returns
+        -------
+        List[dict]
+            One result per event, with the use case, the event label and its statistics.
+
+        Raises
+        ------
+        RuntimeError
+            If an event is not dispatched to the use case.
+        """
+        triggers = service_info.use_cases[use_case_code_info.name].triggers
+        handler_str = self.generate_handler(service_info, use_case_code_info,
+                                            instrument=instrument, cold_start=cold_start)
+        results = []
+        with open(os.devnull, "w", encoding="utf-8") as devnull, redirect_stdout(devnull):
+            for label, event in self.synthesizer(triggers):
+                results.append(self._benchmark_event(use_case_code_info.name, handler_str,
+                                                     label, event))
+        return results
+
+    def _benchmark_event(self, use_case_keyname: str, handler_str: str, label: str,
+                         event: dict) -> dict:
+        """
+        Checks that an event reaches the use case and measures its invocations.
+
+        Parameters
+        ----------
+        use_case_keyname : str
+            Keyname of the use case.
+        handler_str : str
+            Generated handler source.
+        label : str
+            Label of the event.
+        event : dict
+            Synthesized event.
+
+        Returns
+        -------
+        dict
+            Result with the use case, the event label and its statistics.
+
+        Raises
+        ------
+        RuntimeError
+            If the event is not dispatched to the use case.
+        """
+        stub = StubUseCase()
+        lambda_handler = self.load_handler(handler_str, stub)
+        try:
+            lambda_handler(event, None)
+        except Exception as e:
+            raise RuntimeError(
+                f"Handler of '{use_case_keyname}' failed with event {label}: {e}") from e
+        if stub.calls == 0:
+            raise RuntimeError(
+                f"Handler of '{use_case_keyname}' did not dispatch event {label} to the use case")
+        return {"use_case": use_case_keyname, "event": label,
+                **self._measure(lambda_handler, event)}
+
+    def __call__(self, metadata_file: Optional[str] = None,
+                 use_cases_folder_path: Optional[str] = None, *,
+                 filter_uc: Optional[str] = None, encoding: str = "utf-8",
+                 instrument: Optional[str] = None,
+                 metadata_cache: Optional[str] = None,
+                 cold_start: bool = False) -> List[dict]:
+        """
+        Benchmarks the handlers of every use case found in the metadata and code.
+
+        The metadata and use cases are read as `LambdaHandlerGeneratorManager` reads
+        them, so the same filter, cache and encoding select the same use cases.
+
+        Parameters
+        ----------
+        metadata_file : str, optional
+            Path to the metadata file (YAML/JSON).
+        use_cases_folder_path : str, optional
+            Directory where use case code is located.
+        filter_uc : str, optional
+            Regular expression, or "glob:" prefixed glob, selecting the use cases to
+            benchmark. Only the matching use case modules are imported.
+        encoding : str, optional
+            File encoding for reading metadata (default: "utf-8").
+        instrument : str, optional
+            Instrumentation log format of the generated handlers ("json" or "emf").
+        metadata_cache : str, optional
+            Path of a cache file for the service metadata and discovered use cases.
+        cold_start : bool, optional
+            Whether the generated handlers track cold starts (default is False).
+
+        Returns
+        -------
+        List[dict]
+            One result per use case and event.
+        """
+        full_service_metadata = LambdaHandlerGeneratorManager.read_metadata(
+            metadata_file, use_cases_folder_path, filter_uc=filter_uc, encoding=encoding,
+            metadata_cache=metadata_cache)
+        service_info = full_service_metadata.declared_metadata
+        results = []
+        for use_case_code_info in full_service_metadata.discovered_use_cases.values():
+            results.extend(self.benchmark_use_case(service_info, use_case_code_info,
+                                                   instrument, cold_start))
+        return results
+
+
+def format_handler_benchmark(rows: List[dict]) -> str:
+    """
+    Renders handler benchmark results as a text table.
+
+    Parameters
+    ----------
+    rows : List[dict]
+        Results produced by `LambdaHandlerBenchmark`.
+
+    Returns
+    -------
+    str
+        Human-readable table.
+    """
+    header = (f"{'use case':<28}{'event':<32}{'p50 us':>10}{'p90 us':>10}{'p99 us':>10}"
+              f"{'max us':>10}{'alloc B':>10}")
+    lines = [header, "-" * len(header)]
+    for row in rows:
+        alloc = "-" if row["alloc_bytes"] is None else f"{row['alloc_bytes']:.0f}"
+        lines.append(
+            f"{row['use_case']:<28}{row['event']:<32}{row['p50_us']:>10.2f}"
+            f"{row['p90_us']:>10.2f}{row['p99_us']:>10.2f}{row['max_us']:>10.2f}{alloc:>10}")
+    return "\n".join(lines)
+
+
+lambda_handler_benchmark = LambdaHandlerBenchmark()
@@ -5,13 +5,23 @@ This module defines a manager that coordinates the process of reading use case m
 generating handler code, and resolving the result through a customizable
 strategy (e.g., printing or saving).
 """
-from typing import Callable, Optional, Any
+import time
+from contextlib import nullcontext
+from functools import partial
+from typing import Any, Callable, ContextManager, Dict, List, Optional, Tuple
 
 from bisslog_schema import read_full_service_metadata
+from bisslog_schema.schema import ServiceInfo
+from bisslog_schema.service_full_metadata_reader import ServiceFullMetadataReader
+from bisslog_schema.service_metadata_with_code import ServiceInfoWithCode
 from bisslog_schema.use_case_code_inspector.use_case_code_metadata import UseCaseCodeInfo
 
+from .generation_timer import GenerationTimer
 from .handler_generator.handler_generator import generate_handler
+from .lambda_handler_validator import LambdaHandlerValidator, format_handler_validation
 from .save_lambda_handler_resolver import save_lambda_handler_default
+from .service_metadata_cache import ServiceMetadataCache
+from .use_case_discovery import FilteredServiceMetadataReader, read_filtered_service_metadata
 
 
 def default_resolver(___, use_case_code_info: UseCaseCodeInfo, handler_str: str, *_, **__):
@@ -50,17 +60,249 @@ class LambdaHandlerGeneratorManager:
         Function that processes the generated handler string. Default prints it.
     generate_handler_resolver : Callable[..., str], optional
         Function that generates handler code given the service and use case info.
+    verbose : bool, optional
+        Whether the selected shard and the result of each resolver call are printed
+        (default: True).
     """
 
     def __init__(self, resolver: Optional[Callable[..., Any]] = None,
-                 generate_handler_resolver: Optional[Callable[..., str]] = None):
+                 generate_handler_resolver: Optional[Callable[..., str]] = None,
+                 verbose: bool = True):
         self.resolver = resolver or default_resolver
         self.generate_handler = generate_handler_resolver
+        self.verbose = verbose
+
+    @staticmethod
+    def metadata_reader(filter_uc: Optional[str] = None, metadata_cache: Optional[str] = None,
+                        timer: Optional[GenerationTimer] = None) -> Callable[..., Any]:
+        """
+        Selects the reader of the declared metadata and the discovered use cases.
+
+        Parameters
+        ----------
+        filter_uc : str, optional
+            Regular expression, or "glob:" prefixed glob, selecting the use cases to discover.
+        metadata_cache : str, optional
+            Path of a cache file for the result.
+        timer : GenerationTimer, optional
+            Timer receiving the time spent discovering the use cases.
+
+        Returns
+        -------
+        Callable[..., Any]
+            Reader called with `metadata_file`, `use_cases_folder_path` and `encoding`.
+        """
+        if filter_uc:
+            read_metadata = read_filtered_service_metadata
+            if timer is not None:
+                read_metadata = FilteredServiceMetadataReader(
+                    timer.timed("discovery", read_metadata.inspector))
+            read_metadata = partial(read_metadata, filter_uc=filter_uc)
+        elif timer is not None:
+            read_metadata = ServiceFullMetadataReader(
+                timer.timed("discovery", read_full_service_metadata.code_inspector))
+        else:
+            read_metadata = read_full_service_metadata
+        if metadata_cache:
+            read_metadata = ServiceMetadataCache(metadata_cache, read_metadata)
+        return read_metadata
+
+    @classmethod
+    def read_metadata(cls, metadata_file: Optional[str] = None,
+                      use_cases_folder_path: Optional[str] = None, *,
+                      filter_uc: Optional[str] = None, encoding: str = "utf-8",
+                      metadata_cache: Optional[str] = None,
+                      timer: Optional[GenerationTimer] = None) -> ServiceInfoWithCode:
+        """
+        Reads the declared metadata and discovers the use cases of a service.
+
+        Parameters
+        ----------
+        metadata_file : str, optional
+            Path to the metadata file (YAML/JSON).
+        use_cases_folder_path : str, optional
+            Directory where use case code is located.
+        filter_uc : str, optional
+            Regular expression, or "glob:" prefixed glob, selecting the use cases to discover.
+        encoding : str, optional
+            File encoding for reading metadata (default: "utf-8").
+        metadata_cache : str, optional
+            Path of a cache file for the result.
+        timer : GenerationTimer, optional
+            Timer receiving the time spent reading the metadata and discovering the
+            use cases.
+
+        Returns
+        -------
+        ServiceInfoWithCode
+            Declared metadata and discovered use cases.
+        """
+        read_metadata = cls.metadata_reader(filter_uc, metadata_cache, timer)
+        if timer is None:
+            return read_metadata(metadata_file=metadata_file,
+                                 use_cases_folder_path=use_cases_folder_path, encoding=encoding)
+        discovery = timer.totals["discovery"]
+        start = time.perf_counter()
+        full_service_metadata = read_metadata(
+            metadata_file=metadata_file, use_cases_folder_path=use_cases_folder_path,
+            encoding=encoding)
+        timer.add("metadata", time.perf_counter() - start
+                  - (timer.totals["discovery"] - discovery))
+        return full_service_metadata
+
+    @staticmethod
+    def generator_kwargs(instrument: Optional[str] = None,
+                         cold_start: bool = False) -> Dict[str, Any]:
+        """
+        Builds the keyword arguments of the handler generator.
+
+        Parameters
+        ----------
+        instrument : str, optional
+            Log format ("json" or "emf") of the timing metrics emitted by the handlers.
+        cold_start : bool, optional
+            Whether the handlers report cold starts and their init duration.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Only the options that differ from the generator defaults.
+        """
+        generator_kwargs: Dict[str, Any] = {}
+        if instrument:
+            generator_kwargs["instrument"] = instrument
+        if cold_start:
+            generator_kwargs["cold_start"] = True
+        return generator_kwargs
+
+    def select_shard(self, use_cases: Dict[str, UseCaseCodeInfo],
+                     shard: Optional[Callable[[str], bool]] = None
+                     ) -> Dict[str, UseCaseCodeInfo]:
+        """
+        Keeps the use cases of a shard.
+
+        Parameters
+        ----------
+        use_cases : Dict[str, UseCaseCodeInfo]
+            Discovered use cases by keyname.
+        shard : Callable[[str], bool], optional
+            Predicate over use case keynames. All use cases are kept if None.
+
+        Returns
+        -------
+        Dict[str, UseCaseCodeInfo]
+            The selected use cases.
+        """
+        if shard is None:
+            return use_cases
+        selected = {keyname: info for keyname, info in use_cases.items() if shard(keyname)}
+        if self.verbose:
+            print(f"Shard {shard}: {len(selected)} of {len(use_cases)} use cases")
+        return selected
+
+    @staticmethod
+    def _phase(timer: Optional[GenerationTimer], phase: str,
+               use_case: Optional[str] = None) -> ContextManager[None]:
+        """Times a block in the timer, if any."""
+        return nullcontext() if timer is None else timer.phase(phase, use_case)
+
+    def generate_handlers(self, service_info: ServiceInfo,
+                          use_cases: Dict[str, UseCaseCodeInfo],
+                          timer: Optional[GenerationTimer] = None,
+                          **generator_kwargs) -> Dict[str, Tuple[UseCaseCodeInfo, str]]:
+        """
+        Generates the handler of every use case.
+
+        Parameters
+        ----------
+        service_info : ServiceInfo
+            Declared service metadata.
+        use_cases : Dict[str, UseCaseCodeInfo]
+            Use cases to generate handlers for, by keyname.
+        timer : GenerationTimer, optional
+            Timer receiving the generation time of each use case.
+        generator_kwargs : Any
+            Keyword arguments of the handler generator, see `generator_kwargs`.
+
+        Returns
+        -------
+        Dict[str, Tuple[UseCaseCodeInfo, str]]
+            Code information and handler source of each use case keyname.
+        """
+        handlers = {}
+        for use_case_keyname, use_case_code_info in use_cases.items():
+            with self._phase(timer, "generation", use_case_keyname):
+                handlers[use_case_keyname] = (use_case_code_info, self.generate_handler(
+                    service_info, use_case_code_info, **generator_kwargs))
+        return handlers
+
+    @staticmethod
+    def validate(validator: LambdaHandlerValidator,
+                 handlers: Dict[str, Tuple[UseCaseCodeInfo, str]]) -> None:
+        """
+        Validates the generated handlers and prints the results.
+
+        Parameters
+        ----------
+        validator : LambdaHandlerValidator
+            Validator of the handlers.
+        handlers : Dict[str, Tuple[UseCaseCodeInfo, str]]
+            Code information and handler source of each use case keyname.
+
+        Raises
+        ------
+        RuntimeError
+            If any handler is invalid.
+        """
+        rows = validator(handlers)
+        print(format_handler_validation(rows))
+        failed = [row for row in rows if row["error"]]
+        if failed:
+            raise RuntimeError(f"{len(failed)} of {len(rows)} handlers failed validation, "
+                               "none was resolved")
+
+    def resolve_handlers(self, service_info: ServiceInfo,
+                         handlers: Dict[str, Tuple[UseCaseCodeInfo, str]], *args,
+                         timer: Optional[GenerationTimer] = None, **kwargs) -> List[str]:
+        """
+        Passes every generated handler to the resolver.
+
+        Parameters
+        ----------
+        service_info : ServiceInfo
+            Declared service metadata.
+        handlers : Dict[str, Tuple[UseCaseCodeInfo, str]]
+            Code information and handler source of each use case keyname.
+        timer : GenerationTimer, optional
+            Timer receiving the resolver time of each use case.
+        args : Any
+            Additional positional arguments passed to the resolver.
+        kwargs : Any
+            Additional keyword arguments passed to the resolver.
+
+        Returns
+        -------
+        List[str]
+            Keynames of the resolved handlers.
+        """
+        for use_case_keyname, (use_case_code_info, handler_str) in handlers.items():
+            if self.verbose:
+                print(f"{'-' * 20}\nHandler for {use_case_keyname}")
+            with self._phase(timer, "resolver", use_case_keyname):
+                res = self.resolver(service_info, use_case_code_info, handler_str, *args,
+                                    **kwargs)
+            if self.verbose:
+                print(f"Resolver result for {use_case_keyname}: {res}")
+        return list(handlers)
 
     def __call__(
             self, *args, metadata_file: Optional[str] = None,
             use_cases_folder_path: Optional[str] = None, filter_uc: Optional[str] = None,
-            encoding: str = "utf-8", **kwargs):
+            encoding: str = "utf-8", instrument: Optional[str] = None,
+            cold_start: bool = False, metadata_cache: Optional[str] = None,
+            shard: Optional[Callable[[str], bool]] = None,
+            timer: Optional[GenerationTimer] = None,
+            validator: Optional[LambdaHandlerValidator] = None, **kwargs) -> List[str]:
         """
         Loads metadata, generates handler code for each use case, and applies the resolver.
 
@@ -71,29 +313,50 @@ class LambdaHandlerGeneratorManager:
         use_cases_folder_path : str, optional
             Directory where use case code is located.
         filter_uc : str, optional
-            String to filter which use cases to generate handlers for (by substring match).
+            Regular expression, or "glob:" prefixed glob, selecting the use cases to
+            generate handlers for. Only the matching use case modules are imported.
         encoding : str, optional
             File encoding for reading metadata (default: "utf-8").
+        instrument : str, optional
+            Log format ("json" or "emf") of the timing metrics emitted by the generated
+            handlers. Handlers are not instrumented by default.
+        cold_start : bool, optional
+            Whether the generated handlers report cold starts and their init duration
+            (default: False).
+        metadata_cache : str, optional
+            Path of a cache file for the service metadata and discovered use cases,
+            reused while the metadata file and use case sources are unchanged.
+        shard : Callable[[str], bool], optional
+            Predicate over use case keynames, such as a `ShardSelector`, selecting the
+            handlers generated by this run. All are generated by default.
+        timer : GenerationTimer, optional
+            Timer receiving the time spent in metadata read, discovery, and the
+            generation and resolution of each handler.
+        validator : LambdaHandlerValidator, optional
+            Validator checking every generated handler before any of them is passed
+            to the resolver. Handlers are not validated by default.
         args : Any
             Additional positional arguments passed to the resolver.
         kwargs : Any
             Additional keyword arguments passed to the resolver.
-        """
-        full_service_metadata = read_full_service_metadata(
-            metadata_file=metadata_file, use_cases_folder_path=use_cases_folder_path,
-            encoding=encoding
-        )
-        service_info = full_service_metadata.declared_metadata
-        use_cases = full_service_metadata.discovered_use_cases
 
-        if filter_uc:
-            use_cases = {k: v for k, v in use_cases.items() if filter_uc in k}
-
-        for use_case_keyname, use_case_code_info in use_cases.items():
-            handler_str = self.generate_handler(service_info, use_case_code_info)
-            print(f"{'-' * 20}\nHandler for {use_case_keyname}")
-            res = self.resolver(service_info, use_case_code_info, handler_str, *args, **kwargs)
-            print(f"Resolver result for {use_case_keyname}: {res}")
+        Returns
+        -------
+        List[str]
+            Keynames of the resolved handlers.
+        """
+        full_service_metadata = self.read_metadata(
+            metadata_file, use_cases_folder_path, filter_uc=filter_uc, encoding=encoding,
+            metadata_cache=metadata_cache, timer=timer)
+        handlers = self.generate_handlers(
+            full_service_metadata.declared_metadata,
+            self.select_shard(full_service_metadata.discovered_use_cases, shard), timer,
+            **self.generator_kwargs(instrument, cold_start))
+        if validator is not None:
+            with self._phase(timer, "validation"):
+                self.validate(validator, handlers)
+        return self.resolve_handlers(full_service_metadata.declared_metadata, handlers, *args,
+                                     timer=timer, **kwargs)
 
 def builder_lambda_handler_generator_manager(x):
     """Factory function to create a LambdaHandlerGeneratorManager with a specific resolver."""
@@ -0,0 +1,225 @@
+"""
+Module for validating generated AWS Lambda handlers before they are saved.
+
+This module defines a validator that compiles each generated handler string and,
+optionally, executes it in a fresh Python subprocess where the use case modules are
+replaced by stubs, so syntax errors, missing runtime dependencies and failing module
+level code are caught before deployment. Handlers are validated in parallel.
+"""
+import os
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from bisslog_schema.use_case_code_inspector.use_case_code_metadata import UseCaseCodeInfo
+
+_CHILD_SCRIPT = """\
+import sys
+import time
+import types
+sys.path.insert(0, {project_root!r})
+
+
+class _Stub:
+    def __call__(self, *args, **kwargs):
+        return self
+
+
+def _stub_attribute(name):
+    if name.startswith("__"):
+        raise AttributeError(name)
+    return _Stub()
+
+
+for name in {stub_modules!r}:
+    module = types.ModuleType(name)
+    module.__getattr__ = _stub_attribute
+    sys.modules[name] = module
+source = sys.stdin.read()
+namespace = {{"__name__": "lambda_function", "__file__": {handler_path!r}}}
+start = time.perf_counter()
+exec(compile(source, {handler_path!r}, "exec"), namespace)
+elapsed = (time.perf_counter() - start) * 1000
+if not callable(namespace.get("lambda_handler")):
+    raise SystemExit("lambda_handler is not defined")
+sys.stdout.write({marker!r} + repr(elapsed) + "\\n")
+"""
+
+
+class LambdaHandlerValidator:
+    """
+    Compiles and, optionally, imports generated handlers to catch broken ones early.
+
+    Compilation runs in the current process; the default generator already compiles
+    the handlers it builds, so it only catches errors from custom generators. The
+    import check runs every handler as `lambda_function` in a new interpreter with the
+    module of its use case replaced by a stub, so the check does not depend on the use
+    case implementation, its configuration or its side effects, but still imports the
+    mappers, the standard library modules and any other dependency the handler needs at
+    runtime. Each subprocess is independent, so handlers are checked concurrently by a
+    pool of threads.
+
+    Parameters
+    ----------
+    import_check : bool, optional
+        Whether handlers are also imported in a subprocess (default: True).
+    workers : int, optional
+        Number of handlers validated concurrently (default: number of CPUs).
+    python : str, optional
+        Interpreter used for the import check (defaults to the current one).
+    timeout : float, optional
+        Seconds a handler may take to import (default: 60).
+    project_root : str, optional
+        Folder added to `sys.path` and used as working directory of the import check
+        (default: current folder).
+    """
+
+    _marker = "--bisslog-handler-validation--"
+
+    def __init__(self, import_check: bool = True, workers: Optional[int] = None,
+                 python: Optional[str] = None, timeout: float = 60,
+                 project_root: Optional[str] = None):
+        self.import_check = import_check
+        self.workers = max(workers or os.cpu_count() or 1, 1)
+        self.python = python or sys.executable
+        self.timeout = timeout
+        self.project_root = project_root
+
+    @staticmethod
+    def compile_handler(handler_str: str, filename: str) -> Optional[str]:
+        """
+        Compiles a handler string.
+
+        Parameters
+        ----------
+        handler_str : str
+            Handler source code.
+        filename : str
+            Name reported in the error.
+
+        Returns
+        -------
+        Optional[str]
+            The compilation error, or None if the handler compiles.
+        """
+        try:
+            compile(handler_str, filename, "exec")
+        except SyntaxError as error:
+            return f"{type(error).__name__}: {error.msg} (line {error.lineno})"
+        except ValueError as error:
+            return f"{type(error).__name__}: {error}"
+        return None
+
+    def import_handler(self, handler_str: str, filename: str,
+                       stub_modules: List[str]) -> Tuple[Optional[str], Optional[float]]:
+        """
+        Executes a handler string in a new interpreter with stubbed use case modules.
+
+        Parameters
+        ----------
+        handler_str : str
+            Handler source code.
+        filename : str
+            File name given to the handler module.
+        stub_modules : List[str]
+            Modules replaced by stubs, whose attributes are callables returning a stub.
+
+        Returns
+        -------
+        Tuple[Optional[str], Optional[float]]
+            The import error, or None, and the milliseconds the handler module took to
+            execute, or None if it failed.
+        """
+        project_root = str(Path(self.project_root or os.getcwd()).resolve())
+        script = _CHILD_SCRIPT.format(project_root=project_root, handler_path=filename,
+                                      stub_modules=stub_modules, marker=self._marker)
+        try:
+            completed = subprocess.run(
+                [self.python, "-c", script], input=handler_str, cwd=project_root,
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True,
+                timeout=self.timeout, check=False)
+        except subprocess.TimeoutExpired:
+            return f"Import timed out after {self.timeout} seconds", None
+        _, found, elapsed = completed.stdout.rpartition(self._marker)
+        if completed.returncode != 0 or not found:
+            lines = completed.stderr.strip().splitlines()
+            return (lines[-1] if lines else f"Exited with code {completed.returncode}"), None
+        return None, float(elapsed)
+
+    def validate(self, use_case_keyname: str, use_case_code_info: UseCaseCodeInfo,
+                 handler_str: str) -> dict:
+        """
+        Validates the handler of one use case.
+
+        Parameters
+        ----------
+        use_case_keyname : str
+            Keyname of the use case.
+        use_case_code_info : UseCaseCodeInfo
+            Code information of the use case, whose module is stubbed.
+        handler_str : str
+            Handler source code.
+
+        Returns
+        -------
+        dict
+            The `use_case`, the `stage` that failed ("compile" or "import", None if the
+            handler is valid), the `error` and the `import_ms`.
+        """
+        filename = f"{use_case_code_info.name}_handler.py"
+        row = {"use_case": use_case_keyname, "stage": None, "error": None, "import_ms": None}
+        error = self.compile_handler(handler_str, filename)
+        if error is not None:
+            row.update(stage="compile", error=error)
+        elif self.import_check:
+            stub_modules = [use_case_code_info.module] if use_case_code_info.module else []
+            error, row["import_ms"] = self.import_handler(handler_str, filename, stub_modules)
+            if error is not None:
+                row.update(stage="import", error=error)
+        return row
+
+    def __call__(self, handlers: Dict[str, Tuple[UseCaseCodeInfo, str]]) -> List[dict]:
+        """
+        Validates many handlers concurrently.
+
+        Parameters
+        ----------
+        handlers : Dict[str, Tuple[UseCaseCodeInfo, str]]
+            Code information and handler source of each use case keyname.
+
+        Returns
+        -------
+        List[dict]
+            One row per handler, in the order of `handlers`.
+        """
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = [executor.submit(self.validate, keyname, use_case_code_info, handler_str)
+                       for keyname, (use_case_code_info, handler_str) in handlers.items()]
+        return [future.result() for future in futures]
+
+
+def format_handler_validation(rows: List[dict]) -> str:
+    """
+    Renders the rows returned by `LambdaHandlerValidator` as a text table.
+
+    Parameters
+    ----------
+    rows : List[dict]
+        One row per handler.
+
+    Returns
+    -------
+    str
+        Human-readable table, followed by the errors of the failing handlers.
+    """
+    header = f"{'use case':<32}{'result':>10}{'import ms':>12}"
+    lines = [header, "-" * len(header)]
+    for row in rows:
+        import_ms = "" if row["import_ms"] is None else f"{row['import_ms']:.2f}"
+        lines.append(f"{row['use_case']:<32}{row['stage'] or 'ok':>10}{import_ms:>12}")
+    for row in rows:
+        if row["error"]:
+            lines.append(f"{row['use_case']}: {row['error']}")
+    return "\n".join(lines)
@@ -0,0 +1,223 @@
+"""
+Module for regenerating AWS Lambda handlers while their sources change.
+
+This module defines a watcher that keeps the service metadata and the discovered use
+cases in memory, polls the metadata file and the use case folder, and regenerates and
+saves only the handlers whose inputs changed.
+"""
+import importlib
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from bisslog_schema.schema import ServiceInfo
+from bisslog_schema.schema.read_metadata import _find_path
+from bisslog_schema.use_case_code_inspector import PackageTreeReader
+from bisslog_schema.use_case_code_inspector.use_case_code_metadata import UseCaseCodeInfo
+
+from .handler_generator.handler_generator import generate_handler
+from .lambda_handler_generator_manager import LambdaHandlerGeneratorManager
+from .save_lambda_handler_resolver import save_lambda_handler_default
+
+
+class LambdaHandlerWatcher:
+    """
+    Regenerates the handlers of a service each time their inputs change.
+
+    A handler only depends on the declared metadata of its use case and on where the
+    use case is defined, so the watcher remembers both for every use case and, after a
+    change, regenerates the handlers whose inputs differ. Changed use case modules are
+    dropped from `sys.modules` before rediscovery, so only they are imported again.
+    Files are polled by modification time and size.
+
+    Parameters
+    ----------
+    resolver : Callable[..., Any], optional
+        Function receiving each regenerated handler (default: saves it to disk).
+    generate_handler_resolver : Callable[..., str], optional
+        Function that generates handler code given the service and use case info
+        (default: `generate_handler`).
+    interval : float, optional
+        Seconds between polls (default: 0.5).
+    """
+
+    def __init__(self, resolver: Optional[Callable[..., Any]] = None,
+                 generate_handler_resolver: Optional[Callable[..., str]] = None,
+                 interval: float = 0.5):
+        self.resolver = resolver or save_lambda_handler_default
+        self.generate_handler = generate_handler_resolver or generate_handler
+        self.interval = interval
+        self._snapshot: Dict[str, Tuple[int, int]] = {}
+        self._inputs: Dict[str, Tuple[Any, Any]] = {}
+
+    @staticmethod
+    def snapshot(metadata_file: Optional[str] = None,
+                 use_cases_folder_path: Optional[str] = None) -> Dict[str, Tuple[int, int]]:
+        """
+        Records the modification time and size of the watched files.
+
+        Parameters
+        ----------
+        metadata_file : str, optional
+            Path to the metadata file, resolved to the default locations when None.
+        use_cases_folder_path : str, optional
+            Folder or package of the use cases, resolved to the default locations when
+            None.
+
+        Returns
+        -------
+        Dict[str, Tuple[int, int]]
+            Modification time in nanoseconds and size of the metadata file and of every
+            Python file under the use cases folder, by absolute path.
+        """
+        # pylint: disable=protected-access
+        module_path = PackageTreeReader._find_module_path(use_cases_folder_path)
+        paths = [os.path.abspath(_find_path(metadata_file))]
+        for root, dirs, files in os.walk(Path(module_path.replace(".", "/")).resolve()):
+            dirs[:] = [d for d in dirs if d != "__pycache__"]
+            paths.extend(os.path.join(root, name) for name in files if name.endswith(".py"))
+
+        result = {}
+        for path in paths:
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            result[path] = (stat.st_mtime_ns, stat.st_size)
+        return result
+
+    @staticmethod
+    def _forget_modules(paths: List[str]) -> None:
+        """Removes the modules loaded from `paths` so discovery imports them again."""
+        changed = {os.path.normcase(os.path.abspath(path)) for path in paths}
+        for name, module in list(sys.modules.items()):
+            module_file = getattr(module, "__file__", None)
+            if module_file and os.path.normcase(os.path.abspath(module_file)) in changed:
+                del sys.modules[name]
+        importlib.invalidate_caches()
+
+    def poll(self, *args, metadata_file: Optional[str] = None,
+             use_cases_folder_path: Optional[str] = None, filter_uc: Optional[str] = None,
+             encoding: str = "utf-8", instrument: Optional[str] = None,
+             cold_start: bool = False, **kwargs) -> List[str]:
+        """
+        Checks the watched files once and regenerates the affected handlers.
+
+        The first poll generates every handler.
+
+        Parameters
+        ----------
+        metadata_file : str, optional
+            Path to the metadata file (YAML/JSON).
+        use_cases_folder_path : str, optional
+            Directory where use case code is located.
+        filter_uc : str, optional
+            Regular expression, or "glob:" prefixed glob, selecting the use cases to watch.
+        encoding : str, optional
+            File encoding for reading metadata (default: "utf-8").
+        instrument : str, optional
+            Log format ("json" or "emf") of the timing metrics emitted by the handlers.
+        cold_start : bool, optional
+            Whether the handlers report cold starts and their init duration.
+        args : Any
+            Additional positional arguments passed to the resolver.
+        kwargs : Any
+            Additional keyword arguments passed to the resolver. Saved handlers are
+            overwritten unless `overwrite` is given.
+
+        Returns
+        -------
+        List[str]
+            Keynames of the regenerated handlers, empty if nothing changed.
+        """
+        snapshot = self.snapshot(metadata_file, use_cases_folder_path)
+        if snapshot == self._snapshot:
+            return []
+        if self._snapshot:
+            self._forget_modules([path for path in snapshot.keys() | self._snapshot.keys()
+                                  if snapshot.get(path) != self._snapshot.get(path)])
+
+        full_service_metadata = LambdaHandlerGeneratorManager.read_metadata(
+            metadata_file, use_cases_folder_path, filter_uc=filter_uc, encoding=encoding)
+        use_cases = full_service_metadata.discovered_use_cases
+        for use_case_keyname in self._inputs.keys() - use_cases.keys():
+            del self._inputs[use_case_keyname]
+            print(f"Use case {use_case_keyname} is no longer discovered, "
+                  "its handler was left in place")
+
+        kwargs.setdefault("overwrite", True)
+        regenerated = self.regenerate(
+            full_service_metadata.declared_metadata, use_cases,
+            LambdaHandlerGeneratorManager.generator_kwargs(instrument, cold_start),
+            *args, **kwargs)
+        # Only a complete pass is remembered, so a failed one is retried by the next poll
+        self._snapshot = snapshot
+        return regenerated
+
+    def regenerate(self, service_info: ServiceInfo, use_cases: Dict[str, UseCaseCodeInfo],
+                   generator_kwargs: Dict[str, Any], *args, **kwargs) -> List[str]:
+        """
+        Regenerates and resolves the handlers whose inputs changed since last resolved.
+
+        Parameters
+        ----------
+        service_info : ServiceInfo
+            Declared service metadata.
+        use_cases : Dict[str, UseCaseCodeInfo]
+            Discovered use cases by keyname.
+        generator_kwargs : Dict[str, Any]
+            Keyword arguments of the handler generator.
+        args : Any
+            Additional positional arguments passed to the resolver.
+        kwargs : Any
+            Additional keyword arguments passed to the resolver.
+
+        Returns
+        -------
+        List[str]
+            Keynames of the regenerated handlers.
+        """
+        regenerated = []
+        for use_case_keyname, use_case_code_info in use_cases.items():
+            inputs = (service_info.use_cases[use_case_keyname], use_case_code_info)
+            if self._inputs.get(use_case_keyname) == inputs:
+                continue
+            handler_str = self.generate_handler(service_info, use_case_code_info,
+                                                **generator_kwargs)
+            res = self.resolver(service_info, use_case_code_info, handler_str, *args, **kwargs)
+            print(f"Regenerated handler for {use_case_keyname}: {res}")
+            self._inputs[use_case_keyname] = inputs
+            regenerated.append(use_case_keyname)
+        return regenerated
+
+    def __call__(self, *args, **kwargs) -> None:
+        """
+        Polls until interrupted, regenerating the handlers affected by each change.
+
+        Errors while reading or generating, such as a file saved half edited, are
+        reported and the watcher keeps polling.
+
+        Parameters
+        ----------
+        args : Any
+            Positional arguments of `poll`.
+        kwargs : Any
+            Keyword arguments of `poll`.
+        """
+        print("Watching for changes, press Ctrl+C to stop")
+        try:
+            while True:
+                start = time.perf_counter()
+                try:
+                    regenerated = self.poll(*args, **kwargs)
+                except Exception as error:  # pylint: disable=broad-exception-caught
+                    print(f"Handlers could not be regenerated: {error}")
+                else:
+                    if regenerated:
+                        print(f"Regenerated {len(regenerated)} handlers in "
+                              f"{time.perf_counter() - start:.3f}s")
+                time.sleep(self.interval)
+        except KeyboardInterrupt:
+            print("Stopped watching")
@@ -0,0 +1,280 @@
+"""
+Module for profiling the cold start of generated AWS Lambda handlers.
+
+This module defines a class that loads a generated handler in a fresh Python
+subprocess with `-X importtime`, and reports the tree of import costs together with
+the time spent running each top-level statement of the handler, such as the
+construction of the use case object in its build section.
+"""
+import ast
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+_CHILD_SCRIPT = """\
+import sys
+import time
+sys.path.insert(0, {project_root!r})
+namespace = {{"__name__": "lambda_function", "__file__": {handler_path!r}}}
+timings = []
+sys.stderr.write({marker!r} + "\\n")
+sys.stderr.flush()
+for source in {sources!r}:
+    start = time.perf_counter()
+    exec(compile(source, {handler_path!r}, "exec"), namespace)
+    timings.append((time.perf_counter() - start) * 1000)
+sys.stdout.write({marker!r} + repr(timings) + "\\n")
+"""
+
+
+class LambdaImportProfiler:
+    """
+    Measures the import and initialization costs of generated Lambda handlers.
+
+    Each handler runs in a new interpreter, so modules already imported by the caller
+    do not hide their cost. Top-level statements are executed one by one: imports are
+    reported as a tree by `-X importtime`, and every statement is also timed, which
+    isolates the construction of the use case objects in the build section.
+
+    Parameters
+    ----------
+    python : str, optional
+        Interpreter used to load the handlers (defaults to the current one).
+    min_us : int, optional
+        Imports whose cumulative time is below this many microseconds are left out of
+        the tree (default is 0).
+    max_depth : int, optional
+        Maximum nesting depth of the import tree (default: unlimited).
+    """
+
+    _importtime_regex = re.compile(r"^import time:\s*(\d+)\s*\|\s*(\d+)\s*\|( *)(\S.*)$")
+    _marker = "--bisslog-import-profile--"
+
+    def __init__(self, python: Optional[str] = None, min_us: int = 0,
+                 max_depth: Optional[int] = None):
+        self.python = python or sys.executable
+        self.min_us = min_us
+        self.max_depth = max_depth
+
+    @staticmethod
+    def split_statements(source: str) -> List[Tuple[str, str]]:
+        """
+        Splits a handler source into its top-level statements.
+
+        Parameters
+        ----------
+        source : str
+            Handler source code.
+
+        Returns
+        -------
+        List[Tuple[str, str]]
+            The kind of each statement ("import", "definition" or "build") and its
+            source code.
+        """
+        lines = source.splitlines(keepends=True)
+        nodes = ast.parse(source).body
+        starts = [
+            min([node.lineno] + [d.lineno for d in getattr(node, "decorator_list", [])]) - 1
+            for node in nodes
+        ]
+        statements = []
+        for node, start, end in zip(nodes, starts, starts[1:] + [len(lines)]):
+            if isinstance(node, (ast.Import, ast.ImportFrom)):
+                kind = "import"
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                kind = "definition"
+            else:
+                kind = "build"
+            statements.append((kind, "".join(lines[start:end])))
+        return statements
+
+    @classmethod
+    def parse_importtime(cls, output: str) -> List[dict]:
+        """
+        Builds the import tree from the `-X importtime` output.
+
+        The interpreter reports each module after the modules it imports, with two
+        spaces of indentation per nesting level.
+
+        Parameters
+        ----------
+        output : str
+            Lines written to stderr by `-X importtime`.
+
+        Returns
+        -------
+        List[dict]
+            Top-level imports, each with `module`, `self_us`, `cumulative_us` and
+            `children`, in import order.
+        """
+        pending: Dict[int, List[dict]] = {}
+        for line in output.splitlines():
+            match = cls._importtime_regex.match(line)
+            if match is None:
+                continue
+            level = len(match.group(3)) // 2
+            pending.setdefault(level, []).append({
+                "module": match.group(4).strip(),
+                "self_us": int(match.group(1)),
+                "cumulative_us": int(match.group(2)),
+                "children": pending.pop(level + 1, []),
+            })
+        return pending[min(pending)] if pending else []
+
+    def _prune(self, nodes: List[dict], depth: int = 1) -> List[dict]:
+        """
+        Sorts an import tree by cumulative time and applies `min_us` and `max_depth`.
+
+        Parameters
+        ----------
+        nodes : List[dict]
+            Import tree nodes.
+        depth : int, optional
+            Depth of `nodes` in the tree.
+
+        Returns
+        -------
+        List[dict]
+            Pruned tree, most expensive imports first.
+        """
+        pruned = []
+        for node in sorted(nodes, key=lambda n: n["cumulative_us"], reverse=True):
+            if node["cumulative_us"] < self.min_us:
+                continue
+            children = []
+            if self.max_depth is None or depth < self.max_depth:
+                children = self._prune(node["children"], depth + 1)
+            pruned.append({**node, "children": children})
+        return pruned
+
+    def profile(self, handler_path: str, project_root: Optional[str] = None) -> dict:
+        """
+        Profiles the cold start of a single handler file.
+
+        Parameters
+        ----------
+        handler_path : str
+            Path to the generated handler.
+        project_root : str, optional
+            Folder added to `sys.path` and used as working directory, so the use case
+            modules resolve as they do in the Lambda package (default: current folder).
+
+        Returns
+        -------
+        dict
+            Report with the handler path, the import tree under `imports`, the total
+            import time, the timing of each top-level statement, and the build time.
+
+        Raises
+        ------
+        RuntimeError
+            If the handler fails to load.
+        """
+        handler_path = str(Path(handler_path).resolve())
+        project_root = str(Path(project_root or os.getcwd()).resolve())
+        statements = self.split_statements(Path(handler_path).read_text(encoding="utf-8"))
+        script = _CHILD_SCRIPT.format(
+            project_root=project_root, handler_path=handler_path, marker=self._marker,
+            sources=[source for _, source in statements])
+        completed = subprocess.run(
+            [self.python, "-X", "importtime", "-c", script], cwd=project_root,
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True,
+            check=False)
+        _, found, stderr = completed.stderr.partition(self._marker)
+        if completed.returncode != 0 or not found:
+            raise RuntimeError(f"Failed to load handler {handler_path}:\n"
+                               f"{completed.stderr[-2000:]}")
+        timings = ast.literal_eval(completed.stdout.rpartition(self._marker)[2].strip())
+        imports = self.parse_importtime(stderr)
+        statement_timings = [
+            {"kind": kind, "statement": source.strip(), "ms": ms}
+            for (kind, source), ms in zip(statements, timings)
+        ]
+        return {
+            "handler": handler_path,
+            "import_us": sum(node["cumulative_us"] for node in imports),
+            "imports": self._prune(imports),
+            "statements": statement_timings,
+            "build_ms": sum(t["ms"] for t in statement_timings if t["kind"] == "build"),
+            "total_ms": sum(timings),
+        }
+
+    def __call__(self, handler_name: Optional[str] = None,
+                 handlers_folder: str = "framework/lambda_aws",
+                 project_root: Optional[str] = None) -> List[dict]:
+        """
+        Profiles one handler, or every handler of a folder.
+
+        Parameters
+        ----------
+        handler_name : str, optional
+            Name of the handler file (without `.py`). If None, every handler of
+            `handlers_folder` is profiled.
+        handlers_folder : str, optional
+            Folder containing the handler files (default is "framework/lambda_aws").
+        project_root : str, optional
+            Folder the use case modules are imported from (default: current folder).
+
+        Returns
+        -------
+        List[dict]
+            One report per handler.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the handler file does not exist.
+        """
+        folder = Path(handlers_folder)
+        if handler_name is None:
+            handler_paths = sorted(
+                path for path in folder.glob("*.py") if not path.name.startswith("__"))
+        else:
+            handler_paths = [folder / f"{handler_name}.py"]
+        for handler_path in handler_paths:
+            if not handler_path.is_file():
+                raise FileNotFoundError(f"Handler not found: {handler_path.resolve()}")
+        return [self.profile(str(path), project_root) for path in handler_paths]
+
+
+def _format_import_tree(nodes: List[dict], lines: List[str], depth: int = 0) -> None:
+    """Appends the lines of an import tree, indented by nesting level."""
+    for node in nodes:
+        lines.append(f"  {node['cumulative_us'] / 1000:>10.2f}{node['self_us'] / 1000:>10.2f}"
+                     f"  {'  ' * depth}{node['module']}")
+        _format_import_tree(node["children"], lines, depth + 1)
+
+
+def format_import_profile(reports: List[dict]) -> str:
+    """
+    Renders import profiles as human-readable text.
+
+    Parameters
+    ----------
+    reports : List[dict]
+        Reports produced by `LambdaImportProfiler`.
+
+    Returns
+    -------
+    str
+        Text report.
+    """
+    lines = []
+    for report in reports:
+        lines.append(f"{report['handler']}")
+        lines.append(f"  total: {report['total_ms']:.2f} ms, imports: "
+                     f"{report['import_us'] / 1000:.2f} ms, build: {report['build_ms']:.2f} ms")
+        lines.append(f"  {'cumul ms':>10}{'self ms':>10}  imported module")
+        _format_import_tree(report["imports"], lines)
+        lines.append("  top-level statements:")
+        for item in sorted(report["statements"], key=lambda t: t["ms"], reverse=True):
+            statement = item["statement"].splitlines()[0]
+            lines.append(f"  {item['ms']:>10.2f}  [{item['kind']}] {statement}")
+    return "\n".join(lines)
+
+
+lambda_import_profiler = LambdaImportProfiler()
@@ -0,0 +1,277 @@
+"""
+Module for analyzing the size of AWS Lambda deployment packages.
+
+This module defines a class that inspects generated `.zip` files and reports their
+compressed and uncompressed sizes, the largest modules and packages they contain,
+files duplicated across several zips, and whether they fit in a size budget.
+"""
+import os
+import re
+import zipfile
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+
+class LambdaPackageAnalyzer:
+    """
+    Builds size reports for Lambda zips and enforces a size budget.
+
+    Parameters
+    ----------
+    top : int, optional
+        Number of largest modules and packages listed per zip (default is 10).
+    max_unzipped_size : int, optional
+        Maximum uncompressed size in bytes allowed for each zip.
+    max_zipped_size : int, optional
+        Maximum size in bytes allowed for each zip file.
+    package_depth : int, optional
+        Directory depth used to aggregate entries into packages (default is 2).
+    """
+
+    _size_regex = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([kmg]i?b?|b)?\s*$", re.IGNORECASE)
+    _size_units = {"": 1, "b": 1, "k": 1000, "m": 1000 ** 2, "g": 1000 ** 3,
+                   "ki": 1024, "mi": 1024 ** 2, "gi": 1024 ** 3}
+
+    def __init__(self, top: int = 10, max_unzipped_size: Optional[int] = None,
+                 max_zipped_size: Optional[int] = None, package_depth: int = 2):
+        self.top = top
+        self.max_unzipped_size = max_unzipped_size
+        self.max_zipped_size = max_zipped_size
+        self.package_depth = package_depth
+
+    @classmethod
+    def parse_size(cls, size: str) -> int:
+        """
+        Parses a human-readable size such as "250MB", "50MiB" or "1024".
+
+        Parameters
+        ----------
+        size : str
+            Size with an optional decimal (kB, MB, GB) or binary (KiB, MiB, GiB) unit.
+
+        Returns
+        -------
+        int
+            Size in bytes.
+
+        Raises
+        ------
+        ValueError
+            If the size cannot be parsed.
+        """
+        match = cls._size_regex.match(size)
+        if match is None:
+            raise ValueError(f"Invalid size: '{size}'")
+        unit = (match.group(2) or "").lower()
+        if unit != "b":
+            unit = unit.rstrip("b")
+        return int(float(match.group(1)) * cls._size_units[unit])
+
+    def _packages(self, entries: List[zipfile.ZipInfo]) -> Dict[str, Tuple[int, int]]:
+        """
+        Aggregates entry sizes by parent directory up to `package_depth` levels.
+
+        Parameters
+        ----------
+        entries : List[zipfile.ZipInfo]
+            Entries of a zip.
+
+        Returns
+        -------
+        Dict[str, Tuple[int, int]]
+            Compressed and uncompressed sizes by directory.
+        """
+        packages: Dict[str, List[int]] = defaultdict(lambda: [0, 0])
+        for entry in entries:
+            parts = entry.filename.split("/")[:-1]
+            for depth in range(1, min(len(parts), self.package_depth) + 1):
+                sizes = packages["/".join(parts[:depth])]
+                sizes[0] += entry.compress_size
+                sizes[1] += entry.file_size
+        return {name: (sizes[0], sizes[1]) for name, sizes in packages.items()}
+
+    def analyze(self, zip_path: str) -> dict:
+        """
+        Builds the size report of a single zip.
+
+        Parameters
+        ----------
+        zip_path : str
+            Path to the zip file.
+
+        Returns
+        -------
+        dict
+            Report with the zip path, its file size, total compressed and uncompressed
+            sizes, the number of files, and the largest modules and packages.
+        """
+        with zipfile.ZipFile(zip_path) as zipf:
+            entries = [info for info in zipf.infolist() if not info.is_dir()]
+        largest_modules = sorted(entries, key=lambda e: e.file_size, reverse=True)[:self.top]
+        packages = self._packages(entries)
+        largest_packages = sorted(packages.items(), key=lambda item: item[1][1],
+                                  reverse=True)[:self.top]
+        return {
+            "zip": zip_path,
+            "zip_size": os.path.getsize(zip_path),
+            "compressed_size": sum(e.compress_size for e in entries),
+            "uncompressed_size": sum(e.file_size for e in entries),
+            "files": len(entries),
+            "largest_modules": [
+                {"path": e.filename, "compressed_size": e.compress_size,
+                 "uncompressed_size": e.file_size}
+                for e in largest_modules
+            ],
+            "largest_packages": [
+                {"path": name, "compressed_size": compressed, "uncompressed_size": uncompressed}
+                for name, (compressed, uncompressed) in largest_packages
+            ],
+        }
+
+    @staticmethod
+    def _duplicates(zip_paths: List[str]) -> List[dict]:
+        """
+        Finds identical files shipped in more than one zip.
+
+        Files are considered identical when their path, size and CRC match. They are
+        candidates to be moved into a shared Lambda layer.
+
+        Parameters
+        ----------
+        zip_paths : List[str]
+            Zips to compare.
+
+        Returns
+        -------
+        List[dict]
+            Duplicated files, sorted by the total uncompressed bytes they repeat.
+        """
+        seen: Dict[Tuple[str, int, int], List[str]] = defaultdict(list)
+        for zip_path in zip_paths:
+            with zipfile.ZipFile(zip_path) as zipf:
+                for info in zipf.infolist():
+                    if not info.is_dir():
+                        seen[(info.filename, info.file_size, info.CRC)].append(zip_path)
+        duplicates = [
+            {"path": path, "uncompressed_size": size, "zips": zips}
+            for (path, size, _), zips in seen.items() if len(zips) > 1
+        ]
+        duplicates.sort(key=lambda d: d["uncompressed_size"] * (len(d["zips"]) - 1),
+                        reverse=True)
+        return duplicates
+
+    def _budget_violations(self, report: dict) -> List[str]:
+        """
+        Lists the budget limits exceeded by a zip.
+
+        Parameters
+        ----------
+        report : dict
+            Report of a single zip.
+
+        Returns
+        -------
+        List[str]
+            Human-readable violations.
+        """
+        violations = []
+        if self.max_unzipped_size is not None \
+                and report["uncompressed_size"] > self.max_unzipped_size:
+            violations.append(
+                f"{report['zip']}: unzipped size {report['uncompressed_size']} bytes exceeds "
+                f"the budget of {self.max_unzipped_size} bytes")
+        if self.max_zipped_size is not None and report["zip_size"] > self.max_zipped_size:
+            violations.append(
+                f"{report['zip']}: zip size {report['zip_size']} bytes exceeds "
+                f"the budget of {self.max_zipped_size} bytes")
+        return violations
+
+    def __call__(self, zip_paths: List[str]) -> dict:
+        """
+        Builds the size report of several zips and checks the budget.
+
+        Parameters
+        ----------
+        zip_paths : List[str]
+            Zips to analyze.
+
+        Returns
+        -------
+        dict
+            Report with one entry per zip under `packages`, the files duplicated across
+            zips under `duplicates`, and the exceeded limits under `violations`.
+        """
+        packages = [self.analyze(zip_path) for zip_path in zip_paths]
+        violations = []
+        for report in packages:
+            violations.extend(self._budget_violations(report))
+        return {
+            "packages": packages,
+            "duplicates": self._duplicates(zip_paths)[:self.top],
+            "violations": violations,
+        }
+
+    def check_budget(self, report: dict) -> None:
+        """
+        Fails when a report contains budget violations.
+
+        Parameters
+        ----------
+        report : dict
+            Report produced by calling the analyzer.
+
+        Raises
+        ------
+        RuntimeError
+            If any zip exceeds the budget.
+        """
+        if report["violations"]:
+            raise RuntimeError("Package size budget exceeded:\n" + "\n".join(report["violations"]))
+
+
+def _human_size(size: int) -> str:
+    """Formats a size in bytes using binary units."""
+    if size < 1024:
+        return f"{size} B"
+    value = size / 1024
+    for unit in ("KiB", "MiB"):
+        if value < 1024:
+            return f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GiB"
+
+
+def format_package_report(report: dict) -> str:
+    """
+    Renders a package size report as human-readable text.
+
+    Parameters
+    ----------
+    report : dict
+        Report produced by `LambdaPackageAnalyzer`.
+
+    Returns
+    -------
+    str
+        Text report.
+    """
+    lines = []
+    for package in report["packages"]:
+        lines.append(f"{package['zip']}")
+        lines.append(f"  zip size: {_human_size(package['zip_size'])}, "
+                     f"unzipped: {_human_size(package['uncompressed_size'])}, "
+                     f"files: {package['files']}")
+        lines.append("  largest packages:")
+        for item in package["largest_packages"]:
+            lines.append(f"    {_human_size(item['uncompressed_size']):>12}  {item['path']}")
+        lines.append("  largest modules:")
+        for item in package["largest_modules"]:
+            lines.append(f"    {_human_size(item['uncompressed_size']):>12}  {item['path']}")
+    if report["duplicates"]:
+        lines.append("files duplicated across zips:")
+        for item in report["duplicates"]:
+            lines.append(f"  {_human_size(item['uncompressed_size']):>12}  {item['path']} "
+                         f"({len(item['zips'])} zips)")
+    for violation in report["violations"]:
+        lines.append(f"BUDGET EXCEEDED: {violation}")
+    return "\n".join(lines)
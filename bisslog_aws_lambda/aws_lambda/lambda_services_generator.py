@@ -0,0 +1,209 @@
+"""
+Module for generating the AWS Lambda handlers of several services in one process.
+
+This module defines a generator that reads a manifest of services, each with its own
+metadata file and use case folder, and generates their handlers with a pool of
+threads, so the interpreter, `bisslog_schema`, the handler generators and the modules
+shared by the services are loaded once for the whole monorepo.
+"""
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from typing import Any, Callable, Dict, List, Optional
+
+from bisslog_schema.schema.read_metadata import read_metadata_file
+
+from .handler_generator.handler_generator import generate_handler
+from .lambda_handler_generator_manager import LambdaHandlerGeneratorManager
+from .save_lambda_handler_resolver import save_lambda_handler_default
+
+
+class LambdaServicesGenerator:
+    """
+    Generates and saves the handlers of many services with a worker pool.
+
+    Every service is described by a dictionary with the options of
+    `generate_lambda_handlers`. Use case modules are imported by their module path from
+    the current directory, so services must live in distinct packages, as they do when
+    the monorepo root is the project root; modules they share are imported once.
+    Threads are used instead of processes so that the imported modules and the
+    generator objects are shared.
+
+    Parameters
+    ----------
+    resolver : Callable[..., Any], optional
+        Function receiving each generated handler (default: saves it to disk).
+    generate_handler_resolver : Callable[..., str], optional
+        Function that generates handler code given the service and use case info
+        (default: `generate_handler`).
+    workers : int, optional
+        Number of services generated concurrently (default: 4).
+    """
+
+    service_keys = ("metadata_file", "use_cases_folder_path", "target_folder", "filter_uc",
+                    "encoding", "metadata_cache")
+
+    def __init__(self, resolver: Optional[Callable[..., Any]] = None,
+                 generate_handler_resolver: Optional[Callable[..., str]] = None,
+                 workers: int = 4):
+        self.resolver = resolver or save_lambda_handler_default
+        self.generate_handler = generate_handler_resolver or generate_handler
+        self.workers = max(workers, 1)
+
+    @classmethod
+    def read_manifest(cls, path: str, encoding: str = "utf-8") -> List[Dict[str, str]]:
+        """
+        Reads the services listed in a YAML or JSON manifest.
+
+        The manifest is either a list of services or a mapping with a `services` list.
+
+        Parameters
+        ----------
+        path : str
+            Path of the manifest file.
+        encoding : str, optional
+            File encoding (default: "utf-8").
+
+        Returns
+        -------
+        List[Dict[str, str]]
+            Options of each service.
+
+        Raises
+        ------
+        ValueError
+            If the manifest has no list of services or a service has unknown options.
+        """
+        data = read_metadata_file(path, encoding)
+        services = data.get("services") if isinstance(data, dict) else data
+        if not isinstance(services, list):
+            raise ValueError(f"Manifest {path} must contain a list of services")
+        for service in services:
+            cls.check_service(service)
+        return services
+
+    @classmethod
+    def check_service(cls, service: Dict[str, str]) -> None:
+        """
+        Validates the options of a service.
+
+        Parameters
+        ----------
+        service : Dict[str, str]
+            Options of the service.
+
+        Raises
+        ------
+        ValueError
+            If the service is not a mapping or has unknown options.
+        """
+        if not isinstance(service, dict):
+            raise ValueError(f"Invalid service {service!r}, expected a mapping of options")
+        unknown = service.keys() - set(cls.service_keys)
+        if unknown:
+            raise ValueError(f"Unknown service options {sorted(unknown)}, expected "
+                             f"{list(cls.service_keys)}")
+
+    def generate_service(self, service: Dict[str, str], **manager_kwargs) -> Dict[str, Any]:
+        """
+        Generates and resolves the handlers of one service.
+
+        Parameters
+        ----------
+        service : Dict[str, str]
+            Options of the service.
+        manager_kwargs : Any
+            Keyword arguments of `LambdaHandlerGeneratorManager`, such as `instrument`,
+            `shard` or `validator`.
+
+        Returns
+        -------
+        Dict[str, Any]
+            The metadata file, the number of handlers and the seconds it took.
+        """
+        start = time.perf_counter()
+        if service.get("target_folder"):
+            manager_kwargs["target_folder"] = service["target_folder"]
+        handlers = LambdaHandlerGeneratorManager(self.resolver, self.generate_handler,
+                                                 verbose=False)(
+            metadata_file=service.get("metadata_file"),
+            use_cases_folder_path=service.get("use_cases_folder_path"),
+            filter_uc=service.get("filter_uc"), encoding=service.get("encoding") or "utf-8",
+            metadata_cache=service.get("metadata_cache"), **manager_kwargs)
+        return {"metadata_file": service.get("metadata_file"), "handlers": len(handlers),
+                "seconds": time.perf_counter() - start}
+
+    def __call__(self, services: List[Dict[str, str]], instrument: Optional[str] = None,
+                 cold_start: bool = False) -> List[Dict[str, Any]]:
+        """
+        Generates the handlers of every service.
+
+        A failing service does not stop the others; all failures are raised together
+        once every service was processed. Anything printed while generating, such as
+        the progress of the metadata readers, is written to stderr.
+
+        Parameters
+        ----------
+        services : List[Dict[str, str]]
+            Options of each service.
+        instrument : str, optional
+            Log format ("json" or "emf") of the timing metrics emitted by the handlers.
+        cold_start : bool, optional
+            Whether the handlers report cold starts and their init duration.
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            One row per service, in the order of `services`.
+
+        Raises
+        ------
+        RuntimeError
+            If the generation of any service failed.
+        """
+        for service in services:
+            self.check_service(service)
+
+        # the metadata readers print their progress, which goes to stderr so that only the
+        # summary is written to stdout; redirected once here because stdout is shared by
+        # the worker threads
+        with redirect_stdout(sys.stderr), \
+                ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = [executor.submit(self.generate_service, service, instrument=instrument,
+                                       cold_start=cold_start)
+                       for service in services]
+        rows, errors = [], []
+        for service, future in zip(services, futures):
+            error = future.exception()
+            if error is not None:
+                errors.append(f"{service.get('metadata_file')}: {error}")
+            else:
+                rows.append(future.result())
+        if errors:
+            raise RuntimeError("Handlers could not be generated for "
+                               f"{len(errors)} services:\n" + "\n".join(errors))
+        return rows
+
+
+def format_services_generation(rows: List[Dict[str, Any]]) -> str:
+    """
+    Renders the rows returned by `LambdaServicesGenerator` as a text table.
+
+    Parameters
+    ----------
+    rows : List[Dict[str, Any]]
+        One row per service.
+
+    Returns
+    -------
+    str
+        Human-readable table, with the totals in the last line.
+    """
+    header = f"{'service':<48}{'handlers':>10}{'seconds':>10}"
+    lines = [header, "-" * len(header)]
+    for row in rows:
+        lines.append(f"{str(row['metadata_file']):<48}{row['handlers']:>10}"
+                     f"{row['seconds']:>10.3f}")
+    lines.append(f"{'total':<48}{sum(row['handlers'] for row in rows):>10}")
+    return "\n".join(lines)
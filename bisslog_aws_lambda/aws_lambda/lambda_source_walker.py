@@ -0,0 +1,320 @@
+"""
+Module for selecting the source files bundled into AWS Lambda packages.
+
+This module defines gitignore-style path patterns and a walker that traverses source
+folders once, pruning excluded directories so they are never descended into, and
+yielding the files that match the include patterns.
+"""
+import os
+import re
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+
+class PathPattern:
+    """
+    A single gitignore-style pattern.
+
+    Supported syntax: `*`, `?`, `[...]`, `**`, a leading `!` to negate, a trailing `/`
+    to match directories only and a leading or inner `/` to anchor the pattern to its
+    base folder. Patterns without a slash match the name of an entry at any depth.
+
+    Parameters
+    ----------
+    pattern : str
+        Pattern as written in a `.gitignore` file or on the command line.
+    """
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        self.negated = pattern.startswith("!")
+        if self.negated:
+            pattern = pattern[1:]
+        self.dir_only = pattern.endswith("/")
+        pattern = pattern.rstrip("/")
+        self.anchored = "/" in pattern
+        self._regex = re.compile(self._translate(pattern.lstrip("/")) + r"\Z")
+
+    @staticmethod
+    def _translate(pattern: str) -> str:
+        """
+        Translates a glob pattern into a regular expression where `*` stops at `/`.
+
+        Parameters
+        ----------
+        pattern : str
+            Glob pattern.
+
+        Returns
+        -------
+        str
+            Equivalent regular expression.
+        """
+        i, n = 0, len(pattern)
+        res = []
+        while i < n:
+            char = pattern[i]
+            if pattern.startswith("**/", i):
+                res.append("(?:.*/)?")
+                i += 3
+                continue
+            if pattern.startswith("**", i):
+                res.append(".*")
+                i += 2
+                continue
+            if char == "*":
+                res.append("[^/]*")
+            elif char == "?":
+                res.append("[^/]")
+            elif char == "[" and "]" in pattern[i + 2:]:
+                end = pattern.index("]", i + 2)
+                content = pattern[i + 1:end].replace("\\", "\\\\")
+                if content.startswith("!"):
+                    content = "^" + content[1:]
+                res.append(f"[{content}]")
+                i = end
+            else:
+                res.append(re.escape(char))
+            i += 1
+        return "".join(res)
+
+    def matches(self, rel_path: str, is_dir: bool) -> bool:
+        """
+        Checks whether the pattern matches a path.
+
+        Parameters
+        ----------
+        rel_path : str
+            POSIX path relative to the base folder of the pattern.
+        is_dir : bool
+            Whether the path is a directory.
+
+        Returns
+        -------
+        bool
+            True if the pattern matches the path.
+        """
+        if self.dir_only and not is_dir:
+            return False
+        target = rel_path if self.anchored else rel_path.rpartition("/")[2]
+        return self._regex.match(target) is not None
+
+
+class PathRules:
+    """
+    An ordered set of gitignore-style patterns where the last match wins.
+
+    Parameters
+    ----------
+    patterns : Iterable[str]
+        Patterns in priority order (later patterns override earlier ones).
+    base : str, optional
+        POSIX path of the folder the patterns are relative to ("" for the root).
+    """
+
+    def __init__(self, patterns: Iterable[str], base: str = ""):
+        self.base = base
+        self.patterns = [
+            PathPattern(pattern) for pattern in (p.strip() for p in patterns)
+            if pattern and not pattern.startswith("#")
+        ]
+
+    @classmethod
+    def from_file(cls, path: str, base: str = "") -> "PathRules":
+        """
+        Loads rules from an ignore file such as `.gitignore`.
+
+        Parameters
+        ----------
+        path : str
+            Path to the ignore file.
+        base : str, optional
+            POSIX path of the folder containing the file.
+
+        Returns
+        -------
+        PathRules
+            Rules read from the file.
+        """
+        with open(path, encoding="utf-8") as f:
+            return cls(f.read().splitlines(), base)
+
+    def match(self, rel_path: str, is_dir: bool) -> Optional[bool]:
+        """
+        Evaluates the rules against a path.
+
+        Parameters
+        ----------
+        rel_path : str
+            POSIX path relative to the archive root.
+        is_dir : bool
+            Whether the path is a directory.
+
+        Returns
+        -------
+        Optional[bool]
+            True if the last matching pattern is positive, False if it is negated,
+            and None if no pattern applies.
+        """
+        if self.base:
+            if not rel_path.startswith(self.base + "/"):
+                return None
+            rel_path = rel_path[len(self.base) + 1:]
+        result = None
+        for pattern in self.patterns:
+            if pattern.matches(rel_path, is_dir):
+                result = not pattern.negated
+        return result
+
+
+class LambdaSourceWalker:
+    """
+    Walks source folders and yields the files to bundle in a Lambda package.
+
+    Each folder is scanned once with `os.scandir`, whatever the number of patterns.
+    Directories matched by the exclude patterns (or by ignore files) are pruned, so
+    their content is never listed. Symbolic links to directories are not followed,
+    since they may point back to an ancestor, and symbolic links to files are only
+    bundled when their target is inside the source folder.
+
+    Parameters
+    ----------
+    include : Sequence[str], optional
+        Patterns of files to bundle (default: `("*.py",)`).
+    exclude : Sequence[str], optional
+        Patterns of files and folders to leave out, e.g. `("tests/", "*_test.py")`.
+        `__pycache__` folders are always excluded.
+    use_ignore_files : bool, optional
+        Whether to honour `.gitignore` and `.lambdaignore` files found in the archive
+        root (the parent of each source folder) and in the walked folders.
+    ignore_file_names : Sequence[str], optional
+        Names of the ignore files to honour.
+    assets : Sequence[str], optional
+        Patterns of non-Python files loaded at runtime (JSON schemas, templates, shared
+        libraries...) to bundle as well. They are matched in the same walk as `include`.
+    """
+
+    def __init__(self, include: Sequence[str] = ("*.py",), exclude: Sequence[str] = (),
+                 use_ignore_files: bool = False,
+                 ignore_file_names: Sequence[str] = (".gitignore", ".lambdaignore"),
+                 assets: Sequence[str] = ()):
+        self.include = PathRules([*include, *assets])
+        self.exclude = PathRules(["__pycache__/", *exclude])
+        self.use_ignore_files = use_ignore_files
+        self.ignore_file_names = tuple(ignore_file_names)
+
+    def _load_ignore_files(self, folder: str, base: str) -> List[PathRules]:
+        """
+        Loads the ignore files present in a folder.
+
+        Parameters
+        ----------
+        folder : str
+            Folder to inspect.
+        base : str
+            POSIX path of the folder relative to the archive root.
+
+        Returns
+        -------
+        List[PathRules]
+            Rules of each ignore file found.
+        """
+        if not self.use_ignore_files:
+            return []
+        rules = []
+        for name in self.ignore_file_names:
+            path = os.path.join(folder, name)
+            if os.path.isfile(path):
+                rules.append(PathRules.from_file(path, base))
+        return rules
+
+    def _is_excluded(self, rel_path: str, is_dir: bool, rule_sets: List[PathRules]) -> bool:
+        """
+        Checks whether a path is excluded.
+
+        Ignore files are evaluated from the outermost to the innermost, and the explicit
+        exclude patterns have the final say.
+
+        Parameters
+        ----------
+        rel_path : str
+            POSIX path relative to the archive root.
+        is_dir : bool
+            Whether the path is a directory.
+        rule_sets : List[PathRules]
+            Rules of the ignore files, from outermost to innermost.
+
+        Returns
+        -------
+        bool
+            True if the path must be left out.
+        """
+        excluded = False
+        for rules in [*rule_sets, self.exclude]:
+            result = rules.match(rel_path, is_dir)
+            if result is not None:
+                excluded = result
+        return excluded
+
+    def _walk(self, folder: str, rel_folder: str, rule_sets: List[PathRules],
+              root: Path) -> Iterator[Tuple[Path, str]]:
+        """
+        Recursively yields the included files of a folder.
+
+        Parameters
+        ----------
+        folder : str
+            Folder to scan.
+        rel_folder : str
+            POSIX path of the folder relative to the archive root.
+        rule_sets : List[PathRules]
+            Rules of the ignore files inherited from parent folders.
+        root : Path
+            Resolved source folder, the only place symbolic links may point to.
+
+        Yields
+        ------
+        Tuple[Path, str]
+            The file path and its path inside the archive.
+        """
+        rule_sets = rule_sets + self._load_ignore_files(folder, rel_folder)
+        with os.scandir(folder) as it:
+            entries = sorted(it, key=lambda e: e.name)
+        subfolders = []
+        for entry in entries:
+            rel_path = f"{rel_folder}/{entry.name}"
+            is_dir = entry.is_dir()
+            if entry.is_symlink() and (
+                    is_dir or root not in Path(os.path.realpath(entry.path)).parents):
+                continue
+            if self._is_excluded(rel_path, is_dir, rule_sets):
+                continue
+            if is_dir:
+                subfolders.append((entry.path, rel_path))
+            elif self.include.match(rel_path, False):
+                yield Path(entry.path), rel_path
+        for subfolder, rel_subfolder in subfolders:
+            yield from self._walk(subfolder, rel_subfolder, rule_sets, root)
+
+    def __call__(self, src_path: Path) -> Iterator[Tuple[Path, str]]:
+        """
+        Yields the files of a source folder to include in the archive.
+
+        Paths inside the archive are relative to the parent of `src_path`, so the
+        source folder itself is kept as the top-level package.
+
+        Parameters
+        ----------
+        src_path : Path
+            Resolved source folder.
+
+        Yields
+        ------
+        Tuple[Path, str]
+            The file path and its path inside the archive.
+        """
+        rule_sets = self._load_ignore_files(str(src_path.parent), "")
+        if self._is_excluded(src_path.name, True, rule_sets):
+            return
+        yield from self._walk(str(src_path), src_path.name, rule_sets,
+                              Path(os.path.realpath(src_path)))
@@ -0,0 +1,322 @@
+"""
+Module for vendoring third-party dependencies into AWS Lambda packages.
+
+This module defines a class that resolves requirements against a local wheelhouse
+(a folder of `.whl` files, e.g. produced by `pip download` or `pip wheel`), and
+extracts the matching wheels into a content-addressed cache so they can be reused
+across handlers and packaging runs without touching the network.
+"""
+import hashlib
+import os
+import re
+import shutil
+import zipfile
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+from uuid import uuid4
+
+
+class LambdaWheelVendor:
+    """
+    Resolves requirements to local wheels and provides their extracted contents.
+
+    Wheels are extracted once into `cache_dir/<sha256 of the wheel>` and reused by
+    every subsequent packaging run. Requirements are matched by normalized project
+    name and, optionally, an exact `==` version pin. Other version specifiers are not
+    evaluated, and dependencies are not resolved transitively: the requirements are
+    expected to be a complete, pinned set (e.g. the output of `pip freeze`) and the
+    wheelhouse is expected to be built for the Lambda platform. When it holds wheels
+    for several platforms, `platforms` selects the ones matching the Lambda
+    architecture; pure Python wheels (platform "any") always match.
+
+    Parameters
+    ----------
+    wheelhouse : str
+        Folder containing the `.whl` files.
+    requirements : Iterable[str]
+        Requirement lines, e.g. `["bisslog==0.0.9", "bisslog-schema"]`.
+    cache_dir : str, optional
+        Folder where extracted wheels are cached. Defaults to the environment variable
+        `BISSLOG_WHEEL_CACHE` or `~/.cache/bisslog_aws_lambda/wheels`.
+    platforms : Iterable[str], optional
+        Accepted platform tags, e.g. `["manylinux2014_aarch64"]`. Wheels of every
+        platform are accepted by default.
+    """
+
+    _wheel_filename_regex = re.compile(
+        r"^(?P<name>[^-]+)-(?P<version>[^-]+)(-\d[^-]*)?-[^-]+-[^-]+-(?P<platform>[^-]+)\.whl$")
+    _requirement_regex = re.compile(
+        r"^(?P<name>[A-Za-z0-9][A-Za-z0-9._-]*)\s*(\[[^]]*])?\s*(==\s*(?P<version>[^\s,;]+))?")
+
+    def __init__(self, wheelhouse: str, requirements: Iterable[str],
+                 cache_dir: Optional[str] = None, *, platforms: Optional[Iterable[str]] = None):
+        self.wheelhouse = Path(wheelhouse).resolve()
+        if not self.wheelhouse.is_dir():
+            raise FileNotFoundError(f"Wheelhouse not found: {wheelhouse}")
+        self.requirements = list(requirements)
+        self.cache_dir = Path(cache_dir or self._find_cache_dir()).resolve()
+        self.platforms = frozenset(platforms) if platforms else None
+        self._extracted: Optional[List[Path]] = None
+        self._digests: Dict[Tuple[str, int, int], str] = {}
+
+    @staticmethod
+    def _find_cache_dir() -> str:
+        """
+        Determines the default cache folder for extracted wheels.
+
+        Returns
+        -------
+        str
+            The resolved path to the cache folder.
+        """
+        return os.getenv("BISSLOG_WHEEL_CACHE") or os.path.join(
+            os.path.expanduser("~"), ".cache", "bisslog_aws_lambda", "wheels")
+
+    @staticmethod
+    def normalize_name(name: str) -> str:
+        """
+        Normalizes a project name as described in PEP 503.
+
+        Parameters
+        ----------
+        name : str
+            Project name as written in a requirement or wheel filename.
+
+        Returns
+        -------
+        str
+            Lowercase name with runs of `-`, `_` and `.` replaced by `-`.
+        """
+        return re.sub(r"[-_.]+", "-", name).lower()
+
+    @staticmethod
+    def read_requirements_file(path: str, encoding: str = "utf-8") -> List[str]:
+        """
+        Reads requirement lines from a requirements file.
+
+        Comments, blank lines and pip options (lines starting with `-`) are skipped.
+
+        Parameters
+        ----------
+        path : str
+            Path to the requirements file.
+        encoding : str, optional
+            File encoding (default: "utf-8").
+
+        Returns
+        -------
+        List[str]
+            Requirement lines.
+        """
+        requirements = []
+        with open(path, encoding=encoding) as f:
+            for line in f:
+                line = line.split("#", 1)[0].strip()
+                if line and not line.startswith("-"):
+                    requirements.append(line)
+        return requirements
+
+    def _parse_requirement(self, requirement: str) -> Tuple[str, Optional[str]]:
+        """
+        Extracts the normalized name and pinned version of a requirement.
+
+        Parameters
+        ----------
+        requirement : str
+            Requirement line.
+
+        Returns
+        -------
+        Tuple[str, Optional[str]]
+            The normalized project name and the `==` version, if any.
+
+        Raises
+        ------
+        ValueError
+            If the requirement cannot be parsed.
+        """
+        match = self._requirement_regex.match(requirement.split(";", 1)[0].strip())
+        if match is None:
+            raise ValueError(f"Invalid requirement: '{requirement}'")
+        return self.normalize_name(match.group("name")), match.group("version")
+
+    def _index_wheelhouse(self) -> Dict[str, List[Tuple[str, str, Path]]]:
+        """
+        Indexes the wheels of the accepted platforms by normalized project name.
+
+        Returns
+        -------
+        Dict[str, List[Tuple[str, str, Path]]]
+            Mapping of project name to `(version, platform tag, wheel path)` tuples,
+            sorted by filename.
+        """
+        index: Dict[str, List[Tuple[str, str, Path]]] = {}
+        for entry in sorted(os.scandir(self.wheelhouse), key=lambda entry: entry.name):
+            match = self._wheel_filename_regex.match(entry.name)
+            if match is None or not entry.is_file():
+                continue
+            platform = match.group("platform")
+            # compressed tag sets such as "manylinux_2_17_x86_64.manylinux2014_x86_64"
+            tags = set(platform.split("."))
+            if self.platforms is not None and "any" not in tags and not tags & self.platforms:
+                continue
+            name = self.normalize_name(match.group("name"))
+            index.setdefault(name, []).append(
+                (match.group("version"), platform, Path(entry.path)))
+        return index
+
+    def resolve(self) -> List[Path]:
+        """
+        Resolves every requirement to a wheel of the wheelhouse.
+
+        Returns
+        -------
+        List[Path]
+            Paths of the selected wheels, in requirement order.
+
+        Raises
+        ------
+        FileNotFoundError
+            If no wheel matches a requirement.
+        ValueError
+            If an unpinned requirement matches several versions, or a requirement
+            matches wheels of several accepted platforms.
+        """
+        index = self._index_wheelhouse()
+        wheels = []
+        for requirement in self.requirements:
+            name, version = self._parse_requirement(requirement)
+            candidates = [
+                candidate for candidate in index.get(name, [])
+                if version is None or candidate[0] == version
+            ]
+            if not candidates:
+                raise FileNotFoundError(
+                    f"No wheel found in {self.wheelhouse} for requirement '{requirement}'")
+            if len({candidate[0] for candidate in candidates}) > 1:
+                raise ValueError(
+                    f"Several wheels match requirement '{requirement}': "
+                    f"{[candidate[2].name for candidate in candidates]}. "
+                    "Pin an exact version.")
+            if len(candidates) > 1:
+                raise ValueError(
+                    f"Wheels of several platforms match requirement '{requirement}': "
+                    f"{[candidate[1] for candidate in candidates]}. Select the target "
+                    "platform tag.")
+            wheels.append(candidates[0][2])
+        return wheels
+
+    def _digest(self, wheel: Path) -> str:
+        """
+        Computes the SHA-256 of a wheel, memoized by path, size and modification time.
+
+        Parameters
+        ----------
+        wheel : Path
+            Path to the wheel file.
+
+        Returns
+        -------
+        str
+            Hexadecimal digest of the wheel content.
+        """
+        stat = wheel.stat()
+        key = (str(wheel), stat.st_size, stat.st_mtime_ns)
+        if key not in self._digests:
+            digest = hashlib.sha256()
+            with open(wheel, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+            self._digests[key] = digest.hexdigest()
+        return self._digests[key]
+
+    @staticmethod
+    def _install_path(member: str) -> Optional[str]:
+        """
+        Maps a wheel member to its path once installed in `site-packages`.
+
+        Parameters
+        ----------
+        member : str
+            Name of the member inside the wheel.
+
+        Returns
+        -------
+        Optional[str]
+            Installed relative path, or None if the member is not importable
+            (scripts, headers and data files).
+        """
+        first, _, rest = member.partition("/")
+        if not first.endswith(".data"):
+            return member
+        scheme, _, path = rest.partition("/")
+        if scheme in ("purelib", "platlib") and path:
+            return path
+        return None
+
+    def extract(self, wheel: Path) -> Path:
+        """
+        Extracts a wheel into the cache, unless it was already extracted.
+
+        Extraction happens in a temporary folder that is renamed into place, so
+        concurrent runs never observe a partially extracted wheel.
+
+        Parameters
+        ----------
+        wheel : Path
+            Path to the wheel file.
+
+        Returns
+        -------
+        Path
+            Folder with the installed layout of the wheel.
+
+        Raises
+        ------
+        ValueError
+            If a member of the wheel would be written outside the extraction folder.
+        """
+        target = self.cache_dir / self._digest(wheel)
+        if target.is_dir():
+            return target
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        partial = self.cache_dir / f".{target.name}.{uuid4().hex}.tmp"
+        partial_root = partial.resolve()
+        try:
+            with zipfile.ZipFile(wheel) as wheel_zip:
+                for member in wheel_zip.infolist():
+                    install_path = self._install_path(member.filename)
+                    if install_path is None or member.is_dir():
+                        continue
+                    destination = partial.joinpath(*install_path.split("/")).resolve()
+                    if partial_root not in destination.parents:
+                        raise ValueError(f"Wheel {wheel.name} has a member outside its "
+                                         f"install folder: '{member.filename}'")
+                    destination.parent.mkdir(parents=True, exist_ok=True)
+                    with wheel_zip.open(member) as src, open(destination, "wb") as dst:
+                        shutil.copyfileobj(src, dst)
+            try:
+                os.replace(partial, target)
+            except OSError:
+                if not target.is_dir():
+                    raise
+        finally:
+            if partial.exists():
+                shutil.rmtree(partial)
+        return target
+
+    def __call__(self) -> List[Path]:
+        """
+        Resolves the requirements and returns the extracted wheel folders.
+
+        The result is memoized, so packaging several handlers resolves and
+        extracts the wheels only once.
+
+        Returns
+        -------
+        List[Path]
+            Folders whose content must be placed at the root of the Lambda package.
+        """
+        if self._extracted is None:
+            self._extracted = [self.extract(wheel) for wheel in self.resolve()]
+        return self._extracted
@@ -0,0 +1,173 @@
+"""
+Module defining the compression strategy of AWS Lambda deployment packages.
+
+Lambda decompresses the deployment package on every cold start, while build time is
+dominated by compression. This module provides a configurable strategy that decides,
+per archive entry, whether it is stored or deflated and at which level.
+"""
+import zipfile
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+PRECOMPRESSED_EXTENSIONS = frozenset({
+    ".zip", ".whl", ".jar", ".gz", ".tgz", ".bz2", ".xz", ".zst", ".lz4",
+    ".png", ".jpg", ".jpeg", ".gif", ".webp", ".mp3", ".mp4", ".pdf",
+})
+
+
+@dataclass
+class LambdaZipCompression:
+    """
+    Compression strategy applied to each entry of a Lambda zip.
+
+    Rules are evaluated in order: per-extension rules, already-compressed extensions,
+    the size threshold and finally the default method.
+
+    Attributes
+    ----------
+    method : str
+        Default method, either "deflate" or "store".
+    level : Optional[int]
+        Default deflate level (0-9). None uses zlib's default.
+    store_extensions : FrozenSet[str]
+        Extensions of already-compressed files that are always stored.
+    store_larger_than : Optional[int]
+        Files bigger than this many bytes are stored instead of deflated.
+    extension_rules : Dict[str, Tuple[str, Optional[int]]]
+        Method and level per file extension, e.g. `{".json": ("deflate", 9)}`.
+    """
+    method: str = "deflate"
+    level: Optional[int] = None
+    store_extensions: FrozenSet[str] = PRECOMPRESSED_EXTENSIONS
+    store_larger_than: Optional[int] = None
+    extension_rules: Dict[str, Tuple[str, Optional[int]]] = field(default_factory=dict)
+
+    methods = {"deflate": zipfile.ZIP_DEFLATED, "store": zipfile.ZIP_STORED}
+
+    def __post_init__(self):
+        for method, level in [(self.method, self.level), *self.extension_rules.values()]:
+            if method not in self.methods:
+                raise ValueError(
+                    f"Unknown compression method '{method}', expected one of "
+                    f"{sorted(self.methods)}")
+            if level is not None and not 0 <= level <= 9:
+                raise ValueError(f"Invalid compression level {level}, expected 0-9")
+        self.extension_rules = {
+            self._normalize_extension(extension): rule
+            for extension, rule in self.extension_rules.items()
+        }
+
+    @staticmethod
+    def _normalize_extension(extension: str) -> str:
+        """
+        Normalizes an extension to lowercase with a leading dot.
+
+        Parameters
+        ----------
+        extension : str
+            Extension with or without the leading dot.
+
+        Returns
+        -------
+        str
+            Normalized extension.
+        """
+        extension = extension.lower()
+        return extension if extension.startswith(".") else "." + extension
+
+    @classmethod
+    def parse_rule(cls, rule: str) -> Tuple[str, Tuple[str, Optional[int]]]:
+        """
+        Parses a per-extension rule written as `EXT=METHOD[:LEVEL]`.
+
+        Parameters
+        ----------
+        rule : str
+            Rule such as ".json=deflate:9" or "so=store".
+
+        Returns
+        -------
+        Tuple[str, Tuple[str, Optional[int]]]
+            The normalized extension and its `(method, level)` pair.
+
+        Raises
+        ------
+        ValueError
+            If the rule is malformed.
+        """
+        extension, sep, spec = rule.partition("=")
+        if not sep or not extension or not spec:
+            raise ValueError(f"Invalid compression rule '{rule}', expected EXT=METHOD[:LEVEL]")
+        method, _, level = spec.partition(":")
+        return cls._normalize_extension(extension), (method, int(level) if level else None)
+
+    def resolve(self, arcname: str, size: int) -> Tuple[int, Optional[int]]:
+        """
+        Decides how an archive entry is compressed.
+
+        Parameters
+        ----------
+        arcname : str
+            Path of the entry inside the archive.
+        size : int
+            Uncompressed size of the entry in bytes.
+
+        Returns
+        -------
+        Tuple[int, Optional[int]]
+            The `zipfile` compression constant and the compression level.
+        """
+        _, dot, extension = arcname.rpartition("/")[2].rpartition(".")
+        extension = "." + extension.lower() if dot else ""
+        if extension in self.extension_rules:
+            method, level = self.extension_rules[extension]
+        elif extension in self.store_extensions:
+            method, level = "store", None
+        elif self.store_larger_than is not None and size > self.store_larger_than:
+            method, level = "store", None
+        else:
+            method, level = self.method, self.level
+        if method == "store":
+            return zipfile.ZIP_STORED, None
+        return self.methods[method], level
+
+
+def default_benchmark_strategies() -> Dict[str, LambdaZipCompression]:
+    """
+    Builds the compression strategies compared by the benchmark mode.
+
+    Returns
+    -------
+    Dict[str, LambdaZipCompression]
+        Strategies by label.
+    """
+    return {
+        "store": LambdaZipCompression(method="store"),
+        "deflate-1": LambdaZipCompression(level=1),
+        "deflate-6": LambdaZipCompression(level=6),
+        "deflate-9": LambdaZipCompression(level=9),
+    }
+
+
+def format_compression_benchmark(rows: List[dict]) -> str:
+    """
+    Renders compression benchmark results as a text table.
+
+    Parameters
+    ----------
+    rows : List[dict]
+        Results produced by `LambdaAWSPackager.benchmark_compression`.
+
+    Returns
+    -------
+    str
+        Human-readable table.
+    """
+    header = (f"{'strategy':<24}{'zip bytes':>14}{'unzipped bytes':>16}"
+              f"{'build ms':>12}{'extract ms':>12}")
+    lines = [header, "-" * len(header)]
+    for row in rows:
+        lines.append(
+            f"{row['strategy']:<24}{row['zip_size']:>14}{row['uncompressed_size']:>16}"
+            f"{row['build_ms']:>12.2f}{row['extract_ms']:>12.2f}")
+    return "\n".join(lines)
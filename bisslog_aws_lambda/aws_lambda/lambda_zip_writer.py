@@ -0,0 +1,133 @@
+"""
+Module for writing entries into AWS Lambda deployment archives.
+
+This module defines a class wrapping an open `zipfile.ZipFile` that applies the
+packaging options shared by every entry: the compression strategy, optional
+bytecode compilation and source stripping, and Lambda-compatible permissions.
+"""
+import time
+import zipfile
+from pathlib import Path
+from typing import Iterable, Optional
+
+from .lambda_bytecode_compiler import LambdaBytecodeCompiler
+from .lambda_zip_compression import LambdaZipCompression
+
+
+class LambdaZipWriter:
+    """
+    Writes files into a Lambda deployment archive.
+
+    Parameters
+    ----------
+    zipf : zipfile.ZipFile
+        Archive opened for writing.
+    bytecode_compiler : LambdaBytecodeCompiler, optional
+        When given, Python files are also written as precompiled bytecode.
+    strip_sources : bool, optional
+        Whether to leave Python sources out of the archive, shipping only bytecode.
+    compression : LambdaZipCompression, optional
+        Compression strategy (defaults to deflate at zlib's default level).
+    """
+
+    def __init__(self, zipf: zipfile.ZipFile,
+                 bytecode_compiler: Optional[LambdaBytecodeCompiler] = None,
+                 strip_sources: bool = False,
+                 compression: Optional[LambdaZipCompression] = None):
+        if strip_sources and bytecode_compiler is None:
+            raise ValueError("strip_sources requires a bytecode_compiler")
+        self.zipf = zipf
+        self.bytecode_compiler = bytecode_compiler
+        self.strip_sources = strip_sources
+        self.compression = compression or LambdaZipCompression()
+
+    def write_file(self, path: Path, arcname: str) -> None:
+        """
+        Copies a file from disk into the archive.
+
+        Parameters
+        ----------
+        path : Path
+            File to include.
+        arcname : str
+            Path of the file inside the archive.
+        """
+        compress_type, compress_level = self.compression.resolve(arcname, path.stat().st_size)
+        self.zipf.write(path, arcname=arcname, compress_type=compress_type,
+                        compresslevel=compress_level)
+
+    def writestr(self, arcname: str, content: bytes) -> None:
+        """
+        Writes in-memory content into the archive as a world-readable file.
+
+        `ZipFile.writestr` defaults to owner-only permissions, which the Lambda
+        runtime cannot read once the package is extracted.
+
+        Parameters
+        ----------
+        arcname : str
+            Path of the file inside the archive.
+        content : bytes
+            File content.
+        """
+        compress_type, compress_level = self.compression.resolve(arcname, len(content))
+        zip_info = zipfile.ZipInfo(arcname, date_time=time.localtime(time.time())[:6])
+        zip_info.compress_type = compress_type
+        zip_info.external_attr = 0o644 << 16
+        self.zipf.writestr(zip_info, content, compresslevel=compress_level)
+
+    def write_python_source(self, source: bytes, arcname: str, keep_source: bool = False) -> None:
+        """
+        Writes an in-memory Python source into the archive, as source and/or bytecode.
+
+        Parameters
+        ----------
+        source : bytes
+            Python source code.
+        arcname : str
+            Path of the source inside the archive.
+        keep_source : bool, optional
+            Whether to keep the source even when sources are stripped.
+        """
+        sourceless = self.strip_sources and not keep_source
+        if self.bytecode_compiler is not None:
+            self.writestr(self.bytecode_compiler.pyc_arcname(arcname, sourceless),
+                          self.bytecode_compiler(source, arcname))
+        if not sourceless:
+            self.writestr(arcname, source)
+
+    def write_python_file(self, path: Path, arcname: str) -> None:
+        """
+        Writes a Python source file into the archive, as source and/or bytecode.
+
+        Parameters
+        ----------
+        path : Path
+            Source file to include.
+        arcname : str
+            Path of the source inside the archive.
+        """
+        if self.bytecode_compiler is not None:
+            self.writestr(self.bytecode_compiler.pyc_arcname(arcname, self.strip_sources),
+                          self.bytecode_compiler(path.read_bytes(), arcname))
+        if not self.strip_sources:
+            self.write_file(path, arcname)
+
+    def write_vendored(self, vendored_folders: Iterable[Path]) -> None:
+        """
+        Writes the content of extracted wheels at the root of the archive.
+
+        Parameters
+        ----------
+        vendored_folders : Iterable[Path]
+            Folders with the installed layout of each wheel.
+        """
+        for vendored_folder in vendored_folders:
+            for file in sorted(vendored_folder.rglob("*")):
+                if not file.is_file() or "__pycache__" in file.parts:
+                    continue
+                arcname = file.relative_to(vendored_folder).as_posix()
+                if file.suffix == ".py":
+                    self.write_python_file(file, arcname)
+                else:
+                    self.write_file(file, arcname)
@@ -0,0 +1,29 @@
+"""
+Module with the statistics shared by the handler benchmark and the event replayer.
+
+It only depends on the standard library, so replay worker processes can import it
+without loading the handler generators or `bisslog_schema`.
+"""
+import math
+from typing import List
+
+
+def percentile(sorted_values: List[float], percent: float) -> float:
+    """
+    Returns the nearest-rank percentile of sorted values.
+
+    Parameters
+    ----------
+    sorted_values : List[float]
+        Values in ascending order, at least one.
+    percent : float
+        Percentile between 0 and 100.
+
+    Returns
+    -------
+    float
+        The smallest value such that at least `percent` percent of the values are lower
+        or equal.
+    """
+    rank = math.ceil(percent / 100 * len(sorted_values))
+    return sorted_values[max(0, min(len(sorted_values), rank) - 1)]
@@ -0,0 +1,76 @@
+"""
+Module for packaging generated AWS Lambda handlers without saving them first.
+
+This module defines a resolver that receives the handler code produced by the
+generation manager and writes it straight into a deployment zip as
+`lambda_function.py`, fusing `generate_lambda_handlers` and `generate_lambda_zips`.
+"""
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+from bisslog_schema.schema import ServiceInfo
+from bisslog_schema.use_case_code_inspector.use_case_code_metadata import UseCaseCodeInfo
+
+from .lambda_aws_packager import LambdaAWSPackager, lambda_aws_packager
+from .lambda_source_walker import LambdaSourceWalker
+from .save_lambda_handler_resolver import LambdaHandlerResolver
+
+
+class PackageLambdaHandlerResolver(LambdaHandlerResolver):
+    """
+    Resolver that packages each handler string into its deployment zip.
+
+    The zip of a use case is named as the one `generate_lambda_zips` builds from the
+    saved handler, `{use_case}_handler.zip`. Source folders are walked on the first
+    handler and the listing is reused for the following ones, so a resolver should be
+    created per run.
+
+    Parameters
+    ----------
+    src_folders : Union[str, List[str]], optional
+        Folders containing the source files bundled in every zip (default is "src").
+    source_walker : LambdaSourceWalker, optional
+        Selects the files of each source folder (default: every `.py` file).
+    packager : LambdaAWSPackager, optional
+        Packager building the zips (default: `lambda_aws_packager`).
+    """
+
+    def __init__(self, src_folders: Union[str, List[str]] = "src",
+                 source_walker: Optional[LambdaSourceWalker] = None,
+                 packager: Optional[LambdaAWSPackager] = None):
+        self.src_folders = src_folders
+        self.source_walker = source_walker
+        self.packager = packager or lambda_aws_packager
+        self.zip_paths: List[str] = []
+        self._sources: Optional[List[Tuple[Path, str]]] = None
+
+    def __call__(self, service_info: ServiceInfo,
+                 use_case_code_info: UseCaseCodeInfo,
+                 handler_str: str, **options) -> str:
+        """
+        Writes the handler string and the shared sources into a zip file.
+
+        Parameters
+        ----------
+        service_info : ServiceInfo
+            The service metadata.
+        use_case_code_info : UseCaseCodeInfo
+            The code information of the use case.
+        handler_str : str
+            The generated handler code, written as `lambda_function.py`.
+        options : Any
+            Packaging options of `LambdaAWSPackager.package_handler_source`, such as
+            `output_dir` or `compression`.
+
+        Returns
+        -------
+        str
+            A message indicating where the zip was written.
+        """
+        if self._sources is None:
+            self._sources = self.packager.scan_sources(self.src_folders, None,
+                                                       self.source_walker)
+        zip_path = self.packager.package_handler_source(
+            handler_str, f"{use_case_code_info.name}_handler.zip", self._sources, **options)
+        self.zip_paths.append(zip_path)
+        return f"Handler packaged to {Path(zip_path).name}"
@@ -0,0 +1,154 @@
+"""
+Module for caching the service metadata read by the handler generation commands.
+
+This module defines a callable class that wraps `read_full_service_metadata` with an
+on-disk cache, keyed by the content of the metadata file and the modification times
+of the use case sources, so repeated commands skip parsing and code discovery when
+nothing changed.
+"""
+import hashlib
+import os
+import pickle
+import sys
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import bisslog_schema
+from bisslog_schema import read_full_service_metadata
+from bisslog_schema.schema.read_metadata import _find_path
+from bisslog_schema.use_case_code_inspector import PackageTreeReader
+
+
+class ServiceMetadataCache:
+    """
+    Reads the full service metadata through a persistent cache.
+
+    The cache key covers the resolved metadata file and its SHA-256, the modification
+    time and size of every Python file under the use cases folder, the encoding and
+    the installed `bisslog_schema` package. Any change produces a miss, and the cache
+    file is rewritten with the fresh result. Changes in modules imported by the use
+    cases from outside their folder are not tracked.
+
+    Parameters
+    ----------
+    cache_file : str
+        Path of the cache file. Its folder is created when missing.
+    reader : Callable[..., Any], optional
+        Function reading the metadata on a miss (default: `read_full_service_metadata`).
+    """
+
+    _format_version = 1
+
+    def __init__(self, cache_file: str, reader: Optional[Callable[..., Any]] = None):
+        self.cache_file = Path(cache_file)
+        self.reader = reader or read_full_service_metadata
+
+    @staticmethod
+    def _use_cases_folder(use_cases_folder_path: Optional[str]) -> Path:
+        """Resolves the folder of the use cases package as bisslog_schema does."""
+        # pylint: disable=protected-access
+        module_path = PackageTreeReader._find_module_path(use_cases_folder_path)
+        return Path(module_path.replace(".", "/"))
+
+    def fingerprint(self, metadata_file: Optional[str] = None,
+                    use_cases_folder_path: Optional[str] = None,
+                    encoding: str = "utf-8", **reader_kwargs) -> str:
+        """
+        Computes the cache key of a metadata read.
+
+        Parameters
+        ----------
+        metadata_file : str, optional
+            Path to the metadata file, resolved to the default locations when None.
+        use_cases_folder_path : str, optional
+            Folder or package of the use cases, resolved to the default locations when
+            None.
+        encoding : str, optional
+            File encoding for reading metadata (default: "utf-8").
+        reader_kwargs : Any
+            Additional keyword arguments of the reader.
+
+        Returns
+        -------
+        str
+            Hex digest identifying the inputs of the read.
+
+        Raises
+        ------
+        ValueError
+            If the metadata file or the use cases folder cannot be found.
+        """
+        metadata_path = Path(_find_path(metadata_file)).resolve()
+        digest = hashlib.sha256()
+        digest.update(repr((self._format_version, bisslog_schema.__file__,
+                            os.stat(bisslog_schema.__file__).st_mtime_ns, encoding,
+                            str(metadata_path), sorted(reader_kwargs.items()))).encode())
+        digest.update(hashlib.sha256(metadata_path.read_bytes()).digest())
+
+        folder = self._use_cases_folder(use_cases_folder_path).resolve()
+        digest.update(str(folder).encode())
+        for root, dirs, files in os.walk(folder):
+            dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+            for name in sorted(files):
+                if name.endswith(".py"):
+                    stat = os.stat(os.path.join(root, name))
+                    digest.update(repr((os.path.relpath(os.path.join(root, name), folder),
+                                        stat.st_mtime_ns, stat.st_size)).encode())
+        return digest.hexdigest()
+
+    def _load(self, key: str) -> Any:
+        """Returns the cached result stored under `key`, or None on a miss."""
+        try:
+            with open(self.cache_file, "rb") as file:
+                cached_key, result = pickle.load(file)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError,
+                ValueError, TypeError):
+            return None
+        return result if cached_key == key else None
+
+    def _store(self, key: str, result: Any) -> None:
+        """Writes `result` under `key`, replacing the cache file atomically."""
+        try:
+            payload = pickle.dumps((key, result), protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as error:
+            print(f"Service metadata could not be cached: {error}", file=sys.stderr)
+            return
+        self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = self.cache_file.with_name(self.cache_file.name + ".tmp")
+        tmp_file.write_bytes(payload)
+        os.replace(tmp_file, self.cache_file)
+
+    def __call__(self, metadata_file: Optional[str] = None,
+                 use_cases_folder_path: Optional[str] = None, *, encoding: str = "utf-8",
+                 **reader_kwargs):
+        """
+        Reads the full service metadata, from the cache when it is up to date.
+
+        Parameters
+        ----------
+        metadata_file : str, optional
+            Path to the metadata file (YAML/JSON).
+        use_cases_folder_path : str, optional
+            Directory where use case code is located.
+        encoding : str, optional
+            File encoding for reading metadata (default: "utf-8").
+        reader_kwargs : Any
+            Additional keyword arguments of the reader, such as a use case filter.
+            They are part of the cache key.
+
+        Returns
+        -------
+        ServiceInfoWithCode
+            Declared metadata and discovered use cases, as returned by the reader.
+        """
+        key = self.fingerprint(metadata_file, use_cases_folder_path, encoding,
+                               **reader_kwargs)
+        result = self._load(key)
+        if result is not None:
+            print(f"Using cached service metadata from {self.cache_file}", file=sys.stderr)
+            return result
+        result = self.reader(metadata_file=metadata_file,
+                             use_cases_folder_path=use_cases_folder_path, encoding=encoding,
+                             **reader_kwargs)
+        self._store(key, result)
+        return result
@@ -0,0 +1,94 @@
+"""
+Module for splitting handler generation and packaging across several machines.
+
+This module defines a predicate assigning every use case to one of `n` shards by a
+stable hash of its keyname, so each CI node can work on a disjoint subset and the
+union of all nodes matches a single-node run.
+"""
+import hashlib
+
+
+class ShardSelector:
+    """
+    Selects the use cases and handlers that belong to one shard.
+
+    Names are assigned with a SHA-256 hash, which does not depend on the machine, the
+    Python version or `PYTHONHASHSEED`, so every node computes the same partition.
+    Handler names are reduced to their use case keyname first, so the shard that
+    generates a handler is also the one that packages it.
+
+    Parameters
+    ----------
+    index : int
+        Shard handled by this node, starting at 1.
+    count : int
+        Total number of shards.
+
+    Raises
+    ------
+    ValueError
+        If `count` is lower than 1 or `index` is not between 1 and `count`.
+    """
+
+    handler_suffix = "_handler"
+
+    def __init__(self, index: int, count: int):
+        if count < 1 or not 1 <= index <= count:
+            raise ValueError(f"Invalid shard {index}/{count}, expected i/n with 1 <= i <= n")
+        self.index = index
+        self.count = count
+
+    @classmethod
+    def parse(cls, value: str) -> "ShardSelector":
+        """
+        Parses a shard given as "i/n", e.g. "2/4".
+
+        Parameters
+        ----------
+        value : str
+            Shard index and count separated by a slash.
+
+        Returns
+        -------
+        ShardSelector
+            Selector of the given shard.
+
+        Raises
+        ------
+        ValueError
+            If the value is not a valid shard.
+        """
+        index, sep, count = value.partition("/")
+        if not sep:
+            raise ValueError(f"Invalid shard '{value}', expected i/n")
+        try:
+            return cls(int(index), int(count))
+        except ValueError as error:
+            raise ValueError(f"Invalid shard '{value}', expected i/n with 1 <= i <= n") \
+                from error
+
+    def shard_of(self, name: str) -> int:
+        """
+        Computes the shard a use case or handler is assigned to.
+
+        Parameters
+        ----------
+        name : str
+            Use case keyname, or handler name ending in "_handler".
+
+        Returns
+        -------
+        int
+            Shard of the name, starting at 1.
+        """
+        if name.endswith(self.handler_suffix):
+            name = name[:-len(self.handler_suffix)]
+        digest = hashlib.sha256(name.encode("utf-8")).digest()
+        return int.from_bytes(digest[:8], "big") % self.count + 1
+
+    def __call__(self, name: str) -> bool:
+        """Tells whether `name` belongs to the shard of this selector."""
+        return self.shard_of(name) == self.index
+
+    def __str__(self) -> str:
+        return f"{self.index}/{self.count}"
@@ -0,0 +1,158 @@
+"""
+Module for discovering only the use cases selected by a name filter.
+
+This module defines a package tree reader that skips the modules whose name does not
+match the filter before importing them, and a metadata reader built on it, so that
+working on a single use case does not import the whole use case folder.
+"""
+import fnmatch
+import re
+from typing import Any, Callable, Optional
+
+from bisslog_schema.schema.read_metadata import read_service_metadata
+from bisslog_schema.service_metadata_with_code import ServiceInfoWithCode
+from bisslog_schema.use_case_code_inspector import PackageTreeReader
+from bisslog_schema.use_case_code_inspector.strategies.use_case_metadata_module_inspector import \
+    UseCaseMetadataModuleInspector
+
+_REGEX_PREFIX = "re:"
+_GLOB_PREFIX = "glob:"
+
+
+def use_case_matcher(pattern: str) -> Callable[[str], bool]:
+    """
+    Builds the predicate selecting use case keynames for a `--filter-uc` value.
+
+    Each pattern has a single interpretation: a pattern is a regular expression
+    searched in the keyname, so plain names match as substrings, unless it has a
+    "glob:" prefix, in which case the rest is a glob matched against the whole keyname.
+    A "re:" prefix is accepted and ignored.
+
+    Parameters
+    ----------
+    pattern : str
+        Regular expression or prefixed glob, e.g. "^get_", "^(get|list)_[a-z]+$" or
+        "glob:get_*".
+
+    Returns
+    -------
+    Callable[[str], bool]
+        Predicate over use case keynames.
+
+    Raises
+    ------
+    ValueError
+        If the pattern is not a valid regular expression.
+    """
+    if pattern.startswith(_GLOB_PREFIX):
+        glob = pattern[len(_GLOB_PREFIX):]
+        return lambda keyname: fnmatch.fnmatchcase(keyname, glob)
+    if pattern.startswith(_REGEX_PREFIX):
+        pattern = pattern[len(_REGEX_PREFIX):]
+    try:
+        regex = re.compile(pattern)
+    except re.error as error:
+        raise ValueError(f"Invalid use case filter '{pattern}': {error}") from error
+    return lambda keyname: regex.search(keyname) is not None
+
+
+class FilteredPackageTreeReader(PackageTreeReader):
+    """
+    Package tree reader that only inspects the modules of the selected use cases.
+
+    The keyname of a use case is the name of its module, so modules are filtered by
+    name before the inspector imports them. Subpackages are still walked.
+
+    Parameters
+    ----------
+    inspector : Callable[[str], Any]
+        Inspector applied to each selected module.
+    matcher : Callable[[str], bool]
+        Predicate over the module names.
+    """
+
+    def __init__(self, inspector: Callable[[str], Any], matcher: Callable[[str], bool]):
+        super().__init__(inspector)
+        self._matcher = matcher
+
+    def _add_module_object(self, result: dict, key: str, module_path: str) -> None:
+        """Inspects the module only when its name is selected."""
+        if self._matcher(key):
+            super()._add_module_object(result, key, module_path)
+
+
+class FilteredServiceMetadataReader:
+    """
+    Reads the declared metadata and the code of the use cases matching a filter.
+
+    It mirrors `read_full_service_metadata`, but discovery only imports the matching
+    modules and the declared use cases are filtered with the same predicate, so the
+    use cases left out are not reported as missing.
+
+    Parameters
+    ----------
+    inspector : Callable[[str], Any], optional
+        Module inspector (default: `UseCaseMetadataModuleInspector()`).
+    """
+
+    def __init__(self, inspector: Optional[Callable[[str], Any]] = None):
+        self.inspector = inspector or UseCaseMetadataModuleInspector()
+
+    def __call__(self, metadata_file: Optional[str] = None,
+                 use_cases_folder_path: Optional[str] = None, *, filter_uc: str,
+                 encoding: str = "utf-8") -> ServiceInfoWithCode:
+        """
+        Reads the metadata and discovers the use cases selected by `filter_uc`.
+
+        Parameters
+        ----------
+        metadata_file : str, optional
+            Path to the metadata file (YAML/JSON).
+        use_cases_folder_path : str, optional
+            Directory where use case code is located.
+        filter_uc : str
+            Regular expression, or glob with a "glob:" prefix, selecting use case
+            keynames.
+        encoding : str, optional
+            File encoding for reading metadata (default: "utf-8").
+
+        Returns
+        -------
+        ServiceInfoWithCode
+            Declared metadata and discovered code of the selected use cases.
+
+        Raises
+        ------
+        RuntimeError
+            If the metadata file cannot be read.
+        ValueError
+            If the filter is invalid or selects no use case.
+        """
+        service_info = read_service_metadata(metadata_file, encoding=encoding)
+        if not service_info:
+            raise RuntimeError(f"Could not read service metadata from {metadata_file}")
+        matches = use_case_matcher(filter_uc)
+        code_reader = FilteredPackageTreeReader(self.inspector, matches)
+        uc_code_metadata = code_reader(use_cases_folder_path)
+        declared = {keyname: info for keyname, info in service_info.use_cases.items()
+                    if matches(keyname)}
+
+        no_code_found = declared.keys() - uc_code_metadata.keys()
+        if no_code_found:
+            print("No code was found for the following use case keynames:", no_code_found)
+        no_metadata_found = uc_code_metadata.keys() - declared.keys()
+        if no_metadata_found:
+            print("No metadata was found for the following use case keynames:",
+                  no_metadata_found)
+
+        selected = sorted(uc_code_metadata.keys() & declared.keys())
+        if not selected:
+            raise ValueError(f"Use case filter '{filter_uc}' selects no use case, prefix "
+                             "globs with 'glob:'")
+        print(f"There are {len(selected)} use cases matching '{filter_uc}' to be loaded")
+        service_info.use_cases = {keyname: declared[keyname] for keyname in selected}
+        return ServiceInfoWithCode(
+            service_info, {keyname: uc_code_metadata[keyname] for keyname in selected})
+
+
+read_filtered_service_metadata = FilteredServiceMetadataReader()
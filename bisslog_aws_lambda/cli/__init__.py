@@ -13,16 +13,24 @@ import sys
 import os
 import traceback
 
-from .lambda_aws_packager import command_lambda_aws_packager
-from .lambda_handler_generator_manager_printer import \
-    command_lambda_handler_generator_manager_printer
-from .lambda_handler_generator_manager_saver import command_lambda_handler_generator_manager_saver
-from ..aws_lambda.lambda_aws_packager import lambda_aws_packager
-from ..aws_lambda.lambda_handler_generator_manager import (
-    lambda_handler_generator_manager_saver,
-    lambda_handler_generator_manager_printer
+from .lambda_aws_packager import command_lambda_aws_packager, package_lambda_zips
+from .lambda_event_replayer import command_lambda_event_replayer, replay_lambda_events
+from .lambda_handler_benchmark import benchmark_lambda_handlers, command_lambda_handler_benchmark
+from .lambda_handler_generator_manager_printer import (
+    command_lambda_handler_generator_manager_printer,
+    print_lambda_handlers
+)
+from .lambda_handler_generator_manager_saver import (
+    check_watch_arguments,
+    command_lambda_handler_generator_manager_saver,
+    generate_lambda_handlers
+)
+from .lambda_handler_packager import command_lambda_handler_packager, package_lambda_handlers
+from .lambda_import_profiler import command_lambda_import_profiler, profile_lambda_imports
+from .lambda_services_generator import (
+    command_lambda_services_generator,
+    generate_services_handlers
 )
-
 
 
 def main():
@@ -43,6 +51,12 @@ def main():
     --------
     $ bisslog_aws_lambda analyze_metadata /path/to/file.yaml --min-warnings 0.5
 
+    Notes
+    -----
+    Registering the commands only imports argument parsing code. The packager, the
+    handler generators and `bisslog_schema` are imported by the command being run, so
+    `--help` and `generate_lambda_zips` do not pay for the dependencies of the others.
+
     Raises
     ------
     SystemExit
@@ -59,27 +73,30 @@ def main():
     command_lambda_aws_packager(subparsers)
     command_lambda_handler_generator_manager_saver(subparsers)
     command_lambda_handler_generator_manager_printer(subparsers)
+    command_lambda_import_profiler(subparsers)
+    command_lambda_handler_benchmark(subparsers)
+    command_lambda_services_generator(subparsers)
+    command_lambda_handler_packager(subparsers)
+    command_lambda_event_replayer(subparsers)
 
     args = parser.parse_args()
+    if args.command == "generate_lambda_handlers" and args.watch:
+        check_watch_arguments(parser, args)
 
+    commands = {
+        "generate_lambda_zips": package_lambda_zips,
+        "generate_lambda_handlers": generate_lambda_handlers,
+        "print_lambda_handlers": print_lambda_handlers,
+        "profile_lambda_imports": profile_lambda_imports,
+        "benchmark_lambda_handlers": benchmark_lambda_handlers,
+        "generate_services_handlers": generate_services_handlers,
+        "generate_lambda_packages": package_lambda_handlers,
+        "replay_lambda_events": replay_lambda_events,
+    }
     try:
-        if args.command == "generate_lambda_zips":
-            lambda_aws_packager(args.handler_name, args.src_folders, args.handlers_folder)
-        elif args.command == "generate_lambda_handlers":
-            lambda_handler_generator_manager_saver(
-                metadata_file=args.metadata_file,
-                use_cases_folder_path=args.use_cases_folder_path,
-                filter_uc=args.filter_uc,
-                encoding=args.encoding,
-                target_folder=args.target_folder
-            )
-        elif args.command == "print_lambda_handlers":
-            lambda_handler_generator_manager_printer(
-                metadata_file=args.metadata_file,
-                use_cases_folder_path=args.use_cases_folder_path,
-                filter_uc=args.filter_uc,
-                encoding=args.encoding
-            )
+        output = commands[args.command](args)
+        if output is not None:
+            print(output)
     except Exception as e:
         traceback.print_exc()
         print(f"Error: {str(e)}", file=sys.stderr)
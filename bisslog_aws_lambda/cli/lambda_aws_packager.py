@@ -4,6 +4,45 @@ Command registration for generating AWS Lambda deployment zip files.
 This module defines the CLI command that allows users to package AWS Lambda handlers
 along with their Python source code into `.zip` archives for deployment.
 """
+import json
+from typing import Optional
+
+# pylint: disable=import-outside-toplevel
+
+
+def parse_size(value: str) -> int:
+    """
+    Parses a size argument with `LambdaPackageAnalyzer.parse_size`.
+
+    The report module is only imported when a size is given.
+    """
+    from ..aws_lambda.lambda_package_report import LambdaPackageAnalyzer
+    return LambdaPackageAnalyzer.parse_size(value)
+
+
+def parse_shard(value: str):
+    """
+    Parses a shard argument with `ShardSelector.parse`.
+
+    The sharding module is only imported when a shard is given.
+    """
+    from ..aws_lambda.shard_selector import ShardSelector
+    return ShardSelector.parse(value)
+
+
+def add_shard_argument(command_parser, help: str) -> None:  # pylint: disable=redefined-builtin
+    """
+    Adds the `--shard` argument to a command.
+
+    Parameters
+    ----------
+    command_parser : argparse.ArgumentParser
+        The parser instance to which the argument will be added.
+    help : str
+        Help text of the argument.
+    """
+    command_parser.add_argument("--shard", help=help, type=parse_shard, default=None)
+
 
 def command_lambda_aws_packager(subparsers):
     """
@@ -11,7 +50,8 @@ def command_lambda_aws_packager(subparsers):
 
     This command allows the user to generate one or more Lambda deployment zip files
     by providing source folders and a handler name. The handler file is renamed
-    as `lambda_function.py` in the resulting archive.
+    as `lambda_function.py` in the resulting archive. The packaging options are
+    registered by `command_lambda_aws_packager_base`.
 
     Parameters
     ----------
@@ -24,8 +64,11 @@ def command_lambda_aws_packager(subparsers):
         The name of the handler file (without `.py`) to include in the zip (default: all handlers).
     --handlers-folder : str, optional
         Directory containing handler `.py` files (default: "framework/lambda_aws").
-    --src-folders : List[str], optional
-        One or more directories containing Python source code (default: ["src"]).
+    --benchmark-compression : bool, optional
+        Report size, build time and extraction time per compression setting
+        for `--handler-name` instead of writing the zip files.
+    --shard : str, optional
+        Only package the handlers of shard "i/n" (1-based) when packaging all handlers.
     """
 
     generate_lambda_zips = subparsers.add_parser("generate_lambda_zips",
@@ -35,9 +78,385 @@ def command_lambda_aws_packager(subparsers):
                                       default=None)
     generate_lambda_zips.add_argument("--handlers-folder", help="Folder containing handler files",
                                       default="framework/lambda_aws")
+    command_lambda_aws_packager_base(generate_lambda_zips)
     generate_lambda_zips.add_argument(
+        "--benchmark-compression",
+        help="Compare size, build time and extraction time per compression setting",
+        action="store_true",
+    )
+    add_shard_argument(generate_lambda_zips,
+                       "Only package the handlers of shard i/n (1-based), e.g. 2/4, to split "
+                       "packaging across machines")
+
+
+def command_lambda_aws_packager_base(command_parser):
+    """
+    Adds the packaging arguments shared by the commands that build zip files.
+
+    Parameters
+    ----------
+    command_parser : argparse.ArgumentParser
+        The parser instance to which the packaging arguments will be added.
+
+    CLI Arguments
+    -------------
+    --src-folders : List[str], optional
+        One or more directories containing Python source code (default: ["src"]).
+    --include : List[str], optional
+        Glob patterns of source files to include (default: ["*.py"]).
+    --exclude : List[str], optional
+        Gitignore-style patterns of files and folders to leave out, e.g. "tests/".
+    --assets : List[str], optional
+        Glob patterns of non-Python files to include, e.g. "*.json" "**/templates/**".
+    --use-ignore-files : bool, optional
+        Honour `.gitignore` and `.lambdaignore` files in the source folders.
+    --output-dir : str, optional
+        Directory where the zip files are written (default: current working directory).
+    --compile-bytecode : bool, optional
+        Include precompiled `.pyc` files to skip compilation during cold starts.
+    --strip-sources : bool, optional
+        Ship only bytecode for the source folders (requires `--compile-bytecode`).
+    --invalidation-mode : str, optional
+        Hash-based pyc invalidation mode: "unchecked-hash" (default) or "checked-hash".
+    --optimize : int, optional
+        Optimization level used to compile bytecode (default: interpreter level).
+    --target-python : str, optional
+        Python version of the Lambda runtime; must match the running interpreter.
+    --wheelhouse : str, optional
+        Local folder of `.whl` files used to vendor third-party requirements.
+    --requirements : List[str], optional
+        Requirements to vendor from the wheelhouse (e.g. "bisslog==0.0.9").
+    --requirements-file : str, optional
+        Requirements file listing the dependencies to vendor from the wheelhouse.
+    --wheel-cache-dir : str, optional
+        Folder where extracted wheels are cached across runs.
+    --wheel-platform : List[str], optional
+        Platform tags of the wheels vendored from the wheelhouse (repeatable).
+    --compression : str, optional
+        Default compression method: "deflate" (default) or "store".
+    --compress-level : int, optional
+        Deflate level from 0 to 9 (default: zlib's default).
+    --store-larger-than : int, optional
+        Store files bigger than this many bytes instead of deflating them.
+    --compression-rule : List[str], optional
+        Per-extension rules written as `EXT=METHOD[:LEVEL]`, e.g. `.so=store`.
+    --report : str, optional
+        Print a size report of the generated zips as "text" or "json".
+    --report-file : str, optional
+        Write the size report to this file instead of printing it.
+    --report-top : int, optional
+        Number of largest modules, packages and duplicates listed (default: 10).
+    --max-unzipped-size : str, optional
+        Fail when a zip exceeds this unzipped size (e.g. "250MiB").
+    --max-zipped-size : str, optional
+        Fail when a zip file exceeds this size (e.g. "50MiB").
+    """
+    command_parser.add_argument(
         "--src-folders",
         help="List of source folders to include in the lambda zip",
         nargs="+",
         default=["src"],
     )
+    command_parser.add_argument(
+        "--include",
+        help="Glob patterns of source files to include in the lambda zip",
+        nargs="+",
+        default=["*.py"],
+    )
+    command_parser.add_argument(
+        "--exclude",
+        help="Gitignore-style patterns of files and folders to leave out of the lambda zip",
+        nargs="+",
+        default=[],
+    )
+    command_parser.add_argument(
+        "--assets",
+        help="Glob patterns of non-Python files to include in the lambda zip",
+        nargs="+",
+        default=[],
+    )
+    command_parser.add_argument(
+        "--use-ignore-files",
+        help="Honour .gitignore and .lambdaignore files in the source folders",
+        action="store_true",
+    )
+    command_parser.add_argument(
+        "--output-dir",
+        help="Directory where the lambda zip files are written",
+        default=None,
+    )
+    command_parser.add_argument(
+        "--compile-bytecode",
+        help="Include precompiled bytecode (.pyc) in the lambda zip",
+        action="store_true",
+    )
+    command_parser.add_argument(
+        "--strip-sources",
+        help="Leave .py sources out of the zip, shipping only bytecode",
+        action="store_true",
+    )
+    command_parser.add_argument(
+        "--invalidation-mode",
+        help="Invalidation mode of the compiled bytecode (default: unchecked-hash)",
+        choices=["unchecked-hash", "checked-hash"],
+        default="unchecked-hash",
+    )
+    command_parser.add_argument(
+        "--optimize",
+        help="Optimization level used to compile bytecode",
+        type=int,
+        choices=[-1, 0, 1, 2],
+        default=-1,
+    )
+    command_parser.add_argument(
+        "--target-python",
+        help="Python version of the Lambda runtime, e.g. 3.11",
+        default=None,
+    )
+    command_parser.add_argument(
+        "--wheelhouse",
+        help="Local folder of wheels used to vendor third-party requirements",
+        default=None,
+    )
+    command_parser.add_argument(
+        "--requirements",
+        help="Requirements to vendor from the wheelhouse",
+        nargs="+",
+        default=None,
+    )
+    command_parser.add_argument(
+        "--requirements-file",
+        help="Requirements file listing the dependencies to vendor from the wheelhouse",
+        default=None,
+    )
+    command_parser.add_argument(
+        "--wheel-cache-dir",
+        help="Folder where extracted wheels are cached across runs",
+        default=None,
+    )
+    command_parser.add_argument(
+        "--wheel-platform",
+        help="Only vendor wheels of this platform tag, e.g. manylinux2014_aarch64, "
+             "besides pure Python ones (repeatable)",
+        action="append",
+        default=None,
+    )
+    command_parser.add_argument(
+        "--compression",
+        help="Default compression method of the zip entries",
+        choices=["deflate", "store"],
+        default="deflate",
+    )
+    command_parser.add_argument(
+        "--compress-level",
+        help="Deflate compression level (0-9)",
+        type=int,
+        default=None,
+    )
+    command_parser.add_argument(
+        "--store-larger-than",
+        help="Store files bigger than this many bytes without compression",
+        type=int,
+        default=None,
+    )
+    command_parser.add_argument(
+        "--compression-rule",
+        help="Per-extension compression rule EXT=METHOD[:LEVEL], e.g. .so=store",
+        action="append",
+        default=[],
+    )
+    command_parser.add_argument(
+        "--report",
+        help="Print a size report of the generated zips",
+        choices=["text", "json"],
+        default=None,
+    )
+    command_parser.add_argument(
+        "--report-file",
+        help="File where the size report is written",
+        default=None,
+    )
+    command_parser.add_argument(
+        "--report-top",
+        help="Number of largest modules, packages and duplicates in the report",
+        type=int,
+        default=10,
+    )
+    command_parser.add_argument(
+        "--max-unzipped-size",
+        help="Fail when a zip exceeds this unzipped size, e.g. 250MiB (Lambda's limit)",
+        type=parse_size,
+        default=None,
+    )
+    command_parser.add_argument(
+        "--max-zipped-size",
+        help="Fail when a zip file exceeds this size, e.g. 50MiB",
+        type=parse_size,
+        default=None,
+    )
+
+
+def lambda_aws_packager_options(args) -> dict:
+    """
+    Builds the packaging options of `LambdaAWSPackager` from parsed CLI arguments.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        Arguments parsed for the `generate_lambda_zips` command.
+
+    Returns
+    -------
+    dict
+        Keyword arguments for `LambdaAWSPackager.__call__`.
+
+    Raises
+    ------
+    ValueError
+        If requirements are given without a wheelhouse.
+    """
+    from ..aws_lambda.lambda_bytecode_compiler import LambdaBytecodeCompiler
+    from ..aws_lambda.lambda_source_walker import LambdaSourceWalker
+    from ..aws_lambda.lambda_wheel_vendor import LambdaWheelVendor
+    from ..aws_lambda.lambda_zip_compression import LambdaZipCompression
+
+    bytecode_compiler = None
+    if args.compile_bytecode:
+        bytecode_compiler = LambdaBytecodeCompiler(
+            args.invalidation_mode, args.optimize, args.target_python)
+
+    requirements = list(args.requirements or [])
+    if args.requirements_file:
+        requirements.extend(LambdaWheelVendor.read_requirements_file(args.requirements_file))
+    wheel_vendor = None
+    if args.wheelhouse:
+        wheel_vendor = LambdaWheelVendor(args.wheelhouse, requirements, args.wheel_cache_dir,
+                                         platforms=args.wheel_platform)
+    elif requirements:
+        raise ValueError("Vendoring requirements requires --wheelhouse")
+
+    compression = LambdaZipCompression(
+        method=args.compression,
+        level=args.compress_level,
+        store_larger_than=args.store_larger_than,
+        extension_rules=dict(map(LambdaZipCompression.parse_rule, args.compression_rule)),
+    )
+
+    return {
+        "bytecode_compiler": bytecode_compiler,
+        "strip_sources": args.strip_sources,
+        "output_dir": args.output_dir,
+        "wheel_vendor": wheel_vendor,
+        "compression": compression,
+        "source_walker": LambdaSourceWalker(args.include, args.exclude, args.use_ignore_files,
+                                            assets=args.assets),
+    }
+
+
+def package_lambda_zips(args) -> Optional[str]:
+    """
+    Packages the handlers selected by the `generate_lambda_zips` arguments, or runs
+    the compression benchmark if requested.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        Arguments parsed for the `generate_lambda_zips` command.
+
+    Returns
+    -------
+    Optional[str]
+        Benchmark results as a text table, None when the zips were written.
+
+    Raises
+    ------
+    RuntimeError
+        If a zip exceeds the configured size budget.
+    """
+    from ..aws_lambda.lambda_aws_packager import lambda_aws_packager
+
+    options = lambda_aws_packager_options(args)
+    if args.benchmark_compression:
+        return benchmark_lambda_aws_packager(lambda_aws_packager, args, options)
+    zip_paths = lambda_aws_packager(args.handler_name, args.src_folders, args.handlers_folder,
+                                    shard=args.shard, **options)
+    report_lambda_aws_packages(args, zip_paths)
+    return None
+
+
+def benchmark_lambda_aws_packager(packager, args, options: dict) -> str:
+    """
+    Runs the compression benchmark of the `generate_lambda_zips` command.
+
+    The default strategies are compared with the one configured through the CLI.
+
+    Parameters
+    ----------
+    packager : LambdaAWSPackager
+        Packager used to build the zip files.
+    args : argparse.Namespace
+        Arguments parsed for the `generate_lambda_zips` command.
+    options : dict
+        Packaging options built by `lambda_aws_packager_options`.
+
+    Returns
+    -------
+    str
+        Benchmark results as a text table.
+
+    Raises
+    ------
+    ValueError
+        If no handler name was given.
+    """
+    from ..aws_lambda.lambda_zip_compression import (
+        default_benchmark_strategies,
+        format_compression_benchmark
+    )
+
+    if not args.handler_name:
+        raise ValueError("--benchmark-compression requires --handler-name")
+    options = dict(options)
+    strategies = default_benchmark_strategies()
+    strategies["configured"] = options.pop("compression")
+    options.pop("output_dir")
+    rows = packager.benchmark_compression(args.handler_name, args.src_folders,
+                                          args.handlers_folder, strategies=strategies,
+                                          **options)
+    return format_compression_benchmark(rows)
+
+
+def report_lambda_aws_packages(args, zip_paths) -> None:
+    """
+    Reports the size of the generated zips and enforces the size budget.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        Arguments parsed for the `generate_lambda_zips` command.
+    zip_paths : List[str]
+        Zips generated by the packager.
+
+    Raises
+    ------
+    RuntimeError
+        If a zip exceeds the configured size budget.
+    """
+    if not (args.report or args.report_file or args.max_unzipped_size or args.max_zipped_size):
+        return
+    from ..aws_lambda.lambda_package_report import LambdaPackageAnalyzer, format_package_report
+    analyzer = LambdaPackageAnalyzer(args.report_top, args.max_unzipped_size,
+                                     args.max_zipped_size)
+    report = analyzer(zip_paths)
+    report_format = args.report or ("json" if args.report_file else None)
+    if report_format is not None:
+        if report_format == "json":
+            content = json.dumps(report, indent=2)
+        else:
+            content = format_package_report(report)
+        if args.report_file:
+            with open(args.report_file, "w", encoding="utf-8") as f:
+                f.write(content + "\n")
+        else:
+            print(content)
+    analyzer.check_budget(report)
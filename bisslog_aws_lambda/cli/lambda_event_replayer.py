@@ -0,0 +1,120 @@
+"""
+Command registration for load testing generated AWS Lambda handlers with recorded events.
+
+This module defines the CLI command that replays a JSON Lines file of captured Lambda
+events against a generated handler and reports its throughput, latency, errors and
+peak memory.
+"""
+import json
+from pathlib import Path
+
+
+def command_lambda_event_replayer(subparsers):
+    """
+    Registers the `replay_lambda_events` subcommand in the CLI parser.
+
+    Parameters
+    ----------
+    subparsers : argparse._SubParsersAction
+        The subparser object from an `ArgumentParser` to which the command is added.
+
+    CLI Arguments
+    -------------
+    --handler-name : str
+        The name of the handler file (without `.py`) to replay the events against.
+    --handlers-folder : str, optional
+        Directory containing handler `.py` files (default: "framework/lambda_aws").
+    --events : str
+        JSON Lines file with one captured Lambda event per line.
+    --workers : int, optional
+        Number of concurrent workers (default: 4).
+    --mode : str, optional
+        "thread" (default) or "process" workers.
+    --repeat : int, optional
+        Times the events of the file are replayed (default: 1).
+    --project-root : str, optional
+        Folder the use case modules are imported from (default: current folder).
+    --encoding : str, optional
+        Encoding of the events file (default: "utf-8").
+    --format : str, optional
+        Output format, "text" or "json" (default: "text").
+    """
+    command_parser = subparsers.add_parser(
+        "replay_lambda_events",
+        help="Replays recorded lambda events against a generated handler as a load test"
+    )
+    command_parser.add_argument(
+        "--handler-name",
+        help="The handler to replay the events against (without .py)",
+        required=True,
+    )
+    command_parser.add_argument(
+        "--handlers-folder",
+        help="Directory containing handler .py files",
+        default="framework/lambda_aws",
+    )
+    command_parser.add_argument(
+        "--events",
+        help="JSON Lines file with one captured lambda event per line",
+        required=True,
+    )
+    command_parser.add_argument(
+        "--workers",
+        help="Number of concurrent workers (default: 4)",
+        type=int,
+        default=4,
+    )
+    command_parser.add_argument(
+        "--mode",
+        help="Run the workers as threads of this process or as separate processes "
+             "(default: thread)",
+        choices=["thread", "process"],
+        default="thread",
+    )
+    command_parser.add_argument(
+        "--repeat",
+        help="Times the events of the file are replayed (default: 1)",
+        type=int,
+        default=1,
+    )
+    command_parser.add_argument(
+        "--project-root",
+        help="Folder the use case modules are imported from (default: current folder)",
+        default=None,
+    )
+    command_parser.add_argument(
+        "--encoding",
+        help="Encoding of the events file (default: utf-8)",
+        default="utf-8",
+    )
+    command_parser.add_argument(
+        "--format",
+        help="Output format (default: text)",
+        choices=["text", "json"],
+        default="text",
+    )
+
+
+def replay_lambda_events(args) -> str:
+    """
+    Runs the load test selected by the `replay_lambda_events` arguments.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        Arguments parsed for the `replay_lambda_events` command.
+
+    Returns
+    -------
+    str
+        Report in the requested format.
+    """
+    # pylint: disable=import-outside-toplevel
+    from ..aws_lambda.lambda_event_replayer import LambdaEventReplayer, format_event_replay
+
+    replayer = LambdaEventReplayer(args.workers, args.mode, args.repeat)
+    report = replayer(str(Path(args.handlers_folder) / f"{args.handler_name}.py"), args.events,
+                      args.project_root, args.encoding)
+    if args.format == "json":
+        return json.dumps(report, indent=2)
+    return format_event_replay(report)
@@ -0,0 +1,91 @@
+"""
+Command registration for benchmarking generated AWS Lambda handlers locally.
+
+This module defines the CLI command that invokes the generated handlers with
+synthetic AWS events and a stub use case, and reports their per-invocation overhead.
+"""
+import json
+
+from .lambda_handler_generator_base import command_lambda_handler_generator_base
+
+
+def command_lambda_handler_benchmark(subparsers):
+    """
+    Registers the `benchmark_lambda_handlers` subcommand in the CLI parser.
+
+    Parameters
+    ----------
+    subparsers : argparse._SubParsersAction
+        The subparser object from an `ArgumentParser` to which the command is added.
+
+    CLI Arguments
+    -------------
+    --iterations : int, optional
+        Timed invocations per event (default: 1000).
+    --warmup : int, optional
+        Untimed invocations per event before measuring (default: 50).
+    --alloc-samples : int, optional
+        Invocations traced with `tracemalloc` per event (default: 20, 0 disables it).
+    --format : str, optional
+        Output format, "text" or "json" (default: "text").
+    """
+    command_parser = subparsers.add_parser(
+        "benchmark_lambda_handlers",
+        help="Benchmarks generated lambda handlers with synthetic events and a stub use case"
+    )
+    command_lambda_handler_generator_base(command_parser)
+    command_parser.add_argument(
+        "--iterations",
+        help="Timed invocations per event (default: 1000)",
+        type=int,
+        default=1000,
+    )
+    command_parser.add_argument(
+        "--warmup",
+        help="Untimed invocations per event before measuring (default: 50)",
+        type=int,
+        default=50,
+    )
+    command_parser.add_argument(
+        "--alloc-samples",
+        help="Invocations traced with tracemalloc per event (default: 20, 0 disables it)",
+        type=int,
+        default=20,
+    )
+    command_parser.add_argument(
+        "--format",
+        help="Output format (default: text)",
+        choices=["text", "json"],
+        default="text",
+    )
+
+
+def benchmark_lambda_handlers(args) -> str:
+    """
+    Runs the benchmark selected by the `benchmark_lambda_handlers` arguments.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        Arguments parsed for the `benchmark_lambda_handlers` command.
+
+    Returns
+    -------
+    str
+        Results in the requested format.
+    """
+    # pylint: disable=import-outside-toplevel
+    from ..aws_lambda.lambda_handler_benchmark import (
+        LambdaHandlerBenchmark,
+        format_handler_benchmark
+    )
+
+    benchmark = LambdaHandlerBenchmark(args.iterations, args.warmup, args.alloc_samples)
+    rows = benchmark(metadata_file=args.metadata_file,
+                     use_cases_folder_path=args.use_cases_folder_path,
+                     filter_uc=args.filter_uc, encoding=args.encoding,
+                     instrument=args.instrument, metadata_cache=args.metadata_cache,
+                     cold_start=args.cold_start_metrics)
+    if args.format == "json":
+        return json.dumps(rows, indent=2)
+    return format_handler_benchmark(rows)
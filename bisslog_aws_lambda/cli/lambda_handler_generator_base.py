@@ -6,6 +6,8 @@ that generate AWS Lambda handlers from metadata and source code.
 """
 
 import argparse
+import json
+import sys
 
 
 def command_lambda_handler_generator_base(command_parser):
@@ -27,10 +29,19 @@ def command_lambda_handler_generator_base(command_parser):
     --use-cases-folder-path : str, optional
         Path to the folder containing Python use case implementations.
     --filter-uc : str, optional
-        substring to filter specific use cases by name.
+        Regex, or glob with a "glob:" prefix, selecting use cases by name; only
+        matching modules are imported.
     --encoding : str, optional
         Encoding to use when reading the metadata file (default: utf-8).
         Must be one of: 'utf-8', 'ascii', 'latin-1'.
+    --instrument : str, optional
+        Emit per-invocation timing metrics from the generated handlers, as a "json"
+        log line or in CloudWatch Embedded Metric Format ("emf").
+    --cold-start-metrics : bool, optional
+        Also report the module init duration and flag cold starts in the metrics.
+    --metadata-cache : str, optional
+        Cache file for the parsed metadata and discovered use cases, reused while the
+        metadata file and the use case sources are unchanged.
     """
     command_parser.add_argument(
         "--metadata-file",
@@ -46,7 +57,8 @@ def command_lambda_handler_generator_base(command_parser):
 
     command_parser.add_argument(
         "--filter-uc",
-        help="Optional filter to apply to use case names",
+        help="Regex searched in the use case names, e.g. '^(get|list)_', or glob with a "
+             "'glob:' prefix, e.g. 'glob:get_*'; only matching modules are imported",
         default=None,
     )
 
@@ -57,3 +69,221 @@ def command_lambda_handler_generator_base(command_parser):
         type=lambda x: x if x.lower() in ['utf-8', 'ascii', 'latin-1']
         else argparse.ArgumentTypeError("Invalid encoding")
     )
+
+    command_lambda_handler_generator_instrumentation(command_parser)
+
+    command_parser.add_argument(
+        "--metadata-cache",
+        help="Cache file for the parsed metadata and discovered use cases, reused while "
+             "their sources are unchanged",
+        default=None,
+    )
+
+
+def generation_manager_kwargs(args) -> dict:
+    """
+    Builds the options of `LambdaHandlerGeneratorManager` from the common arguments.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        Arguments parsed for a command with the common generator arguments.
+
+    Returns
+    -------
+    dict
+        Metadata, discovery and generator keyword arguments of the manager.
+    """
+    return {
+        "metadata_file": args.metadata_file,
+        "use_cases_folder_path": args.use_cases_folder_path,
+        "filter_uc": args.filter_uc,
+        "encoding": args.encoding,
+        "instrument": args.instrument,
+        "cold_start": args.cold_start_metrics,
+        "metadata_cache": args.metadata_cache,
+    }
+
+
+def command_lambda_handler_generator_instrumentation(command_parser):
+    """
+    Adds the instrumentation arguments of the generated handlers to a command.
+
+    Parameters
+    ----------
+    command_parser : argparse.ArgumentParser
+        The parser instance to which the instrumentation arguments will be added.
+
+    CLI Arguments
+    -------------
+    --instrument : str, optional
+        Emit per-invocation timing metrics from the generated handlers, as a "json"
+        log line or in CloudWatch Embedded Metric Format ("emf").
+    --cold-start-metrics : bool, optional
+        Also report the module init duration and flag cold starts in the metrics.
+    """
+    command_parser.add_argument(
+        "--instrument",
+        help="Emit per-invocation timing metrics from the handlers as a json log line or emf",
+        choices=["json", "emf"],
+        default=None,
+    )
+    command_parser.add_argument(
+        "--cold-start-metrics",
+        help="Also report cold starts and the module init duration (implies --instrument json)",
+        action="store_true",
+    )
+
+
+def command_lambda_handler_generator_timing(command_parser):
+    """
+    Adds the timing report arguments to a command running the generation manager.
+
+    Parameters
+    ----------
+    command_parser : argparse.ArgumentParser
+        The parser instance to which the timing arguments will be added.
+
+    CLI Arguments
+    -------------
+    --timing : str, optional
+        Print the time spent per phase and the slowest use cases, as "text" or "json".
+    --timing-top : int, optional
+        Number of slowest use cases listed in the timing report (default: 5).
+    --timing-file : str, optional
+        Write the timing report to this file, as JSON unless `--timing text`.
+    """
+    command_parser.add_argument(
+        "--timing",
+        help="Report the time spent in metadata read, discovery, generation and resolver",
+        choices=["text", "json"],
+        default=None,
+    )
+    command_parser.add_argument(
+        "--timing-top",
+        help="Number of slowest use cases in the timing report (default: 5)",
+        type=int,
+        default=5,
+    )
+    command_parser.add_argument(
+        "--timing-file",
+        help="Write the timing report to this file instead of stderr (json unless "
+             "--timing text)",
+        default=None,
+    )
+
+
+def generation_timer(args):
+    """
+    Creates the timer requested by the `--timing` or `--timing-file` arguments.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        Arguments parsed for a command with the timing arguments.
+
+    Returns
+    -------
+    Optional[GenerationTimer]
+        A new timer, or None if no report was requested.
+    """
+    if not (args.timing or args.timing_file):
+        return None
+    # pylint: disable=import-outside-toplevel
+    from ..aws_lambda.generation_timer import GenerationTimer
+    return GenerationTimer()
+
+
+def print_generation_timing(args, timer) -> None:
+    """
+    Writes the timing report in the format requested by the `--timing` argument.
+
+    The report goes to the `--timing-file`, if given, or to stderr, so that it is
+    never mixed with the handlers and resolver results printed on stdout.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        Arguments parsed for a command with the timing arguments.
+    timer : Optional[GenerationTimer]
+        Timer returned by `generation_timer`.
+    """
+    if timer is None:
+        return
+    # pylint: disable=import-outside-toplevel
+    from ..aws_lambda.generation_timer import format_generation_timing
+    report = timer.report(args.timing_top)
+    if (args.timing or "json") == "json":
+        content = json.dumps(report, indent=2)
+    else:
+        content = format_generation_timing(report)
+    if args.timing_file:
+        with open(args.timing_file, "w", encoding="utf-8") as f:
+            f.write(content + "\n")
+    else:
+        print(content, file=sys.stderr)
+
+
+def command_lambda_handler_generator_validation(command_parser):
+    """
+    Adds the handler validation arguments to a command running the generation manager.
+
+    Parameters
+    ----------
+    command_parser : argparse.ArgumentParser
+        The parser instance to which the validation arguments will be added.
+
+    CLI Arguments
+    -------------
+    --validate : str, optional
+        Check every handler before resolving any: "compile" compiles it, "import" also
+        runs it in a subprocess with stubbed use cases. The default generator already
+        compiles every handler, so "compile" only matters for custom generators.
+    --validate-workers : int, optional
+        Handlers validated concurrently (default: number of CPUs).
+    --validate-timeout : float, optional
+        Seconds a handler may take to import (default: 60).
+    """
+    command_parser.add_argument(
+        "--validate",
+        help="Compile, or compile and import with stubbed use cases, every handler "
+             "before saving any; the default generator already compiles its handlers, so "
+             "compile only matters for custom generators",
+        choices=["compile", "import"],
+        default=None,
+    )
+    command_parser.add_argument(
+        "--validate-workers",
+        help="Handlers validated concurrently (default: number of CPUs)",
+        type=int,
+        default=None,
+    )
+    command_parser.add_argument(
+        "--validate-timeout",
+        help="Seconds a handler may take to import (default: 60)",
+        type=float,
+        default=60,
+    )
+
+
+def handler_validator(args):
+    """
+    Creates the validator requested by the `--validate` argument.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        Arguments parsed for a command with the validation arguments.
+
+    Returns
+    -------
+    Optional[LambdaHandlerValidator]
+        A new validator, or None if no validation was requested.
+    """
+    if not args.validate:
+        return None
+    # pylint: disable=import-outside-toplevel
+    from ..aws_lambda.lambda_handler_validator import LambdaHandlerValidator
+    return LambdaHandlerValidator(import_check=args.validate == "import",
+                                  workers=args.validate_workers,
+                                  timeout=args.validate_timeout)
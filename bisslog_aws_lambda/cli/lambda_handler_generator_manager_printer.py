@@ -5,7 +5,13 @@ This module defines the `print_lambda_handlers` subcommand that can be used
 to inspect the generated handler code without saving it to disk.
 """
 
-from .lambda_handler_generator_base import command_lambda_handler_generator_base
+from .lambda_handler_generator_base import (
+    command_lambda_handler_generator_base,
+    command_lambda_handler_generator_timing,
+    generation_manager_kwargs,
+    generation_timer,
+    print_generation_timing
+)
 
 
 def command_lambda_handler_generator_manager_printer(subparsers):
@@ -25,3 +31,21 @@ def command_lambda_handler_generator_manager_printer(subparsers):
         help="Generates lambda handler found in metadata and code"
     )
     command_lambda_handler_generator_base(command_parser)
+    command_lambda_handler_generator_timing(command_parser)
+
+
+def print_lambda_handlers(args) -> None:
+    """
+    Generates and prints the handlers selected by the `print_lambda_handlers` arguments.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        Arguments parsed for the `print_lambda_handlers` command.
+    """
+    # pylint: disable=import-outside-toplevel
+    from ..aws_lambda.lambda_handler_generator_manager import \
+        lambda_handler_generator_manager_printer
+    timer = generation_timer(args)
+    lambda_handler_generator_manager_printer(timer=timer, **generation_manager_kwargs(args))
+    print_generation_timing(args, timer)
@@ -5,7 +5,16 @@ This module defines the `generate_lambda_handlers` subcommand, which generates
 Lambda handler code for discovered use cases and saves the result to disk.
 """
 
-from .lambda_handler_generator_base import command_lambda_handler_generator_base
+from .lambda_aws_packager import add_shard_argument
+from .lambda_handler_generator_base import (
+    command_lambda_handler_generator_base,
+    command_lambda_handler_generator_timing,
+    command_lambda_handler_generator_validation,
+    generation_manager_kwargs,
+    generation_timer,
+    handler_validator,
+    print_generation_timing
+)
 
 
 def command_lambda_handler_generator_manager_saver(subparsers):
@@ -19,14 +28,98 @@ def command_lambda_handler_generator_manager_saver(subparsers):
     ----------
     subparsers : argparse._SubParsersAction
         The subparser object from an `ArgumentParser` to which the command is added.
+
+    CLI Arguments
+    -------------
+    --target-folder : str, optional
+        Folder where the handlers are saved (default: "framework/lambda_aws").
+    --watch : bool, optional
+        Keep polling the metadata and use case sources and regenerate the handlers
+        affected by each change.
+    --watch-interval : float, optional
+        Seconds between polls in watch mode (default: 0.5).
+    --shard : str, optional
+        Only generate the handlers of shard "i/n" (1-based).
     """
     command_parser = subparsers.add_parser(
         "generate_lambda_handlers",
         help="Generates lambda handler found in metadata and code"
     )
     command_lambda_handler_generator_base(command_parser)
+    command_lambda_handler_generator_timing(command_parser)
+    command_lambda_handler_generator_validation(command_parser)
     command_parser.add_argument(
         "--target-folder",
         help="Target folder to save the handler generator manager",
         default="framework/lambda_aws"
     )
+    command_parser.add_argument(
+        "--watch",
+        help="Keep running and regenerate only the handlers affected by each change",
+        action="store_true",
+    )
+    command_parser.add_argument(
+        "--watch-interval",
+        help="Seconds between polls in watch mode (default: 0.5)",
+        type=float,
+        default=0.5,
+    )
+    add_shard_argument(command_parser,
+                       "Only generate the handlers of shard i/n (1-based), e.g. 2/4, to split "
+                       "generation across machines")
+
+
+def check_watch_arguments(parser, args) -> None:
+    """
+    Rejects the `generate_lambda_handlers` options that watch mode does not support.
+
+    Parameters
+    ----------
+    parser : argparse.ArgumentParser
+        Parser reporting the error.
+    args : argparse.Namespace
+        Arguments parsed for the `generate_lambda_handlers` command.
+    """
+    unsupported = [option for option, value in (("--shard", args.shard),
+                                                ("--metadata-cache", args.metadata_cache),
+                                                ("--timing", args.timing),
+                                                ("--timing-file", args.timing_file),
+                                                ("--validate", args.validate)) if value]
+    if unsupported:
+        parser.error(f"--watch cannot be combined with {', '.join(unsupported)}")
+
+
+def generate_lambda_handlers(args) -> None:
+    """
+    Generates and saves the handlers selected by the `generate_lambda_handlers`
+    arguments, once or, with `--watch`, each time their sources change.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        Arguments parsed for the `generate_lambda_handlers` command.
+
+    Raises
+    ------
+    RuntimeError
+        If a handler fails validation.
+    """
+    # pylint: disable=import-outside-toplevel
+    if args.watch:
+        from ..aws_lambda.lambda_handler_watcher import LambdaHandlerWatcher
+        manager_kwargs = generation_manager_kwargs(args)
+        manager_kwargs.pop("metadata_cache")
+        LambdaHandlerWatcher(interval=args.watch_interval)(
+            target_folder=args.target_folder, **manager_kwargs)
+        return
+    from ..aws_lambda.lambda_handler_generator_manager import \
+        lambda_handler_generator_manager_saver
+    timer = generation_timer(args)
+    lambda_handler_generator_manager_saver(
+        shard=args.shard,
+        timer=timer,
+        validator=handler_validator(args),
+        target_folder=args.target_folder,
+        **generation_manager_kwargs(args)
+    )
+    print_generation_timing(args, timer)
@@ -0,0 +1,85 @@
+"""
+Command registration for generating handlers straight into deployment zips.
+
+This module defines the CLI command that generates the AWS Lambda handler of each
+use case and packages it in the same run, without writing the handler files.
+"""
+from .lambda_aws_packager import (
+    add_shard_argument,
+    command_lambda_aws_packager_base,
+    lambda_aws_packager_options,
+    report_lambda_aws_packages
+)
+from .lambda_handler_generator_base import (
+    command_lambda_handler_generator_base,
+    command_lambda_handler_generator_timing,
+    command_lambda_handler_generator_validation,
+    generation_manager_kwargs,
+    generation_timer,
+    handler_validator,
+    print_generation_timing
+)
+
+
+def command_lambda_handler_packager(subparsers):
+    """
+    Registers the `generate_lambda_packages` subcommand in the CLI parser.
+
+    It accepts the options of `command_lambda_handler_generator_base` to select the
+    use cases and of `command_lambda_aws_packager_base` to build the zips.
+
+    Parameters
+    ----------
+    subparsers : argparse._SubParsersAction
+        The subparser object from an `ArgumentParser` to which the command is added.
+
+    CLI Arguments
+    -------------
+    --shard : str, optional
+        Only package the handlers of shard "i/n" (1-based).
+    """
+    command_parser = subparsers.add_parser(
+        "generate_lambda_packages",
+        help="Generates the lambda handlers and packages them into zip files in one step"
+    )
+    command_lambda_handler_generator_base(command_parser)
+    command_lambda_handler_generator_timing(command_parser)
+    command_lambda_handler_generator_validation(command_parser)
+    command_lambda_aws_packager_base(command_parser)
+    add_shard_argument(command_parser,
+                       "Only package the handlers of shard i/n (1-based), e.g. 2/4, to split "
+                       "packaging across machines")
+
+
+def package_lambda_handlers(args) -> None:
+    """
+    Generates and packages the handlers selected by the `generate_lambda_packages`
+    arguments.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        Arguments parsed for the `generate_lambda_packages` command.
+
+    Raises
+    ------
+    RuntimeError
+        If a handler fails validation or a zip exceeds the configured size budget.
+    """
+    # pylint: disable=import-outside-toplevel
+    from ..aws_lambda.handler_generator.handler_generator import generate_handler
+    from ..aws_lambda.lambda_handler_generator_manager import LambdaHandlerGeneratorManager
+    from ..aws_lambda.package_lambda_handler_resolver import PackageLambdaHandlerResolver
+
+    options = lambda_aws_packager_options(args)
+    timer = generation_timer(args)
+    resolver = PackageLambdaHandlerResolver(args.src_folders, options.pop("source_walker"))
+    LambdaHandlerGeneratorManager(resolver, generate_handler)(
+        shard=args.shard,
+        timer=timer,
+        validator=handler_validator(args),
+        **generation_manager_kwargs(args),
+        **options
+    )
+    print_generation_timing(args, timer)
+    report_lambda_aws_packages(args, resolver.zip_paths)
@@ -0,0 +1,101 @@
+"""
+Command registration for profiling the cold start of generated AWS Lambda handlers.
+
+This module defines the CLI command that loads generated handlers in a fresh
+interpreter and reports which imports and build statements dominate their startup.
+"""
+import json
+
+
+def command_lambda_import_profiler(subparsers):
+    """
+    Registers the `profile_lambda_imports` subcommand in the CLI parser.
+
+    Parameters
+    ----------
+    subparsers : argparse._SubParsersAction
+        The subparser object from an `ArgumentParser` to which the command is added.
+
+    CLI Arguments
+    -------------
+    --handler-name : str, optional
+        The name of the handler file (without `.py`) to profile (default: all handlers).
+    --handlers-folder : str, optional
+        Directory containing handler `.py` files (default: "framework/lambda_aws").
+    --project-root : str, optional
+        Folder the use case modules are imported from (default: current folder).
+    --python : str, optional
+        Interpreter used to load the handlers (default: the current one).
+    --min-ms : float, optional
+        Hide imports whose cumulative time is below this many milliseconds.
+    --max-depth : int, optional
+        Maximum nesting depth of the import tree.
+    --format : str, optional
+        Output format, "text" or "json" (default: "text").
+    """
+    command_parser = subparsers.add_parser(
+        "profile_lambda_imports",
+        help="Reports the import and build costs of generated lambda handlers"
+    )
+    command_parser.add_argument(
+        "--handler-name",
+        help="The handler to profile (without .py). Defaults to all handlers.",
+        default=None,
+    )
+    command_parser.add_argument(
+        "--handlers-folder",
+        help="Directory containing handler .py files",
+        default="framework/lambda_aws",
+    )
+    command_parser.add_argument(
+        "--project-root",
+        help="Folder the use case modules are imported from (default: current folder)",
+        default=None,
+    )
+    command_parser.add_argument(
+        "--python",
+        help="Interpreter used to load the handlers (default: the current one)",
+        default=None,
+    )
+    command_parser.add_argument(
+        "--min-ms",
+        help="Hide imports whose cumulative time is below this many milliseconds",
+        type=float,
+        default=0.0,
+    )
+    command_parser.add_argument(
+        "--max-depth",
+        help="Maximum nesting depth of the import tree",
+        type=int,
+        default=None,
+    )
+    command_parser.add_argument(
+        "--format",
+        help="Output format (default: text)",
+        choices=["text", "json"],
+        default="text",
+    )
+
+
+def profile_lambda_imports(args) -> str:
+    """
+    Profiles the handlers selected by the `profile_lambda_imports` arguments.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        Arguments parsed for the `profile_lambda_imports` command.
+
+    Returns
+    -------
+    str
+        Report in the requested format.
+    """
+    # pylint: disable=import-outside-toplevel
+    from ..aws_lambda.lambda_import_profiler import LambdaImportProfiler, format_import_profile
+
+    profiler = LambdaImportProfiler(args.python, int(args.min_ms * 1000), args.max_depth)
+    reports = profiler(args.handler_name, args.handlers_folder, args.project_root)
+    if args.format == "json":
+        return json.dumps(reports, indent=2)
+    return format_import_profile(reports)
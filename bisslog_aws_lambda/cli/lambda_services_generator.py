@@ -0,0 +1,120 @@
+"""
+Command registration for generating the handlers of several services at once.
+
+This module defines the CLI command that generates the AWS Lambda handlers of every
+service of a monorepo in a single process, from a manifest or from the command line.
+"""
+import json
+
+from .lambda_handler_generator_base import command_lambda_handler_generator_instrumentation
+
+
+def command_lambda_services_generator(subparsers):
+    """
+    Registers the `generate_services_handlers` subcommand in the CLI parser.
+
+    Parameters
+    ----------
+    subparsers : argparse._SubParsersAction
+        The subparser object from an `ArgumentParser` to which the command is added.
+
+    CLI Arguments
+    -------------
+    --manifest : str, optional
+        YAML or JSON file listing the services and their `generate_lambda_handlers`
+        options.
+    --service : List[str], optional
+        Metadata file, use cases folder and target folder of a service. Repeatable.
+    --workers : int, optional
+        Number of services generated concurrently (default: 4).
+    --encoding : str, optional
+        Encoding of the manifest and default encoding of the metadata files
+        (default: utf-8).
+    --instrument : str, optional
+        Emit per-invocation timing metrics from the generated handlers.
+    --cold-start-metrics : bool, optional
+        Also report the module init duration and flag cold starts in the metrics.
+    --format : str, optional
+        Output format of the summary, "text" or "json" (default: "text").
+    """
+    command_parser = subparsers.add_parser(
+        "generate_services_handlers",
+        help="Generates the lambda handlers of several services in one process"
+    )
+    command_parser.add_argument(
+        "--manifest",
+        help="YAML or JSON file listing the services, each with the options of "
+             "generate_lambda_handlers",
+        default=None,
+    )
+    command_parser.add_argument(
+        "--service",
+        help="Metadata file, use cases folder and target folder of a service (repeatable)",
+        nargs=3,
+        action="append",
+        metavar=("METADATA_FILE", "USE_CASES_FOLDER", "TARGET_FOLDER"),
+        default=[],
+    )
+    command_parser.add_argument(
+        "--workers",
+        help="Number of services generated concurrently (default: 4)",
+        type=int,
+        default=4,
+    )
+    command_parser.add_argument(
+        "--encoding",
+        help="Encoding of the manifest and default encoding of the metadata files "
+             "(default: utf-8)",
+        default="utf-8",
+    )
+    command_lambda_handler_generator_instrumentation(command_parser)
+    command_parser.add_argument(
+        "--format",
+        help="Output format of the summary (default: text)",
+        choices=["text", "json"],
+        default="text",
+    )
+
+
+def generate_services_handlers(args) -> str:
+    """
+    Generates the handlers of the services selected by the `generate_services_handlers`
+    arguments.
+
+    Parameters
+    ----------
+    args : argparse.Namespace
+        Arguments parsed for the `generate_services_handlers` command.
+
+    Returns
+    -------
+    str
+        Summary in the requested format.
+
+    Raises
+    ------
+    ValueError
+        If no service was given.
+    """
+    # pylint: disable=import-outside-toplevel
+    from ..aws_lambda.lambda_services_generator import (
+        LambdaServicesGenerator,
+        format_services_generation
+    )
+
+    services = []
+    if args.manifest:
+        services.extend(LambdaServicesGenerator.read_manifest(args.manifest, args.encoding))
+    services.extend({"metadata_file": metadata_file, "use_cases_folder_path": folder,
+                     "target_folder": target_folder}
+                    for metadata_file, folder, target_folder in args.service)
+    if not services:
+        raise ValueError("generate_services_handlers requires --manifest or --service")
+    for service in services:
+        service.setdefault("encoding", args.encoding)
+
+    rows = LambdaServicesGenerator(workers=args.workers)(
+        services, instrument=args.instrument, cold_start=args.cold_start_metrics)
+    if args.format == "json":
+        return json.dumps(rows, indent=2)
+    return format_services_generation(rows)
@@ -0,0 +1,54 @@
+import pytest
+from bisslog_schema.schema import ServiceInfo
+from bisslog_schema.use_case_code_inspector.use_case_code_metadata import UseCaseCodeInfoObject
+
+USE_CASE_SCALES = [1, 100, 1000]
+TRIGGER_SCALES = [1, 10, 50]
+
+
+def build_trigger(i):
+    kind = i % 6
+    if kind == 0:
+        return {"type": "http", "keyname": f"http_{i}",
+                "options": {"method": "post", "path": f"/resource_{i}/<item_id>",
+                            "mapper": {"body.name": "name", "path_query.item_id": "item_id"}}}
+    if kind == 1:
+        return {"type": "http", "keyname": f"http_{i}",
+                "options": {"method": "get", "path": f"/resource_{i}"}}
+    if kind == 2:
+        return {"type": "consumer", "keyname": f"consumer_{i}",
+                "options": {"queue": f"queue_{i}", "mapper": {"event.item_id": "item_id"}}}
+    if kind == 3:
+        return {"type": "schedule", "keyname": f"schedule_{i}",
+                "options": {"cronjob": "0 12 * * ? *"}}
+    if kind == 4:
+        return {"type": "websocket", "keyname": f"ws_{i}",
+                "options": {"route_key": f"route_{i}", "mapper": {"body.msg": "msg"}}}
+    return {"type": "consumer", "keyname": f"consumer_{i}", "options": {"queue": f"queue_{i}"}}
+
+
+def build_service(n_use_cases, n_triggers):
+    """Builds a service with a mix of every trigger type and the code info of its use cases."""
+    service_info = ServiceInfo.from_dict({"name": "bench", "use_cases": {
+        f"use_case_{u}": {"name": f"use case {u}",
+                          "triggers": [build_trigger(i) for i in range(n_triggers)]}
+        for u in range(n_use_cases)
+    }})
+    code_infos = [
+        UseCaseCodeInfoObject(name=f"use_case_{u}", docs=None,
+                              module=f"src.use_cases.use_case_{u}", var_name=f"use_case_{u}")
+        for u in range(n_use_cases)
+    ]
+    return service_info, code_infos
+
+
+@pytest.fixture(scope="session")
+def service_factory():
+    cache = {}
+
+    def factory(n_use_cases, n_triggers):
+        key = (n_use_cases, n_triggers)
+        if key not in cache:
+            cache[key] = build_service(n_use_cases, n_triggers)
+        return cache[key]
+    return factory
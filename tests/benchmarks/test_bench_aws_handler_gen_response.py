@@ -0,0 +1,74 @@
+import pytest
+
+from bisslog_aws_lambda.aws_lambda.handler_generator.aws_handler_code_builder import \
+    AWSHandlerCodeBuilder
+from bisslog_aws_lambda.aws_lambda.handler_generator.aws_handler_gen_response import \
+    AWSHandlerGenResponse
+from .conftest import USE_CASE_SCALES
+
+pytest.importorskip("pytest_benchmark")
+
+
+def build_responses(n):
+    return [
+        AWSHandlerGenResponse(
+            body=f"    if event.get('key_{i}'):\n        return uc_{i}(**event)",
+            build=f"mapper_{i} = Mapper('mapper_{i}', {{'body.x': 'x'}})",
+            importing={f"src.module_{i % 10}": {f"uc_{i}"}, "bisslog.utils.mapping": {"Mapper"}})
+        for i in range(n)
+    ]
+
+
+@pytest.mark.parametrize("n_responses", USE_CASE_SCALES)
+def test_add(benchmark, n_responses):
+    responses = build_responses(n_responses)
+
+    def merge():
+        result = AWSHandlerGenResponse()
+        for response in responses:
+            result = result + response
+        return result
+
+    result = benchmark(merge)
+
+    assert len(result.importing) == min(n_responses, 10) + 1
+
+
+@pytest.mark.parametrize("n_responses", USE_CASE_SCALES)
+def test_iadd(benchmark, n_responses):
+    responses = build_responses(n_responses)
+
+    def merge():
+        result = AWSHandlerGenResponse()
+        for response in responses:
+            result += response
+        return result
+
+    result = benchmark(merge)
+
+    assert len(result.importing) == min(n_responses, 10) + 1
+
+
+@pytest.mark.parametrize("n_responses", USE_CASE_SCALES)
+def test_code_builder(benchmark, n_responses):
+    responses = build_responses(n_responses)
+
+    def merge():
+        builder = AWSHandlerCodeBuilder()
+        for response in responses:
+            builder.add(response)
+        return builder.to_response()
+
+    result = benchmark(merge)
+
+    assert len(result.importing) == min(n_responses, 10) + 1
+
+
+def test_generate_handler_code(benchmark):
+    response = AWSHandlerGenResponse()
+    for item in build_responses(100):
+        response += item
+
+    code = benchmark(response.generate_handler_code)
+
+    assert code.count("mapper_") >= 100
@@ -0,0 +1,27 @@
+import pytest
+
+from bisslog_aws_lambda.aws_lambda.handler_generator.handler_generator import generate_handler
+from .conftest import TRIGGER_SCALES, USE_CASE_SCALES
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.parametrize("n_triggers", TRIGGER_SCALES)
+def test_generate_handler(benchmark, service_factory, n_triggers):
+    service_info, code_infos = service_factory(1, n_triggers)
+
+    handler_str = benchmark(generate_handler, service_info, code_infos[0])
+
+    assert "def lambda_handler(event, context):" in handler_str
+
+
+@pytest.mark.parametrize("n_use_cases", USE_CASE_SCALES)
+def test_generate_service_handlers(benchmark, service_factory, n_use_cases):
+    service_info, code_infos = service_factory(n_use_cases, 6)
+
+    def generate_all():
+        return [generate_handler(service_info, code_info) for code_info in code_infos]
+
+    handlers = benchmark.pedantic(generate_all, rounds=5, warmup_rounds=1)
+
+    assert len(handlers) == n_use_cases
@@ -0,0 +1,55 @@
+import zipfile
+
+import pytest
+
+from bisslog_aws_lambda.aws_lambda.lambda_aws_packager import LambdaAWSPackager
+from .conftest import USE_CASE_SCALES
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.fixture
+def project(tmp_path):
+    def build(n_modules):
+        src = tmp_path / "src"
+        for i in range(n_modules):
+            module = src / "use_cases" / f"package_{i // 50}" / f"use_case_{i}.py"
+            module.parent.mkdir(parents=True, exist_ok=True)
+            module.write_text(f"class UseCase{i}:\n    def __call__(self, **kwargs):\n"
+                              f"        return kwargs\n\n\nuse_case_{i} = UseCase{i}()\n" * 20)
+        handlers = tmp_path / "framework" / "lambda_aws"
+        handlers.mkdir(parents=True)
+        (handlers / "use_case_0_handler.py").write_text("def lambda_handler(event, context):\n"
+                                                        "    return event\n")
+        return src, handlers
+    return build
+
+
+@pytest.mark.parametrize("n_modules", USE_CASE_SCALES)
+def test_package_handler(benchmark, project, tmp_path, n_modules):
+    src, handlers = project(n_modules)
+    packager = LambdaAWSPackager()
+    output_dir = tmp_path / "dist"
+
+    zip_paths = benchmark.pedantic(
+        packager, args=("use_case_0_handler", str(src), str(handlers)),
+        kwargs={"output_dir": str(output_dir)}, rounds=5, warmup_rounds=1)
+
+    with zipfile.ZipFile(zip_paths[0]) as zipf:
+        assert len(zipf.namelist()) == n_modules + 1
+
+
+@pytest.mark.parametrize("n_modules", USE_CASE_SCALES)
+def test_package_handler_source_with_shared_scan(benchmark, project, tmp_path, n_modules):
+    src, handlers = project(n_modules)
+    packager = LambdaAWSPackager()
+    sources = packager.scan_sources(str(src), None)
+    handler_source = (handlers / "use_case_0_handler.py").read_text()
+    output_dir = tmp_path / "dist"
+
+    zip_path = benchmark.pedantic(
+        packager.package_handler_source, args=(handler_source, "use_case_0_handler.zip", sources),
+        kwargs={"output_dir": str(output_dir)}, rounds=5, warmup_rounds=1)
+
+    with zipfile.ZipFile(zip_path) as zipf:
+        assert len(zipf.namelist()) == n_modules + 1
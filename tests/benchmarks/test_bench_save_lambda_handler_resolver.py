@@ -0,0 +1,24 @@
+import pytest
+
+from bisslog_aws_lambda.aws_lambda.handler_generator.handler_generator import generate_handler
+from bisslog_aws_lambda.aws_lambda.save_lambda_handler_resolver import SaveLambdaHandlerResolver
+from .conftest import USE_CASE_SCALES
+
+pytest.importorskip("pytest_benchmark")
+
+
+@pytest.mark.parametrize("n_use_cases", USE_CASE_SCALES)
+def test_save_handlers(benchmark, service_factory, tmp_path, monkeypatch, n_use_cases):
+    monkeypatch.chdir(tmp_path)
+    service_info, code_infos = service_factory(n_use_cases, 6)
+    handlers = [(code_info, generate_handler(service_info, code_info)) for code_info in code_infos]
+    resolver = SaveLambdaHandlerResolver()
+
+    def save_all():
+        for code_info, handler_str in handlers:
+            resolver(service_info, code_info, handler_str, target_folder="framework/lambda_aws",
+                     overwrite=True)
+
+    benchmark.pedantic(save_all, rounds=5, warmup_rounds=1)
+
+    assert len(list((tmp_path / "framework" / "lambda_aws").glob("*_handler.py"))) == n_use_cases
@@ -0,0 +1,29 @@
+import pytest
+
+from bisslog_aws_lambda.aws_lambda.handler_generator.chains.manager_trigger_handler_generator import \
+    ManagerTriggerHandlerGenerator
+from .conftest import TRIGGER_SCALES
+
+pytest.importorskip("pytest_benchmark")
+
+GENERATORS = {type(gen).__name__: gen
+              for gen in ManagerTriggerHandlerGenerator.triggers_sorted_generators}
+
+
+@pytest.mark.parametrize("n_triggers", TRIGGER_SCALES)
+@pytest.mark.parametrize("generator_name", sorted(GENERATORS))
+def test_trigger_generator(benchmark, service_factory, generator_name, n_triggers):
+    service_info, _ = service_factory(1, n_triggers)
+    triggers = service_info.use_cases["use_case_0"].triggers
+
+    benchmark(GENERATORS[generator_name], triggers, "use_case_0")
+
+
+@pytest.mark.parametrize("n_triggers", TRIGGER_SCALES)
+def test_manager_trigger_generator(benchmark, service_factory, n_triggers):
+    service_info, _ = service_factory(1, n_triggers)
+    triggers = service_info.use_cases["use_case_0"].triggers
+
+    response = benchmark(ManagerTriggerHandlerGenerator(), triggers, "use_case_0")
+
+    assert response.body
@@ -0,0 +1,120 @@
+import json
+
+import pytest
+
+from bisslog_aws_lambda.aws_lambda.handler_generator.aws_handler_gen_response import \
+    AWSHandlerGenResponse
+from bisslog_aws_lambda.aws_lambda.handler_generator.chains.instrumentation_generator import \
+    InstrumentationGenerator
+
+
+class FakeMapper:
+    def __init__(self, name, base):
+        self.base = base
+
+    def map(self, data):
+        return {target: data.get(source) for source, target in self.base.items()}
+
+
+@pytest.fixture
+def response():
+    return AWSHandlerGenResponse(
+        body='    if "value" in event:\n'
+             '        request_to_uc = mapper_value.map(event)\n'
+             '        return USE_CASE(**request_to_uc)\n'
+             '    raise RuntimeError("Unrecognized event")',
+        build='mapper_value = Mapper("mapper_value", {"value": "value"})',
+        importing={"bisslog.utils.mapping": {"Mapper"}}
+    )
+
+
+def load(code):
+    namespace = {"__name__": "lambda_function"}
+    code = code.replace("from bisslog.utils.mapping import Mapper\n", "")
+    namespace["Mapper"] = FakeMapper
+    namespace["USE_CASE"] = lambda **kwargs: kwargs
+    exec(compile(code, "lambda_function.py", "exec"), namespace)
+    return namespace["lambda_handler"]
+
+
+def test_json_instrumentation_emits_spans(response, capsys):
+    instrumented = InstrumentationGenerator()(response, "USE_CASE", "get_value")
+    lambda_handler = load(instrumented.generate_handler_code())
+
+    assert lambda_handler({"value": 3}, None) == {"value": 3}
+
+    line = json.loads(capsys.readouterr().out)
+    assert line["metric"] == "bisslog.invocation"
+    assert line["use_case"] == "get_value"
+    assert line["duration_ms"] >= line["mapping_ms"] + line["use_case_ms"]
+    assert line["mapping_ms"] > 0 and line["use_case_ms"] > 0
+    assert line["routing_ms"] == pytest.approx(
+        line["duration_ms"] - line["mapping_ms"] - line["use_case_ms"])
+
+
+def test_emf_instrumentation_emits_metrics_on_error(response, capsys):
+    instrumented = InstrumentationGenerator(namespace="Users")(response, "USE_CASE", "get_value",
+                                                              "emf")
+    lambda_handler = load(instrumented.generate_handler_code())
+
+    with pytest.raises(RuntimeError):
+        lambda_handler({}, None)
+
+    line = json.loads(capsys.readouterr().out)
+    directive = line["_aws"]["CloudWatchMetrics"][0]
+    assert directive["Namespace"] == "Users"
+    assert directive["Dimensions"] == [["UseCase"]]
+    assert {m["Name"] for m in directive["Metrics"]} == {
+        "Duration", "RoutingDuration", "MappingDuration", "UseCaseDuration"}
+    assert line["UseCase"] == "get_value"
+    assert line["MappingDuration"] == 0
+
+
+def test_instrumentation_wraps_mappers_and_use_case(response):
+    instrumented = InstrumentationGenerator()(response, "USE_CASE", "get_value")
+
+    assert "mapper_value = _TimedMapper(mapper_value)" in instrumented.build
+    assert "USE_CASE = _TimedUseCase(USE_CASE)" in instrumented.build
+    assert instrumented.importing["time"] == {"perf_counter_ns"}
+    assert "        request_to_uc = mapper_value.map(event)" not in response.build
+    assert "            request_to_uc = mapper_value.map(event)" in instrumented.body
+
+
+def test_unknown_format_raises(response):
+    with pytest.raises(ValueError):
+        InstrumentationGenerator()(response, "USE_CASE", "get_value", "xml")
+
+
+def test_json_cold_start_is_reported_once(response, capsys):
+    instrumented = InstrumentationGenerator()(response, "USE_CASE", "get_value",
+                                              cold_start=True)
+    code = instrumented.generate_handler_code()
+    assert code.startswith("from time import perf_counter_ns\n_INIT_START_NS = perf_counter_ns()")
+    lambda_handler = load(code)
+
+    lambda_handler({"value": 1}, None)
+    lambda_handler({"value": 2}, None)
+
+    cold, warm = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert cold["cold_start"] is True
+    assert cold["init_ms"] > 0
+    assert warm["cold_start"] is False
+    assert "init_ms" not in warm
+
+
+def test_emf_cold_start_declares_init_duration_only_when_cold(response, capsys):
+    instrumented = InstrumentationGenerator()(response, "USE_CASE", "get_value", "emf",
+                                              cold_start=True)
+    lambda_handler = load(instrumented.generate_handler_code())
+
+    lambda_handler({"value": 1}, None)
+    lambda_handler({"value": 2}, None)
+
+    cold, warm = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    cold_metrics = {m["Name"]: m["Unit"] for m in cold["_aws"]["CloudWatchMetrics"][0]["Metrics"]}
+    warm_metrics = {m["Name"] for m in warm["_aws"]["CloudWatchMetrics"][0]["Metrics"]}
+    assert cold_metrics["InitDuration"] == "Milliseconds"
+    assert cold_metrics["ColdStart"] == "Count"
+    assert cold["ColdStart"] == 1 and cold["InitDuration"] > 0
+    assert "InitDuration" not in warm_metrics and "ColdStart" in warm_metrics
+    assert warm["ColdStart"] == 0 and "InitDuration" not in warm
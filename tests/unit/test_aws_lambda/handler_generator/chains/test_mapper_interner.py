@@ -0,0 +1,67 @@
+from unittest.mock import MagicMock
+
+from bisslog_schema.schema import TriggerConsumer
+from bisslog_schema.schema.enums.trigger_type import TriggerEnum
+from bisslog_schema.schema.triggers.trigger_info import TriggerInfo
+
+from bisslog_aws_lambda.aws_lambda.handler_generator.aws_handler_gen_response import \
+    AWSHandlerGenResponse
+from bisslog_aws_lambda.aws_lambda.handler_generator.chains.manager_trigger_handler_generator import \
+    ManagerTriggerHandlerGenerator
+from bisslog_aws_lambda.aws_lambda.handler_generator.chains.mapper_interner import MapperInterner
+
+
+def test_identical_mappers_are_interned():
+    response = AWSHandlerGenResponse(
+        body="a = mapper_a.map(event)\nb = mapper_b.map(event)\nc = mapper_c.map(event)",
+        build='mapper_a = Mapper("mapper_a", {"x": "y", "z": "w"})\n'
+              'mapper_b = Mapper("mapper_b", {"z": "w", "x": "y"})\n'
+              'mapper_c = Mapper("mapper_c", {"x": "other"})',
+        importing={"bisslog.utils.mapping": {"Mapper"}}
+    )
+
+    result = MapperInterner()(response)
+
+    assert "mapper_b = Mapper" not in result.build
+    assert "mapper_a = Mapper" in result.build and "mapper_c = Mapper" in result.build
+    assert result.body == "a = mapper_a.map(event)\nb = mapper_a.map(event)\n" \
+                          "c = mapper_c.map(event)"
+    assert result.importing == response.importing
+
+
+def test_multiline_mappers_and_other_statements_are_kept():
+    build = ('mapper_http = Mapper("mapper_http", {\n'
+             '    "event.payload": "body",\n'
+             '})\n'
+             'USE_CASE = build()\n'
+             'mapper_other = Mapper("mapper_other", {"event.payload": "body"})')
+    response = AWSHandlerGenResponse(body="r = mapper_other.map(e)", build=build)
+
+    result = MapperInterner()(response)
+
+    assert result.build == build.rsplit("\n", 1)[0]
+    assert result.body == "r = mapper_http.map(e)"
+
+
+def test_response_without_duplicates_is_returned_unchanged():
+    response = AWSHandlerGenResponse(body="x", build='m = Mapper("m", {"a": "b"})\nnot valid(')
+    assert MapperInterner()(response) is response
+
+    response = AWSHandlerGenResponse(body="x", build='m = Mapper("m", {"a": "b"})')
+    assert MapperInterner()(response) is response
+
+
+def test_consumer_trigger_mapper_is_shared_between_event_sources():
+    trigger = MagicMock(spec=TriggerInfo)
+    trigger.type = TriggerEnum.CONSUMER
+    trigger.keyname = "created"
+    trigger.options = TriggerConsumer(queue="users", mapper={"event.id": "user_id"})
+
+    result = ManagerTriggerHandlerGenerator()([trigger], "USE_CASE")
+
+    assert result.build.count("Mapper(") == 4
+    assert "mapper_consumer_sqs_0_created = Mapper" in result.build
+    assert "mapper_consumer_sns_0_created" not in result.build + result.body
+    assert "mapper_consumer_event_bridge_0_created" not in result.build + result.body
+    assert result.body.count("mapper_consumer_sqs_0_created.map(") == 3
+    compile(result.build + "\n\ndef f(event):\n" + result.body, "handler.py", "exec")
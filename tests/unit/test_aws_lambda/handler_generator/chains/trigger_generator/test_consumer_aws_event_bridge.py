@@ -52,7 +52,9 @@ def test_generates_code_for_single_consumer_trigger(simple_trigger, uc_var_name)
     assert isinstance(response.build, str)
     assert response.importing == {}
     assert "mapper_consumer_event_bridge" in response.build
-    assert f"# if \"{simple_trigger.options.queue}\" in event.get(\"source\", \"\")" in response.body
+    assert "mapped_standard_event = mapper_consumer_event_bridge.map(event)" in response.body
+    assert "source = " not in response.body
+    assert "#" not in response.body
     assert f"uc_response = {uc_var_name}(**request_to_uc)" in response.body
 
 
@@ -62,8 +64,10 @@ def test_generates_code_for_multiple_triggers(simple_trigger, trigger_with_mappe
 
     assert "mapper_consumer_event_bridge" in response.build
     assert "mapper_consumer_event_bridge_1_mapped_event" in response.build
-    assert "if \"my.service.event\" in event.get(\"source\", \"\"):" in response.body
-    assert "if \"other.source\" in event.get(\"source\", \"\"):" in response.body
+    assert response.body.count("mapper_consumer_event_bridge.map(event)") == 1
+    assert response.body.count('source = event.get("source", "")') == 1
+    assert "if \"my.service.event\" in source:" in response.body
+    assert "if \"other.source\" in source:" in response.body
     assert "request_to_uc : dict = mapper_consumer_event_bridge_1_mapped_event.map" in response.body
     assert "response.append(uc_response)" in response.body
     assert "return {\"statusCode\": 200, \"body\": response}" in response.body
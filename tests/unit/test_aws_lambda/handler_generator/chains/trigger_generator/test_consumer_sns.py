@@ -51,8 +51,8 @@ def test_generates_handler_for_single_trigger(simple_trigger, uc_var_name):
 
     assert response is not None
     assert "mapper_consumer_sns" in response.build
-    assert f"# queue_arn = record.get(\"EventSubscriptionArn\", \"\")" in response.body
-    assert f"# if \"{simple_trigger.options.queue}\" in queue_arn:" in response.body
+    assert "queue_arn" not in response.body
+    assert "#" not in response.body
     assert "uc_response = my_use_case(**request_to_uc)" in response.body
     assert "response.append(uc_response)" in response.body
     assert "return {\"statusCode\": 200, \"body\": response}" in response.body
@@ -66,6 +66,8 @@ def test_generates_handler_for_multiple_triggers(simple_trigger, trigger_with_ma
     assert "for record in event[\"Records\"]" in response.body
     assert "mapper_consumer_sns" in response.build
     assert "mapper_consumer_sns_1_mapped_event" in response.build
+    assert response.body.count("mapper_consumer_sns.map(record['Sns'])") == 1
+    assert response.body.count('queue_arn = record.get("EventSubscriptionArn", "")') == 1
     assert f"if \"{simple_trigger.options.queue}\" in queue_arn:" in response.body
     assert f"if \"{trigger_with_mapper.options.queue}\" in queue_arn:" in response.body
     assert "request_to_uc : dict = mapper_consumer_sns_1_mapped_event.map" in response.body
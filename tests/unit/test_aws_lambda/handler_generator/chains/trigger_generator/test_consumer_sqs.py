@@ -54,8 +54,8 @@ def test_generates_handler_for_single_trigger(simple_trigger, uc_var_name):
     assert result is not None
     assert "mapper_consumer_sqs" in result.build
     assert "mapped_standard_event_sqs = mapper_consumer_sqs.map(record)" in result.body
-    assert "# queue_arn = record.get(\"eventSourceARN\", \"\")" in result.body
-    assert "# if \"my-sqs-queue\" in queue_arn:" in result.body
+    assert "queue_arn" not in result.body
+    assert "#" not in result.body
     assert "uc_response = my_use_case(**request_to_uc)" in result.body
     assert "return {\"statusCode\": 200, \"body\": response}" in result.body
 
@@ -67,7 +67,8 @@ def test_generates_handler_for_multiple_triggers(simple_trigger, trigger_with_ma
     assert result is not None
     assert "mapper_consumer_sqs" in result.build
     assert "mapper_consumer_sqs_1_with_mapper" in result.build
-    assert "queue_arn = record.get(\"eventSourceARN\", \"\")" in result.body
+    assert result.body.count("mapper_consumer_sqs.map(record)") == 1
+    assert result.body.count("queue_arn = record.get(\"eventSourceARN\", \"\")") == 1
     assert "if \"my-sqs-queue\" in queue_arn:" in result.body
     assert "if \"special-queue\" in queue_arn:" in result.body
     assert "request_to_uc : dict = mapper_consumer_sqs_1_with_mapper.map" in result.body
@@ -49,7 +49,8 @@ def test_generates_handler_for_single_trigger(simple_http_trigger, uc_var_name):
 
     assert result is not None
     assert "if \"httpMethod\" in event" in result.body
-    assert "# if event.get(\"resource\", \"\").endswith(\"/users/{user_id}\")" in result.body
+    assert "resource" not in result.body
+    assert "#" not in result.body
     assert "uc_response = my_use_case(**request_to_uc)" in result.body
     assert "return {\"statusCode\": 200, \"body\": uc_response}" in result.body
 
@@ -71,8 +72,10 @@ def test_generates_handler_for_multiple_http_triggers(simple_http_trigger, trigg
     body = result.body
     build = result.build
 
-    assert 'if event.get("resource", "").endswith("/users/{user_id}") and event.get("httpMethod") == "GET":' in body
-    assert 'if event.get("resource", "").endswith("/users/{user_id}") and event.get("httpMethod") == "POST":' in body
+    assert body.count('resource = event.get("resource", "")') == 1
+    assert body.count('http_method = event["httpMethod"]') == 1
+    assert 'if http_method == "GET" and resource.endswith("/users/{user_id}"):' in body
+    assert 'if http_method == "POST" and resource.endswith("/users/{user_id}"):' in body
 
     assert "mapper_http" in build
 
@@ -81,3 +84,26 @@ def test_generates_handler_for_multiple_http_triggers(simple_http_trigger, trigg
 
     assert "uc_response = my_use_case(**request_to_uc)" in body
     assert 'return {"statusCode": 200, "body": uc_response}' in body
+
+
+def test_trigger_without_mapper_builds_full_standard_mapper(simple_http_trigger, uc_var_name):
+    result = HttpAWSHandlerGenerator()([simple_http_trigger], uc_var_name)
+
+    assert '"event.queryStringParameters": "params"' in result.build
+    assert '"event.pathParameters": "path_query"' in result.build
+
+
+def test_generated_handler_routes_requests_without_query_string(simple_http_trigger,
+                                                                trigger_with_mapper):
+    result = HttpAWSHandlerGenerator()([simple_http_trigger, trigger_with_mapper], "my_use_case")
+    namespace = {"my_use_case": lambda **kwargs: kwargs}
+    exec("from bisslog.utils.mapping import Mapper\n" + result.build
+         + "\ndef lambda_handler(event, context):\n" + result.body, namespace)
+
+    response = namespace["lambda_handler"]({
+        "resource": "/users/{user_id}", "httpMethod": "GET", "headers": {},
+        "queryStringParameters": None, "pathParameters": {"user_id": "7"}, "payload": None
+    }, None)
+
+    assert response["statusCode"] == 200
+    assert response["body"]["user_id"] == "7"
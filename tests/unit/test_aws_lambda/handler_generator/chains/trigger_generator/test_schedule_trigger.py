@@ -52,5 +52,5 @@ def test_generates_handler_for_multiple_schedules(schedule_trigger, uc_var_name)
 
     assert result is not None
     assert result.body.count("uc_response = my_use_case(**request_to_uc)") == 2
-    assert result.body.count("request_to_uc = mapper_schedule_event_bridge.map(event)") == 2
+    assert result.body.count("request_to_uc = mapper_schedule_event_bridge.map(event)") == 1
     assert result.body.count("response.append(uc_response)") == 2
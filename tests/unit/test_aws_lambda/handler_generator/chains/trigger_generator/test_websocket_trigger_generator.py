@@ -53,7 +53,8 @@ def test_generates_handler_for_single_trigger(websocket_trigger, uc_var_name):
 
     assert result is not None
     assert "mapper_ws" in result.build
-    assert "# if \"ping\" in event[\"requestContext\"][\"routeKey\"]:" in result.body
+    assert "route_key" not in result.body
+    assert "#" not in result.body
     assert "uc_response = my_use_case(**request_to_uc)" in result.body
     assert "return {\"statusCode\": 200, \"body\": uc_response}" in result.body
 
@@ -65,7 +66,15 @@ def test_generates_handler_for_multiple_triggers(websocket_trigger, websocket_tr
     assert result is not None
     assert "mapper_ws" in result.build
     assert "mapper_websocket_1_sendMessage" in result.build
-    assert "if \"ping\" in event[\"requestContext\"][\"routeKey\"]:" in result.body
-    assert "if \"sendMessage\" in event[\"requestContext\"][\"routeKey\"]:" in result.body
+    assert result.body.count("route_key = event[\"requestContext\"][\"routeKey\"]") == 1
+    assert "if \"ping\" in route_key:" in result.body
+    assert "if \"sendMessage\" in route_key:" in result.body
     assert "request_to_uc : dict = mapper_websocket_1_sendMessage.map" in result.body
     assert "return {\"statusCode\": 200, \"body\": uc_response}" in result.body
+
+
+def test_trigger_without_mapper_builds_full_standard_mapper(websocket_trigger, uc_var_name):
+    result = WebSocketAWSHandlerGenerator()([websocket_trigger], uc_var_name)
+
+    assert '"event.body": "body"' in result.build
+    assert '"event.requestContext.connectionId": "connection_id"' in result.build
@@ -0,0 +1,55 @@
+import pytest
+
+from bisslog_aws_lambda.aws_lambda.handler_generator.aws_handler_code_builder import \
+    AWSHandlerCodeBuilder
+from bisslog_aws_lambda.aws_lambda.handler_generator.aws_handler_gen_response import \
+    AWSHandlerGenResponse
+
+
+def test_builder_matches_response_addition():
+    responses = [
+        AWSHandlerGenResponse(body="    a = 1", build="x = 1", importing={"os": {"path"}}),
+        None,
+        AWSHandlerGenResponse(body="    return a", importing={"os": {"environ"}},
+                              preamble="START = 0"),
+        AWSHandlerGenResponse(build="y = 2", importing={"sys": set()}),
+    ]
+    expected = AWSHandlerGenResponse()
+    builder = AWSHandlerCodeBuilder()
+    for response in responses:
+        expected += response
+        builder.add(response)
+
+    result = builder.to_response()
+
+    assert result.body == expected.body
+    assert result.build == expected.build
+    assert result.preamble == expected.preamble
+    assert result.importing == expected.importing
+    assert builder.render() == expected.generate_handler_code()
+
+
+def test_builder_does_not_share_import_sets():
+    response = AWSHandlerGenResponse(importing={"os": {"path"}})
+    builder = AWSHandlerCodeBuilder().add(response)
+
+    builder.to_response().importing["os"].add("environ")
+
+    assert response.importing["os"] == {"path"}
+    assert builder.to_response().importing["os"] == {"path"}
+
+
+def test_empty_builder_renders_empty_handler():
+    result = AWSHandlerCodeBuilder().to_response()
+
+    assert result.body is None and result.build is None and result.preamble is None
+
+
+def test_validate_returns_valid_code():
+    code = "def lambda_handler(event, context):\n    return 1\n"
+    assert AWSHandlerCodeBuilder.validate(code) == code
+
+
+def test_validate_reports_invalid_code():
+    with pytest.raises(ValueError, match=r"handler.py is not valid Python: .*line 2"):
+        AWSHandlerCodeBuilder.validate("def f():\n    if x\n", "handler.py")
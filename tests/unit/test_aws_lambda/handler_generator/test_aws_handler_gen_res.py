@@ -92,3 +92,19 @@ def test_iadd_with_none_returns_self():
     result = r.__iadd__(None)
     assert result is r
     assert result.body == "test"
+
+
+def test_preamble_is_rendered_before_imports():
+    r = AWSHandlerGenResponse(body="return 1", importing={"os": {"path"}},
+                              preamble="START = 0")
+    code = r.generate_handler_code()
+    assert code.index("START = 0") < code.index("from os import path")
+
+
+def test_preamble_is_merged_on_addition():
+    r1 = AWSHandlerGenResponse(preamble="a = 1")
+    r2 = AWSHandlerGenResponse(preamble="b = 2")
+
+    assert (r1 + r2).preamble == "a = 1\nb = 2"
+    r1 += AWSHandlerGenResponse(body="x")
+    assert r1.preamble == "a = 1"
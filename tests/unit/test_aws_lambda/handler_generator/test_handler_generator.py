@@ -39,7 +39,7 @@ def mock_build_use_case_gen():
 def mock_trigger_handler_gen():
     mock = MagicMock()
     response = AWSHandlerGenResponse(
-        body="if event.get('key'): uc.execute()",
+        body="    if event.get('key'): uc.execute()",
         importing={"my.mapper": {"Mapper"}}
     )
     mock.return_value = response
@@ -50,7 +50,7 @@ def mock_trigger_handler_gen():
 def mock_default_handler_gen():
     mock = MagicMock()
     response = AWSHandlerGenResponse(
-        body="raise Exception('Unhandled')",
+        body="    raise Exception('Unhandled')",
         importing={"builtins": {"Exception"}}
     )
     mock.return_value = response
@@ -109,3 +109,61 @@ def test_raises_value_error_if_varname_missing(
 
     with pytest.raises(ValueError):
         generator(mock_service_info, mock_use_case_code_info)
+
+
+def test_handler_generator_instruments_on_request(
+    mock_service_info,
+    mock_use_case_code_info,
+    mock_build_use_case_gen,
+    mock_trigger_handler_gen,
+    mock_default_handler_gen
+):
+    generator = HandlerGenerator(
+        manager_trigger_gen=mock_trigger_handler_gen,
+        build_use_case_obj_gen=mock_build_use_case_gen,
+        default_handler_gen=mock_default_handler_gen
+    )
+
+    plain = generator(mock_service_info, mock_use_case_code_info)
+    code = generator(mock_service_info, mock_use_case_code_info, instrument="json")
+
+    assert "perf_counter_ns" not in plain
+    assert "uc = _TimedUseCase(uc)" in code
+    assert "_emit_metrics(perf_counter_ns() - _start)" in code
+
+
+def test_handler_generator_cold_start_implies_json_instrumentation(
+    mock_service_info,
+    mock_use_case_code_info,
+    mock_build_use_case_gen,
+    mock_trigger_handler_gen,
+    mock_default_handler_gen
+):
+    generator = HandlerGenerator(
+        manager_trigger_gen=mock_trigger_handler_gen,
+        build_use_case_obj_gen=mock_build_use_case_gen,
+        default_handler_gen=mock_default_handler_gen
+    )
+
+    code = generator(mock_service_info, mock_use_case_code_info, cold_start=True)
+
+    assert code.startswith("from time import perf_counter_ns")
+    assert "_INIT_DURATION_NS = perf_counter_ns() - _INIT_START_NS" in code
+    assert '"metric": "bisslog.invocation"' in code
+
+
+def test_handler_generator_rejects_invalid_code(
+    mock_service_info,
+    mock_use_case_code_info,
+    mock_build_use_case_gen,
+    mock_default_handler_gen
+):
+    broken_trigger_gen = MagicMock(return_value=AWSHandlerGenResponse(body="    if event:"))
+    generator = HandlerGenerator(
+        manager_trigger_gen=broken_trigger_gen,
+        build_use_case_obj_gen=mock_build_use_case_gen,
+        default_handler_gen=MagicMock(return_value=AWSHandlerGenResponse(body="return 1"))
+    )
+
+    with pytest.raises(ValueError, match="get_data.py is not valid Python"):
+        generator(mock_service_info, mock_use_case_code_info)
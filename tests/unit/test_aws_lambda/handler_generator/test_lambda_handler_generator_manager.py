@@ -51,7 +51,11 @@ def test_handler_generator_manager_calls_all_components(
     assert "lambda_handler" in mock_generate_handler.return_value
 
 
-def test_filter_use_case_applies(mock_generate_handler, mock_resolver, mock_metadata):
+def test_filter_use_case_applies(monkeypatch, mock_generate_handler, mock_resolver,
+                                 mock_metadata):
+    filtered_reader = MagicMock(return_value=mock_metadata.return_value)
+    monkeypatch.setattr("bisslog_aws_lambda.aws_lambda.lambda_handler_generator_manager."
+                        "read_filtered_service_metadata", filtered_reader)
     manager = LambdaHandlerGeneratorManager(
         resolver=mock_resolver,
         generate_handler_resolver=mock_generate_handler
@@ -59,5 +63,131 @@ def test_filter_use_case_applies(mock_generate_handler, mock_resolver, mock_meta
 
     manager(metadata_file="x", use_cases_folder_path="y", filter_uc="get")
 
+    filtered_reader.assert_called_once_with(
+        metadata_file="x", use_cases_folder_path="y", encoding="utf-8", filter_uc="get")
+    mock_metadata.assert_not_called()
     mock_generate_handler.assert_called_once()
     mock_resolver.assert_called_once()
+
+
+def test_shard_selects_the_use_cases(mock_generate_handler, mock_resolver, mock_metadata,
+                                     mock_use_cases, capsys):
+    manager = LambdaHandlerGeneratorManager(
+        resolver=mock_resolver,
+        generate_handler_resolver=mock_generate_handler
+    )
+    shard = MagicMock(return_value=False)
+    shard.__str__.return_value = "2/2"
+
+    manager(metadata_file="x", use_cases_folder_path="y", shard=shard)
+
+    shard.assert_called_once_with("get_user")
+    mock_generate_handler.assert_not_called()
+    assert "Shard 2/2: 0 of 1 use cases" in capsys.readouterr().out
+
+
+def test_instrument_is_forwarded_to_generator(mock_generate_handler, mock_resolver, mock_metadata,
+                                              mock_service_info, mock_use_cases):
+    manager = LambdaHandlerGeneratorManager(
+        resolver=mock_resolver,
+        generate_handler_resolver=mock_generate_handler
+    )
+
+    manager(metadata_file="x", use_cases_folder_path="y", instrument="emf")
+
+    mock_generate_handler.assert_called_once_with(
+        mock_service_info, mock_use_cases["get_user"], instrument="emf")
+
+
+def test_cold_start_is_forwarded_to_generator(mock_generate_handler, mock_resolver, mock_metadata,
+                                              mock_service_info, mock_use_cases):
+    manager = LambdaHandlerGeneratorManager(
+        resolver=mock_resolver,
+        generate_handler_resolver=mock_generate_handler
+    )
+
+    manager(metadata_file="x", use_cases_folder_path="y", cold_start=True)
+
+    mock_generate_handler.assert_called_once_with(
+        mock_service_info, mock_use_cases["get_user"], cold_start=True)
+
+
+def test_metadata_cache_wraps_the_reader(monkeypatch, mock_generate_handler, mock_resolver,
+                                         mock_metadata):
+    cache_cls = MagicMock()
+    cache_cls.return_value.return_value = mock_metadata.return_value
+    monkeypatch.setattr("bisslog_aws_lambda.aws_lambda.lambda_handler_generator_manager."
+                        "ServiceMetadataCache", cache_cls)
+    manager = LambdaHandlerGeneratorManager(
+        resolver=mock_resolver,
+        generate_handler_resolver=mock_generate_handler
+    )
+
+    manager(metadata_file="x", use_cases_folder_path="y", metadata_cache="cache.pickle")
+
+    cache_cls.assert_called_once_with("cache.pickle", mock_metadata)
+    cache_cls.return_value.assert_called_once_with(
+        metadata_file="x", use_cases_folder_path="y", encoding="utf-8")
+    mock_metadata.assert_not_called()
+    mock_generate_handler.assert_called_once()
+
+
+def test_timer_records_each_phase(monkeypatch, mock_generate_handler, mock_resolver,
+                                  mock_metadata):
+    from bisslog_aws_lambda.aws_lambda.generation_timer import GenerationTimer
+
+    reader_cls = MagicMock()
+
+    def read(**_):
+        reader_cls.call_args[0][0]("code/")
+        return mock_metadata.return_value
+
+    reader_cls.return_value.side_effect = read
+    monkeypatch.setattr("bisslog_aws_lambda.aws_lambda.lambda_handler_generator_manager."
+                        "ServiceFullMetadataReader", reader_cls)
+    manager = LambdaHandlerGeneratorManager(
+        resolver=mock_resolver,
+        generate_handler_resolver=mock_generate_handler
+    )
+    timer = GenerationTimer()
+
+    manager(metadata_file="x", use_cases_folder_path="code/", timer=timer)
+
+    mock_metadata.code_inspector.assert_called_once_with("code/")
+    mock_metadata.assert_not_called()
+    assert list(timer.use_cases) == ["get_user"]
+    assert all(timer.totals[phase] > 0
+               for phase in ("metadata", "discovery", "generation", "resolver"))
+
+
+def test_validator_checks_every_handler_before_resolving(mock_generate_handler, mock_resolver,
+                                                        mock_metadata, mock_use_cases):
+    validator = MagicMock(return_value=[
+        {"use_case": "get_user", "stage": None, "error": None, "import_ms": 1.0}])
+    manager = LambdaHandlerGeneratorManager(
+        resolver=mock_resolver,
+        generate_handler_resolver=mock_generate_handler
+    )
+
+    manager(metadata_file="x", use_cases_folder_path="y", validator=validator)
+
+    validator.assert_called_once_with(
+        {"get_user": (mock_use_cases["get_user"], mock_generate_handler.return_value)})
+    mock_resolver.assert_called_once()
+
+
+def test_invalid_handlers_are_not_resolved(mock_generate_handler, mock_resolver, mock_metadata,
+                                           capsys):
+    validator = MagicMock(return_value=[
+        {"use_case": "get_user", "stage": "import", "error": "ImportError: boom",
+         "import_ms": None}])
+    manager = LambdaHandlerGeneratorManager(
+        resolver=mock_resolver,
+        generate_handler_resolver=mock_generate_handler
+    )
+
+    with pytest.raises(RuntimeError, match="1 of 1 handlers failed validation"):
+        manager(metadata_file="x", use_cases_folder_path="y", validator=validator)
+
+    mock_resolver.assert_not_called()
+    assert "get_user: ImportError: boom" in capsys.readouterr().out
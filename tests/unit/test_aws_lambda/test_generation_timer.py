@@ -0,0 +1,73 @@
+import pytest
+
+from bisslog_aws_lambda.aws_lambda.generation_timer import (
+    GenerationTimer, format_generation_timing)
+
+
+def test_add_accumulates_phase_and_use_case_times():
+    timer = GenerationTimer()
+    timer.add("metadata", 0.5)
+    timer.add("generation", 0.25, "get_user")
+    timer.add("generation", 0.25, "get_user")
+    timer.add("resolver", 0.1, "get_user")
+
+    assert timer.totals == {"metadata": 0.5, "discovery": 0.0, "generation": 0.5,
+                            "validation": 0.0, "resolver": 0.1}
+    assert timer.use_cases == {"get_user": {"generation": 0.5, "resolver": 0.1}}
+
+
+def test_phase_times_the_block_even_if_it_fails():
+    timer = GenerationTimer()
+    with pytest.raises(ValueError):
+        with timer.phase("resolver", "get_user"):
+            raise ValueError("disk full")
+
+    assert timer.totals["resolver"] > 0
+    assert timer.use_cases["get_user"]["resolver"] > 0
+
+
+def test_timed_wraps_a_function():
+    timer = GenerationTimer()
+    inspect = timer.timed("discovery", lambda path: {"path": path})
+
+    assert inspect("src") == {"path": "src"}
+    assert timer.totals["discovery"] > 0
+    assert timer.use_cases == {}
+
+
+def test_report_lists_the_slowest_use_cases_first():
+    timer = GenerationTimer()
+    timer.add("generation", 0.001, "fast")
+    timer.add("generation", 0.003, "slow")
+    timer.add("resolver", 0.002, "medium")
+
+    report = timer.report(top=2)
+
+    assert report["use_cases"] == 3
+    assert [row["use_case"] for row in report["slowest_use_cases"]] == ["slow", "medium"]
+    assert report["slowest_use_cases"][0] == pytest.approx(
+        {"use_case": "slow", "generation_ms": 3.0, "resolver_ms": 0.0, "total_ms": 3.0})
+    assert report["phases"]["generation"] == pytest.approx(4.0)
+    assert report["total_ms"] > 0
+
+
+def test_format_generation_timing():
+    text = format_generation_timing({
+        "total_ms": 200.0,
+        "phases": {"metadata": 10.0, "discovery": 150.0, "generation": 20.0, "resolver": 20.0},
+        "use_cases": 2,
+        "slowest_use_cases": [{"use_case": "get_user", "generation_ms": 12.0,
+                               "resolver_ms": 8.0, "total_ms": 20.0}],
+    })
+
+    lines = text.splitlines()
+    assert lines[3].split() == ["discovery", "150.00", "75.0"]
+    assert lines[6].split() == ["total", "200.00"]
+    assert "Slowest of 2 use cases" in text
+    assert lines[-1].split() == ["get_user", "12.00", "8.00", "20.00"]
+
+
+def test_format_generation_timing_without_use_cases():
+    text = format_generation_timing(GenerationTimer().report())
+
+    assert "Slowest" not in text
@@ -1,10 +1,17 @@
+import importlib
 import os
+import sys
 import zipfile
 from pathlib import Path
 
 import pytest
 
 from bisslog_aws_lambda.aws_lambda.lambda_aws_packager import LambdaAWSPackager
+from bisslog_aws_lambda.aws_lambda.lambda_bytecode_compiler import LambdaBytecodeCompiler
+from bisslog_aws_lambda.aws_lambda.lambda_source_walker import LambdaSourceWalker
+from bisslog_aws_lambda.aws_lambda.lambda_wheel_vendor import LambdaWheelVendor
+from bisslog_aws_lambda.aws_lambda.lambda_zip_compression import LambdaZipCompression
+from bisslog_aws_lambda.aws_lambda.shard_selector import ShardSelector
 
 
 @pytest.fixture
@@ -88,6 +95,46 @@ def test_batch_mode_zips_all_handlers(packager, tmp_path, monkeypatch):
             assert "src/common.py" in z.namelist()
 
 
+def test_batch_mode_only_zips_the_handlers_of_the_shard(packager, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    handler_dir = tmp_path / "framework" / "lambda_aws"
+    handler_dir.mkdir(parents=True)
+    names = [f"use_case_{i}_handler" for i in range(6)]
+    for name in names:
+        (handler_dir / f"{name}.py").write_text("a = 1")
+    (tmp_path / "src").mkdir()
+
+    zipped = []
+    for index in (1, 2):
+        shard = ShardSelector(index, 2)
+        zip_files = packager(src_folders="src", handlers_folder=str(handler_dir),
+                             output_dir=f"out_{index}", shard=shard)
+        assert all(shard(Path(path).stem) for path in zip_files)
+        zipped.extend(Path(path).stem for path in zip_files)
+
+    assert sorted(zipped) == names
+
+
+def test_package_handler_source_writes_code_held_in_memory(packager, src_folder, tmp_path):
+    sources = packager.scan_sources(str(src_folder), None)
+
+    zip_path = packager.package_handler_source("def lambda_handler(e, c): return 1\n",
+                                               "uc_handler.zip", sources,
+                                               output_dir=str(tmp_path / "dist"))
+
+    assert Path(zip_path) == tmp_path / "dist" / "uc_handler.zip"
+    with zipfile.ZipFile(zip_path) as z:
+        assert sorted(z.namelist()) == ["lambda_function.py", "src/main.py", "src/util.py"]
+        assert z.read("lambda_function.py") == b"def lambda_handler(e, c): return 1\n"
+
+
+def test_scan_sources_skips_the_handlers_folder(packager, handler_file, src_folder, tmp_path):
+    sources = packager.scan_sources([str(src_folder), str(handler_file.parent)],
+                                    str(handler_file.parent))
+
+    assert sorted(rel_path for _, rel_path in sources) == ["src/main.py", "src/util.py"]
+
+
 def test_excludes_handlers_folder_from_sources(packager, tmp_path, monkeypatch):
     monkeypatch.chdir(tmp_path)
 
@@ -130,3 +177,206 @@ def test_raises_if_src_folder_not_found(packager, tmp_path):
             src_folders="nonexistent",
             handlers_folder=str(handler_dir)
         )
+
+
+def test_compile_bytecode_includes_pyc_next_to_sources(packager, handler_file, src_folder, tmp_path,
+                                                       monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    compiler = LambdaBytecodeCompiler()
+
+    zip_path = packager.generate_zip_file(
+        handler_name="my_handler",
+        src_folders=str(src_folder),
+        handlers_folder=str(handler_file.parent),
+        bytecode_compiler=compiler
+    )
+
+    with zipfile.ZipFile(zip_path) as z:
+        files = z.namelist()
+        assert "src/main.py" in files
+        assert compiler.pyc_arcname("src/main.py") in files
+        assert compiler.pyc_arcname("lambda_function.py") in files
+
+
+def test_strip_sources_ships_importable_bytecode(packager, handler_file, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    src = tmp_path / "src"
+    package = src / "bytecode_only_pkg"
+    package.mkdir(parents=True)
+    (package / "__init__.py").write_text("")
+    (package / "values.py").write_text("ANSWER = 42\n")
+
+    zip_path = packager.generate_zip_file(
+        handler_name="my_handler",
+        src_folders=str(src),
+        handlers_folder=str(handler_file.parent),
+        bytecode_compiler=LambdaBytecodeCompiler(),
+        strip_sources=True
+    )
+
+    extract_dir = tmp_path / "extracted"
+    with zipfile.ZipFile(zip_path) as z:
+        files = z.namelist()
+        assert "src/bytecode_only_pkg/values.pyc" in files
+        assert "src/bytecode_only_pkg/values.py" not in files
+        assert "lambda_function.py" in files
+        z.extractall(extract_dir)
+
+    monkeypatch.syspath_prepend(str(extract_dir / "src"))
+    module = importlib.import_module("bytecode_only_pkg.values")
+    try:
+        assert module.ANSWER == 42
+        assert module.__file__.endswith("values.pyc")
+    finally:
+        sys.modules.pop("bytecode_only_pkg.values", None)
+        sys.modules.pop("bytecode_only_pkg", None)
+
+
+def test_strip_sources_requires_bytecode_compiler(packager, handler_file, src_folder):
+    with pytest.raises(ValueError):
+        packager.generate_zip_file(
+            handler_name="my_handler",
+            src_folders=str(src_folder),
+            handlers_folder=str(handler_file.parent),
+            strip_sources=True
+        )
+
+
+def test_output_dir_receives_zip_without_leftovers(packager, handler_file, src_folder, tmp_path,
+                                                   monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    output_dir = tmp_path / "dist" / "lambdas"
+
+    zip_path = packager.generate_zip_file(
+        handler_name="my_handler",
+        src_folders=str(src_folder),
+        handlers_folder=str(handler_file.parent),
+        output_dir=str(output_dir)
+    )
+
+    assert Path(zip_path) == output_dir / "my_handler.zip"
+    assert os.listdir(output_dir) == ["my_handler.zip"]
+    assert not (tmp_path / "my_handler.zip").exists()
+    with zipfile.ZipFile(zip_path) as z:
+        info = z.getinfo("lambda_function.py")
+        assert (info.external_attr >> 16) & 0o644 == 0o644
+
+
+def test_failed_build_keeps_previous_zip_and_removes_partial_file(packager, handler_file, tmp_path,
+                                                                   monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "broken.py").write_text("def broken(:\n")
+    previous_zip = tmp_path / "my_handler.zip"
+    previous_zip.write_bytes(b"previous")
+
+    with pytest.raises(SyntaxError):
+        packager.generate_zip_file(
+            handler_name="my_handler",
+            src_folders=str(src),
+            handlers_folder=str(handler_file.parent),
+            bytecode_compiler=LambdaBytecodeCompiler()
+        )
+
+    assert previous_zip.read_bytes() == b"previous"
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
+
+
+def test_wheel_vendor_places_dependencies_at_zip_root(packager, handler_file, src_folder, tmp_path,
+                                                      monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    wheelhouse = tmp_path / "wheelhouse"
+    wheelhouse.mkdir()
+    with zipfile.ZipFile(wheelhouse / "bisslog-0.0.9-py3-none-any.whl", "w") as z:
+        z.writestr("bisslog/__init__.py", "VERSION = '0.0.9'")
+        z.writestr("bisslog/data.json", "{}")
+    vendor = LambdaWheelVendor(str(wheelhouse), ["bisslog"], cache_dir=str(tmp_path / "cache"))
+
+    zip_paths = packager(
+        handler_name="my_handler",
+        src_folders=str(src_folder),
+        handlers_folder=str(handler_file.parent),
+        wheel_vendor=vendor
+    )
+
+    with zipfile.ZipFile(zip_paths[0]) as z:
+        files = z.namelist()
+        assert "bisslog/__init__.py" in files
+        assert "bisslog/data.json" in files
+        assert "src/main.py" in files
+        assert "lambda_function.py" in files
+
+
+def test_compression_strategy_is_applied(packager, handler_file, src_folder, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    zip_path = packager.generate_zip_file(
+        handler_name="my_handler",
+        src_folders=str(src_folder),
+        handlers_folder=str(handler_file.parent),
+        compression=LambdaZipCompression(method="store")
+    )
+
+    with zipfile.ZipFile(zip_path) as z:
+        assert {info.compress_type for info in z.infolist()} == {zipfile.ZIP_STORED}
+
+
+def test_benchmark_compression_reports_each_strategy(packager, handler_file, src_folder, tmp_path,
+                                                     monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    rows = packager.benchmark_compression(
+        handler_name="my_handler",
+        src_folders=str(src_folder),
+        handlers_folder=str(handler_file.parent),
+        repeat=1
+    )
+
+    assert [row["strategy"] for row in rows] == ["store", "deflate-1", "deflate-6", "deflate-9"]
+    for row in rows:
+        assert row["zip_size"] > 0
+        assert row["uncompressed_size"] > 0
+        assert row["build_ms"] >= 0
+        assert row["extract_ms"] >= 0
+    assert not list(tmp_path.glob("*.zip"))
+
+
+def test_source_walker_excludes_tests(packager, handler_file, src_folder, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (src_folder / "tests").mkdir()
+    (src_folder / "tests" / "test_main.py").write_text("def test(): pass")
+
+    zip_path = packager.generate_zip_file(
+        handler_name="my_handler",
+        src_folders=str(src_folder),
+        handlers_folder=str(handler_file.parent),
+        source_walker=LambdaSourceWalker(exclude=["tests/"])
+    )
+
+    with zipfile.ZipFile(zip_path) as z:
+        files = z.namelist()
+        assert "src/main.py" in files
+        assert "src/tests/test_main.py" not in files
+
+
+def test_assets_are_packaged_without_compilation(packager, handler_file, src_folder, tmp_path,
+                                                 monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (src_folder / "schemas").mkdir()
+    (src_folder / "schemas" / "user.json").write_text('{"type": "object"}')
+
+    zip_path = packager.generate_zip_file(
+        handler_name="my_handler",
+        src_folders=str(src_folder),
+        handlers_folder=str(handler_file.parent),
+        bytecode_compiler=LambdaBytecodeCompiler(),
+        strip_sources=True,
+        source_walker=LambdaSourceWalker(assets=["*.json"])
+    )
+
+    with zipfile.ZipFile(zip_path) as z:
+        files = z.namelist()
+        assert z.read("src/schemas/user.json") == b'{"type": "object"}'
+        assert "src/main.pyc" in files
+        assert "src/main.py" not in files
@@ -0,0 +1,71 @@
+import importlib.util
+import marshal
+import sys
+
+import pytest
+
+from bisslog_aws_lambda.aws_lambda.lambda_bytecode_compiler import LambdaBytecodeCompiler
+
+
+def test_compiles_unchecked_hash_pyc():
+    source = b"value = 40 + 2\n"
+    compiler = LambdaBytecodeCompiler()
+
+    content = compiler(source, "src/module.py")
+
+    assert content[:4] == importlib.util.MAGIC_NUMBER
+    assert int.from_bytes(content[4:8], "little") == 0b01
+    assert content[8:16] == importlib.util.source_hash(source)
+    namespace = {}
+    exec(marshal.loads(content[16:]), namespace)
+    assert namespace["value"] == 42
+
+
+def test_compiles_checked_hash_pyc():
+    compiler = LambdaBytecodeCompiler("checked-hash")
+
+    content = compiler(b"x = 1\n", "module.py")
+
+    assert int.from_bytes(content[4:8], "little") == 0b11
+
+
+def test_pyc_arcname_uses_pycache_when_source_is_kept():
+    compiler = LambdaBytecodeCompiler(optimize=0)
+
+    arcname = compiler.pyc_arcname("src/pkg/module.py")
+
+    assert arcname == f"src/pkg/__pycache__/module.{sys.implementation.cache_tag}.pyc"
+
+
+def test_pyc_arcname_with_optimization_level():
+    compiler = LambdaBytecodeCompiler(optimize=2)
+
+    assert compiler.pyc_arcname("module.py").endswith(".opt-2.pyc")
+
+
+def test_pyc_arcname_sourceless_is_next_to_source():
+    compiler = LambdaBytecodeCompiler()
+
+    assert compiler.pyc_arcname("src/pkg/module.py", sourceless=True) == "src/pkg/module.pyc"
+
+
+def test_raises_on_syntax_error():
+    compiler = LambdaBytecodeCompiler()
+
+    with pytest.raises(SyntaxError):
+        compiler(b"def broken(:\n", "broken.py")
+
+
+def test_rejects_unknown_invalidation_mode():
+    with pytest.raises(ValueError):
+        LambdaBytecodeCompiler("timestamp")
+
+
+def test_rejects_target_version_different_from_interpreter():
+    with pytest.raises(ValueError):
+        LambdaBytecodeCompiler(target_version="2.7")
+
+
+def test_accepts_running_target_version():
+    version = f"{sys.version_info.major}.{sys.version_info.minor}"
+    assert LambdaBytecodeCompiler(target_version=version).invalidation_mode == "unchecked-hash"
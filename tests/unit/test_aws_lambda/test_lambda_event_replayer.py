@@ -0,0 +1,147 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from bisslog_aws_lambda.aws_lambda.lambda_event_replayer import (
+    LambdaEventReplayer, event_source, format_event_replay)
+
+HANDLER = """\
+print("loading handler")
+
+
+def lambda_handler(event, context):
+    print("invoked")
+    if "httpMethod" not in event and "Records" not in event:
+        raise RuntimeError("Unrecognized event format")
+    return {"statusCode": 200, "body": None}
+"""
+
+HTTP = {"httpMethod": "GET", "path": "/users/1", "pathParameters": {"user_id": "1"}}
+SQS = {"Records": [{"eventSource": "aws:sqs", "body": "{}"}]}
+UNKNOWN = {"weird": True}
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "user_handler.py").write_text(HANDLER, encoding="utf-8")
+    (tmp_path / "events.jsonl").write_text(
+        "\n".join(json.dumps(event) for event in [HTTP, SQS, HTTP, UNKNOWN]) + "\n\n",
+        encoding="utf-8")
+    return tmp_path
+
+
+@pytest.mark.parametrize("event, source", [
+    (HTTP, "http"),
+    ({"version": "2.0", "requestContext": {"http": {"method": "GET"}}}, "http"),
+    ({"requestContext": {"routeKey": "$connect", "connectionId": "c"}}, "websocket"),
+    (SQS, "sqs"),
+    ({"Records": [{"EventSource": "aws:sns", "Sns": {}}]}, "sns"),
+    ({"source": "aws.events", "detail-type": "Scheduled Event"}, "schedule"),
+    ({"source": "orders", "detail-type": "OrderPlaced", "detail": {}}, "eventbridge"),
+    (UNKNOWN, "unknown"),
+    ([1, 2], "unknown"),
+])
+def test_event_source(event, source):
+    assert event_source(event) == source
+
+
+def test_read_events_skips_blank_lines(project):
+    assert LambdaEventReplayer.read_events(str(project / "events.jsonl")) == [
+        HTTP, SQS, HTTP, UNKNOWN]
+
+
+def test_read_events_reports_the_invalid_line(tmp_path):
+    path = tmp_path / "events.jsonl"
+    path.write_text(json.dumps(HTTP) + "\n{not json\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="events.jsonl:2"):
+        LambdaEventReplayer.read_events(str(path))
+
+
+def test_read_events_requires_events(tmp_path):
+    (tmp_path / "events.jsonl").write_text("\n", encoding="utf-8")
+
+    with pytest.raises(ValueError, match="No events found"):
+        LambdaEventReplayer.read_events(str(tmp_path / "events.jsonl"))
+
+
+@pytest.mark.parametrize("kwargs", [{"mode": "fork"}, {"workers": 0}, {"repeat": 0}])
+def test_invalid_options_are_rejected(kwargs):
+    with pytest.raises(ValueError):
+        LambdaEventReplayer(**kwargs)
+
+
+def test_replay_records_source_latency_and_error(project):
+    lambda_handler = LambdaEventReplayer.load_handler(str(project / "user_handler.py"))
+
+    samples = LambdaEventReplayer.replay(lambda_handler, [HTTP, UNKNOWN])
+
+    assert [(source, error) for source, _, error in samples] == [
+        ("http", None), ("unknown", "RuntimeError: Unrecognized event format")]
+    assert all(ms > 0 for _, ms, _ in samples)
+
+
+def test_thread_mode_report(project, capsys):
+    replayer = LambdaEventReplayer(workers=3, repeat=5)
+
+    report = replayer(str(project / "user_handler.py"), str(project / "events.jsonl"),
+                      str(project))
+
+    assert capsys.readouterr().out == ""
+    assert (report["mode"], report["workers"]) == ("thread", 3)
+    assert (report["events"], report["errors"], report["error_rate"]) == (20, 5, 0.25)
+    assert report["throughput_per_s"] > 0
+    assert report["p50_ms"] <= report["p90_ms"] <= report["p99_ms"] <= report["max_ms"]
+    assert report["peak_rss_mb"] > 0
+    assert [(row["source"], row["events"], row["errors"]) for row in report["sources"]] == [
+        ("http", 10, 0), ("sqs", 5, 0), ("unknown", 5, 5)]
+    assert report["top_errors"] == [
+        {"error": "RuntimeError: Unrecognized event format", "count": 5}]
+
+
+def test_process_mode_report(project):
+    replayer = LambdaEventReplayer(workers=2, mode="process")
+
+    report = replayer(str(project / "user_handler.py"), str(project / "events.jsonl"),
+                      str(project))
+
+    assert (report["events"], report["errors"]) == (4, 1)
+    assert report["seconds"] >= 0
+    assert report["peak_rss_mb"] > 0
+
+
+def test_process_mode_reports_handler_load_errors(project):
+    (project / "user_handler.py").write_text("import not_installed_dependency\n",
+                                             encoding="utf-8")
+    replayer = LambdaEventReplayer(workers=2, mode="process")
+
+    with pytest.raises(RuntimeError, match="No module named 'not_installed_dependency'"):
+        replayer(str(project / "user_handler.py"), str(project / "events.jsonl"))
+
+
+def test_missing_handler_is_reported(project):
+    with pytest.raises(FileNotFoundError, match="Handler not found"):
+        LambdaEventReplayer()(str(project / "missing.py"), str(project / "events.jsonl"))
+
+
+def test_peak_rss_is_optional_without_resource(project):
+    with patch("bisslog_aws_lambda.aws_lambda.lambda_event_replayer.resource", None):
+        report = LambdaEventReplayer(workers=1)(str(project / "user_handler.py"),
+                                                str(project / "events.jsonl"))
+
+    assert report["peak_rss_mb"] is None
+    assert "peak RSS -" in format_event_replay(report)
+
+
+def test_format_event_replay(project):
+    report = LambdaEventReplayer(workers=2)(str(project / "user_handler.py"),
+                                            str(project / "events.jsonl"))
+
+    lines = format_event_replay(report).splitlines()
+
+    assert lines[0].endswith("user_handler.py (2 thread workers)")
+    assert "4 events in" in lines[1]
+    assert "1 errors (25.00%)" in lines[1]
+    assert [line.split()[0] for line in lines[4:8]] == ["http", "sqs", "unknown", "total"]
+    assert lines[-1].split() == ["1", "RuntimeError:", "Unrecognized", "event", "format"]
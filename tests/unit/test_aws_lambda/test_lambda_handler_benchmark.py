@@ -0,0 +1,118 @@
+from unittest.mock import patch, MagicMock
+
+import pytest
+from bisslog_schema.schema import ServiceInfo
+from bisslog_schema.use_case_code_inspector.use_case_code_metadata import UseCaseCodeInfoObject
+
+from bisslog_aws_lambda.aws_lambda.lambda_handler_benchmark import (
+    LambdaEventSynthesizer,
+    LambdaHandlerBenchmark,
+    StubUseCase,
+    format_handler_benchmark
+)
+
+
+@pytest.fixture
+def service_info():
+    return ServiceInfo.from_dict({"name": "users", "use_cases": {"get_user": {
+        "name": "get user",
+        "triggers": [
+            {"type": "http", "keyname": "get",
+             "options": {"method": "get", "path": "/users/<user_id>"}},
+            {"type": "http", "keyname": "post",
+             "options": {"method": "post", "path": "/users",
+                         "mapper": {"body.user.name": "name"}}},
+            {"type": "consumer", "keyname": "queue",
+             "options": {"queue": "users-queue", "mapper": {"event.user_id": "user_id"}}},
+            {"type": "schedule", "keyname": "daily", "options": {"cronjob": "0 12 * * ? *"}},
+            {"type": "websocket", "keyname": "ws", "options": {"route_key": "$connect"}},
+        ]
+    }}})
+
+
+@pytest.fixture
+def use_case_code_info():
+    return UseCaseCodeInfoObject(name="get_user", docs=None, module="src.use_cases.get_user",
+                                 var_name="get_user")
+
+
+def test_synthesizer_builds_events_per_trigger(service_info):
+    events = dict(LambdaEventSynthesizer()(service_info.use_cases["get_user"].triggers))
+
+    assert list(events) == ["http:get", "http:post", "sqs:queue", "sns:queue",
+                            "event_bridge:queue", "schedule:daily", "websocket:ws"]
+    assert events["http:get"]["pathParameters"] == {"user_id": "sample"}
+    assert events["http:get"]["path"] == "/users/sample"
+    assert events["http:post"]["payload"] == {"user": {"name": "sample"}}
+    assert events["sqs:queue"]["Records"][0]["body"] == {"user_id": "sample"}
+    assert "users-queue" in events["sns:queue"]["Records"][0]["EventSubscriptionArn"]
+    assert events["schedule:daily"]["detail-type"] == "Scheduled Event"
+
+
+def test_benchmark_dispatches_every_event(service_info, use_case_code_info):
+    benchmark = LambdaHandlerBenchmark(iterations=5, warmup=1, alloc_samples=2)
+
+    rows = benchmark.benchmark_use_case(service_info, use_case_code_info)
+
+    assert [row["event"] for row in rows] == ["http:get", "http:post", "sqs:queue", "sns:queue",
+                                              "event_bridge:queue", "schedule:daily",
+                                              "websocket:ws"]
+    for row in rows:
+        assert row["iterations"] == 5
+        assert 0 < row["p50_us"] <= row["p99_us"] <= row["max_us"]
+        assert row["alloc_bytes"] > 0
+    assert "http:post" in format_handler_benchmark(rows)
+
+
+def test_cold_start_tracking_is_benchmarked(service_info, use_case_code_info):
+    benchmark = LambdaHandlerBenchmark(iterations=2, warmup=0, alloc_samples=0)
+    generate_handler = benchmark.generate_handler
+    with patch.object(benchmark, "generate_handler", side_effect=generate_handler) as spy:
+        rows = benchmark.benchmark_use_case(service_info, use_case_code_info,
+                                            cold_start=True)
+
+    assert spy.call_args[1] == {"instrument": None, "cold_start": True}
+    assert "_COLD_START" in generate_handler(service_info, use_case_code_info,
+                                             cold_start=True)
+    assert len(rows) == 7
+
+
+def test_stub_receives_mapped_request(service_info, use_case_code_info):
+    benchmark = LambdaHandlerBenchmark()
+    handler_str = benchmark.generate_handler(service_info, use_case_code_info)
+    stub = StubUseCase()
+    lambda_handler = benchmark.load_handler(handler_str, stub)
+    event = dict(benchmark.synthesizer(service_info.use_cases["get_user"].triggers))["http:post"]
+
+    response = lambda_handler(event, None)
+
+    assert stub.calls == 1
+    assert response == {"statusCode": 200, "body": {"name": "sample"}}
+
+
+def test_undispatched_event_raises(service_info, use_case_code_info):
+    synthesizer = MagicMock(return_value=[("unknown", {"foo": "bar"})])
+    benchmark = LambdaHandlerBenchmark(iterations=1, synthesizer=synthesizer)
+
+    with pytest.raises(RuntimeError, match="unknown"):
+        benchmark.benchmark_use_case(service_info, use_case_code_info)
+
+
+def test_iterations_must_be_positive():
+    with pytest.raises(ValueError):
+        LambdaHandlerBenchmark(iterations=0)
+
+
+@patch("bisslog_aws_lambda.aws_lambda.lambda_handler_generator_manager.read_filtered_service_metadata")
+def test_call_filters_use_cases(mock_reader, service_info, use_case_code_info):
+    mock_reader.return_value = MagicMock(
+        declared_metadata=service_info,
+        discovered_use_cases={"get_user": use_case_code_info})
+    benchmark = LambdaHandlerBenchmark(iterations=1, warmup=0, alloc_samples=0)
+
+    rows = benchmark(metadata_file="metadata.yml", filter_uc="get")
+
+    mock_reader.assert_called_once_with(metadata_file="metadata.yml", use_cases_folder_path=None,
+                                        encoding="utf-8", filter_uc="get")
+    assert {row["use_case"] for row in rows} == {"get_user"}
+    assert rows[0]["alloc_bytes"] is None
@@ -0,0 +1,117 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from bisslog_aws_lambda.aws_lambda.lambda_handler_validator import (
+    LambdaHandlerValidator, format_handler_validation)
+
+HANDLER = """\
+from bisslog.utils.mapping import Mapper
+from not_installed_service.use_cases.get_user import get_user
+
+mapper = Mapper("mapper", {"body": "user"})
+USER = get_user
+
+
+def lambda_handler(event, context):
+    return USER(**mapper.map(event))
+"""
+
+
+def code_info(module="not_installed_service.use_cases.get_user"):
+    info = MagicMock(module=module)
+    info.name = "get_user"
+    return info
+
+
+@pytest.fixture
+def validator(tmp_path):
+    return LambdaHandlerValidator(workers=2, project_root=str(tmp_path))
+
+
+def test_valid_handler_is_imported_with_a_stubbed_use_case(validator):
+    row = validator.validate("get_user", code_info(), HANDLER)
+
+    assert row["stage"] is None
+    assert row["error"] is None
+    assert row["import_ms"] > 0
+
+
+def test_class_use_cases_are_stubbed_as_well(validator):
+    handler = HANDLER.replace("import get_user", "import GetUser").replace(
+        "USER = get_user", "USER = GetUser()")
+
+    assert validator.validate("get_user", code_info(), handler)["error"] is None
+
+
+def test_syntax_error_is_reported_without_importing(validator):
+    with patch.object(validator, "import_handler") as import_handler:
+        row = validator.validate("get_user", code_info(), HANDLER + "\ndef broken(:\n")
+
+    import_handler.assert_not_called()
+    assert row["stage"] == "compile"
+    assert row["error"].startswith("SyntaxError: ")
+    assert "(line 11)" in row["error"]
+
+
+def test_missing_dependency_is_reported(validator):
+    row = validator.validate("get_user", code_info(),
+                             "import not_installed_dependency\n" + HANDLER)
+
+    assert row["stage"] == "import"
+    assert row["error"] == "ModuleNotFoundError: No module named 'not_installed_dependency'"
+    assert row["import_ms"] is None
+
+
+def test_failing_module_code_is_reported(validator):
+    row = validator.validate("get_user", code_info(), HANDLER.replace(
+        'Mapper("mapper", {"body": "user"})', "1 / 0"))
+
+    assert row["error"] == "ZeroDivisionError: division by zero"
+
+
+def test_missing_lambda_handler_is_reported(validator):
+    row = validator.validate("get_user", code_info(), "VALUE = 1\n")
+
+    assert row == {"use_case": "get_user", "stage": "import",
+                   "error": "lambda_handler is not defined", "import_ms": None}
+
+
+def test_import_timeout_is_reported(tmp_path):
+    validator = LambdaHandlerValidator(timeout=0.5, project_root=str(tmp_path))
+
+    row = validator.validate("get_user", code_info(), "import time\ntime.sleep(5)\n")
+
+    assert row["error"] == "Import timed out after 0.5 seconds"
+
+
+def test_compile_only_does_not_start_subprocesses():
+    validator = LambdaHandlerValidator(import_check=False)
+    with patch("bisslog_aws_lambda.aws_lambda.lambda_handler_validator.subprocess.run") as run:
+        row = validator.validate("get_user", code_info(), "import not_installed_dependency\n")
+
+    run.assert_not_called()
+    assert row["error"] is None
+
+
+def test_call_validates_every_handler_in_order(validator):
+    rows = validator({
+        "get_user": (code_info(), HANDLER),
+        "list_users": (code_info(), "def lambda_handler(event, context:\n"),
+    })
+
+    assert [(row["use_case"], row["stage"]) for row in rows] == [
+        ("get_user", None), ("list_users", "compile")]
+
+
+def test_format_handler_validation():
+    text = format_handler_validation([
+        {"use_case": "get_user", "stage": None, "error": None, "import_ms": 12.5},
+        {"use_case": "list_users", "stage": "import", "error": "ImportError: boom",
+         "import_ms": None},
+    ])
+
+    lines = text.splitlines()
+    assert lines[2].split() == ["get_user", "ok", "12.50"]
+    assert lines[3].split() == ["list_users", "import"]
+    assert lines[-1] == "list_users: ImportError: boom"
@@ -0,0 +1,157 @@
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from bisslog_aws_lambda.aws_lambda.lambda_handler_watcher import LambdaHandlerWatcher
+
+METADATA = """\
+name: users
+use_cases:
+  get_user:
+    name: Get user
+    triggers:
+      - type: http
+        options: {method: get, path: "/users/{user_id}"}
+  list_users:
+    name: List users
+    triggers:
+      - type: http
+        options: {method: get, path: "/users"}
+"""
+
+USE_CASE = """\
+from bisslog import use_case
+
+
+@use_case
+def {name}(**kwargs):
+    return {value}
+"""
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    package = tmp_path / "watched_use_cases"
+    package.mkdir()
+    (package / "__init__.py").write_text("", encoding="utf-8")
+    write(package / "get_user.py", USE_CASE.format(name="get_user", value=1))
+    write(package / "list_users.py", USE_CASE.format(name="list_users", value=[]))
+    write(tmp_path / "metadata.yml", METADATA)
+    yield tmp_path
+    for name in [name for name in sys.modules if name.startswith("watched_use_cases")]:
+        del sys.modules[name]
+
+
+def write(path, content):
+    """Writes a file and moves its modification time forward, as an editor save would."""
+    mtime = path.stat().st_mtime_ns + 10 ** 9 if path.exists() else None
+    path.write_text(content, encoding="utf-8")
+    if mtime is not None:
+        os.utime(path, ns=(mtime, mtime))
+
+
+@pytest.fixture
+def watcher():
+    return LambdaHandlerWatcher(resolver=MagicMock(return_value="saved"))
+
+
+def poll(watcher, **kwargs):
+    return watcher.poll(metadata_file="metadata.yml", use_cases_folder_path="watched_use_cases",
+                        target_folder="generated", **kwargs)
+
+
+def test_first_poll_generates_every_handler(project, watcher):
+    assert sorted(poll(watcher)) == ["get_user", "list_users"]
+
+    assert watcher.resolver.call_count == 2
+    _, use_case_code_info, handler_str = watcher.resolver.call_args[0]
+    assert "def lambda_handler(event, context):" in handler_str
+    assert watcher.resolver.call_args[1] == {"target_folder": "generated", "overwrite": True}
+
+
+def test_poll_without_changes_does_nothing(project, watcher):
+    poll(watcher)
+    watcher.resolver.reset_mock()
+
+    assert poll(watcher) == []
+    watcher.resolver.assert_not_called()
+
+
+def test_metadata_change_regenerates_the_affected_handler(project, watcher):
+    poll(watcher)
+    watcher.resolver.reset_mock()
+
+    write(project / "metadata.yml", METADATA.replace(
+        'path: "/users"}', 'path: "/users", mapper: {"body.page": "page"}}'))
+
+    assert poll(watcher) == ["list_users"]
+    handler_str = watcher.resolver.call_args[0][2]
+    assert '"body.page": "page"' in handler_str
+
+
+def test_use_case_body_change_reimports_without_regenerating(project, watcher):
+    poll(watcher)
+    watcher.resolver.reset_mock()
+    module = sys.modules["watched_use_cases.get_user"]
+
+    write(project / "watched_use_cases" / "get_user.py",
+          USE_CASE.format(name="get_user", value=2))
+
+    assert poll(watcher) == []
+    assert sys.modules["watched_use_cases.get_user"] is not module
+
+
+def test_renamed_use_case_variable_regenerates_the_handler(project, watcher):
+    poll(watcher)
+    watcher.resolver.reset_mock()
+
+    write(project / "watched_use_cases" / "get_user.py",
+          USE_CASE.format(name="fetch_user", value=1))
+
+    assert poll(watcher) == ["get_user"]
+    assert watcher.resolver.call_args[0][1].var_name == "fetch_user"
+
+
+def test_removed_use_case_is_reported(project, watcher, capsys):
+    poll(watcher)
+    (project / "watched_use_cases" / "list_users.py").unlink()
+
+    assert poll(watcher) == []
+    assert "Use case list_users is no longer discovered" in capsys.readouterr().out
+
+
+def test_failed_pass_is_retried_by_next_poll(project):
+    resolver = MagicMock(side_effect=["saved", OSError("disk full"), "saved"])
+    watcher = LambdaHandlerWatcher(resolver)
+
+    with pytest.raises(OSError):
+        poll(watcher)
+
+    assert len(poll(watcher)) == 1
+    assert resolver.call_count == 3
+    assert poll(watcher) == []
+
+
+def test_filter_and_generator_options_are_forwarded(project):
+    generate = MagicMock(return_value="code")
+    watcher = LambdaHandlerWatcher(MagicMock(), generate)
+
+    assert poll(watcher, filter_uc="glob:list_*", instrument="emf", cold_start=True) == ["list_users"]
+    assert generate.call_args[1] == {"instrument": "emf", "cold_start": True}
+
+
+def test_call_keeps_watching_after_errors_until_interrupted(project, capsys):
+    watcher = LambdaHandlerWatcher(MagicMock(), interval=0)
+    with patch.object(watcher, "poll", side_effect=[RuntimeError("bad yaml"), ["get_user"]]), \
+            patch("bisslog_aws_lambda.aws_lambda.lambda_handler_watcher.time.sleep",
+                  side_effect=[None, KeyboardInterrupt]):
+        watcher(metadata_file="metadata.yml")
+
+    out = capsys.readouterr().out
+    assert "Handlers could not be regenerated: bad yaml" in out
+    assert "Regenerated 1 handlers" in out
+    assert "Stopped watching" in out
@@ -0,0 +1,101 @@
+import pytest
+
+from bisslog_aws_lambda.aws_lambda.lambda_import_profiler import (
+    LambdaImportProfiler,
+    format_import_profile
+)
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 |     leaf
+import time:       200 |        300 |   child
+import time:        50 |         50 |   sibling
+import time:       400 |        750 | parent
+import time:        10 |         10 | other
+"""
+
+HANDLER = '''\
+from src.use_cases.slow_module import SlowUseCase
+import json
+
+
+SLOW_USE_CASE = SlowUseCase()
+
+
+def lambda_handler(event, context):
+    return SLOW_USE_CASE(event)
+'''
+
+
+@pytest.fixture
+def project(tmp_path):
+    (tmp_path / "src" / "use_cases").mkdir(parents=True)
+    (tmp_path / "src" / "__init__.py").write_text("")
+    (tmp_path / "src" / "use_cases" / "__init__.py").write_text("")
+    (tmp_path / "src" / "use_cases" / "slow_module.py").write_text(
+        "import time\n"
+        "class SlowUseCase:\n"
+        "    def __init__(self):\n"
+        "        time.sleep(0.02)\n"
+        "    def __call__(self, event):\n"
+        "        return event\n"
+    )
+    handlers = tmp_path / "framework" / "lambda_aws"
+    handlers.mkdir(parents=True)
+    (handlers / "__init__.py").write_text("")
+    (handlers / "slow_handler.py").write_text(HANDLER)
+    return tmp_path
+
+
+def test_parse_importtime_builds_tree():
+    tree = LambdaImportProfiler.parse_importtime(IMPORTTIME_OUTPUT)
+
+    assert [node["module"] for node in tree] == ["parent", "other"]
+    parent = tree[0]
+    assert parent["cumulative_us"] == 750
+    assert [child["module"] for child in parent["children"]] == ["child", "sibling"]
+    assert parent["children"][0]["children"][0]["module"] == "leaf"
+
+
+def test_split_statements_classifies_top_level_code():
+    kinds = [kind for kind, _ in LambdaImportProfiler.split_statements(HANDLER)]
+
+    assert kinds == ["import", "import", "build", "definition"]
+
+
+def test_prune_sorts_and_filters():
+    profiler = LambdaImportProfiler(min_us=60, max_depth=1)
+
+    pruned = profiler._prune(LambdaImportProfiler.parse_importtime(IMPORTTIME_OUTPUT))
+
+    assert [node["module"] for node in pruned] == ["parent"]
+    assert pruned[0]["children"] == []
+
+
+def test_profile_reports_imports_and_build_time(project):
+    reports = LambdaImportProfiler()(
+        handlers_folder=str(project / "framework" / "lambda_aws"), project_root=str(project))
+
+    assert len(reports) == 1
+    report = reports[0]
+    modules = [node["module"] for node in report["imports"]]
+    assert "src.use_cases.slow_module" in modules
+    build = [s for s in report["statements"] if s["kind"] == "build"]
+    assert build[0]["statement"] == "SLOW_USE_CASE = SlowUseCase()"
+    assert report["build_ms"] >= 20
+    text = format_import_profile(reports)
+    assert "src.use_cases.slow_module" in text
+    assert "[build] SLOW_USE_CASE = SlowUseCase()" in text
+
+
+def test_profile_raises_when_handler_fails(project):
+    handlers = project / "framework" / "lambda_aws"
+    (handlers / "broken_handler.py").write_text("import missing_module_xyz\n")
+
+    with pytest.raises(RuntimeError, match="missing_module_xyz"):
+        LambdaImportProfiler()("broken_handler", str(handlers), str(project))
+
+
+def test_missing_handler_raises(project):
+    with pytest.raises(FileNotFoundError):
+        LambdaImportProfiler()("nope", str(project / "framework" / "lambda_aws"), str(project))
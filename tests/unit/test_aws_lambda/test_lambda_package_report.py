@@ -0,0 +1,88 @@
+import zipfile
+
+import pytest
+
+from bisslog_aws_lambda.aws_lambda.lambda_package_report import (
+    LambdaPackageAnalyzer,
+    format_package_report
+)
+
+
+def build_zip(path, files):
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as z:
+        for name, content in files.items():
+            z.writestr(name, content)
+    return str(path)
+
+
+@pytest.fixture
+def zips(tmp_path):
+    shared = "x = 1\n" * 1000
+    first = build_zip(tmp_path / "a.zip", {
+        "lambda_function.py": "a = 1",
+        "src/domain/big.py": "y = 2\n" * 5000,
+        "src/domain/small.py": "z = 3",
+        "bisslog/core.py": shared,
+    })
+    second = build_zip(tmp_path / "b.zip", {
+        "lambda_function.py": "b = 2",
+        "bisslog/core.py": shared,
+    })
+    return [first, second]
+
+
+def test_analyze_reports_sizes_and_largest_entries(zips):
+    report = LambdaPackageAnalyzer(top=2).analyze(zips[0])
+
+    assert report["files"] == 4
+    assert report["uncompressed_size"] == 5 + 30000 + 5 + 6000
+    assert report["compressed_size"] < report["uncompressed_size"]
+    assert report["zip_size"] > report["compressed_size"]
+    assert [m["path"] for m in report["largest_modules"]] == ["src/domain/big.py",
+                                                             "bisslog/core.py"]
+    assert [p["path"] for p in report["largest_packages"]] == ["src", "src/domain"]
+    assert report["largest_packages"][0]["uncompressed_size"] == 30005
+
+
+def test_duplicates_across_zips(zips):
+    report = LambdaPackageAnalyzer()(zips)
+
+    assert [d["path"] for d in report["duplicates"]] == ["bisslog/core.py"]
+    assert report["duplicates"][0]["zips"] == zips
+    assert report["violations"] == []
+
+
+def test_budget_violations_fail_the_build(zips):
+    analyzer = LambdaPackageAnalyzer(max_unzipped_size=10000, max_zipped_size=10)
+
+    report = analyzer(zips)
+
+    assert len(report["violations"]) == 3
+    with pytest.raises(RuntimeError):
+        analyzer.check_budget(report)
+
+
+def test_format_package_report(zips):
+    analyzer = LambdaPackageAnalyzer(max_unzipped_size=10000)
+    text = format_package_report(analyzer(zips))
+
+    assert zips[0] in text
+    assert "29.3 KiB" in text
+    assert "bisslog/core.py (2 zips)" in text
+    assert "BUDGET EXCEEDED" in text
+
+
+@pytest.mark.parametrize("size, expected", [
+    ("1024", 1024),
+    ("250MB", 250_000_000),
+    ("250 MiB", 250 * 1024 * 1024),
+    ("1.5k", 1500),
+    ("10b", 10),
+])
+def test_parse_size(size, expected):
+    assert LambdaPackageAnalyzer.parse_size(size) == expected
+
+
+def test_parse_size_rejects_invalid():
+    with pytest.raises(ValueError):
+        LambdaPackageAnalyzer.parse_size("big")
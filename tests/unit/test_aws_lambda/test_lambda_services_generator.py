@@ -0,0 +1,132 @@
+import json
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+from bisslog_aws_lambda.aws_lambda.lambda_services_generator import (
+    LambdaServicesGenerator, format_services_generation)
+
+USE_CASE = """\
+from bisslog import use_case
+from monorepo_shared import shared_imports
+
+shared_imports.append(__name__)
+
+
+@use_case
+def {name}(**kwargs):
+    return None
+"""
+
+
+@pytest.fixture
+def monorepo(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    (tmp_path / "monorepo_shared.py").write_text("shared_imports = []\n", encoding="utf-8")
+    for service, use_cases in (("svc_users", ["get_user", "list_users"]),
+                               ("svc_orders", ["create_order"])):
+        package = tmp_path / service / "use_cases"
+        package.mkdir(parents=True)
+        (tmp_path / service / "__init__.py").write_text("", encoding="utf-8")
+        (package / "__init__.py").write_text("", encoding="utf-8")
+        for name in use_cases:
+            (package / f"{name}.py").write_text(USE_CASE.format(name=name), encoding="utf-8")
+        (tmp_path / service / "metadata.json").write_text(json.dumps({
+            "name": service,
+            "use_cases": {name: {"name": name, "triggers": [
+                {"type": "http", "options": {"method": "get", "path": f"/{name}"}}]}
+                for name in use_cases},
+        }), encoding="utf-8")
+    yield tmp_path
+    for name in [name for name in sys.modules if name.startswith(("svc_", "monorepo_"))]:
+        del sys.modules[name]
+
+
+def service(name, **options):
+    return dict({"metadata_file": f"{name}/metadata.json",
+                 "use_cases_folder_path": f"{name}/use_cases",
+                 "target_folder": f"generated/{name}"}, **options)
+
+
+def test_generates_every_service_in_one_process(monorepo):
+    rows = LambdaServicesGenerator(workers=2)([service("svc_users"), service("svc_orders")])
+
+    assert [(row["metadata_file"], row["handlers"]) for row in rows] == [
+        ("svc_users/metadata.json", 2), ("svc_orders/metadata.json", 1)]
+    assert sorted(path.name for path in (monorepo / "generated").rglob("*_handler.py")) == [
+        "create_order_handler.py", "get_user_handler.py", "list_users_handler.py"]
+    handler = (monorepo / "generated" / "svc_orders" / "create_order_handler.py").read_text()
+    assert "from svc_orders.use_cases.create_order import create_order" in handler
+    assert len(sys.modules["monorepo_shared"].shared_imports) == 3
+
+
+def test_generator_options_and_filters_are_applied(monorepo):
+    resolver, generate = MagicMock(), MagicMock(return_value="code")
+
+    rows = LambdaServicesGenerator(resolver, generate)(
+        [service("svc_users", filter_uc="glob:list_*")], instrument="json", cold_start=True)
+
+    assert rows[0]["handlers"] == 1
+    assert generate.call_args[1] == {"instrument": "json", "cold_start": True}
+    assert resolver.call_args[1] == {"target_folder": "generated/svc_users"}
+
+
+def test_generate_service_forwards_manager_options(monorepo, capsys):
+    resolver, generate = MagicMock(), MagicMock(return_value="code")
+
+    row = LambdaServicesGenerator(resolver, generate).generate_service(
+        service("svc_users"), shard=lambda keyname: keyname == "get_user")
+
+    assert row["handlers"] == 1
+    assert resolver.call_args[0][1].name == "get_user"
+    assert "Handler for" not in capsys.readouterr().out
+
+
+def test_failures_are_reported_after_every_service(monorepo):
+    resolver = MagicMock()
+
+    with pytest.raises(RuntimeError) as error:
+        LambdaServicesGenerator(resolver, MagicMock(return_value="code"))(
+            [service("svc_missing"), service("svc_orders")])
+
+    assert "1 services" in str(error.value)
+    assert "svc_missing/metadata.json" in str(error.value)
+    resolver.assert_called_once()
+
+
+def test_unknown_service_options_are_rejected():
+    with pytest.raises(ValueError, match="Unknown service options"):
+        LambdaServicesGenerator()([{"metadata_file": "m.yml", "target": "x"}])
+
+
+@pytest.mark.parametrize("content", [
+    "services:\n  - metadata_file: a.yml\n    target_folder: out\n",
+    "- metadata_file: a.yml\n  target_folder: out\n",
+])
+def test_read_manifest(tmp_path, content):
+    manifest = tmp_path / "services.yml"
+    manifest.write_text(content, encoding="utf-8")
+
+    assert LambdaServicesGenerator.read_manifest(str(manifest)) == [
+        {"metadata_file": "a.yml", "target_folder": "out"}]
+
+
+def test_read_manifest_requires_a_list_of_services(tmp_path):
+    manifest = tmp_path / "services.json"
+    manifest.write_text('{"name": "x"}', encoding="utf-8")
+
+    with pytest.raises(ValueError, match="must contain a list of services"):
+        LambdaServicesGenerator.read_manifest(str(manifest))
+
+
+def test_format_services_generation():
+    table = format_services_generation([
+        {"metadata_file": "a/metadata.yml", "handlers": 2, "seconds": 0.5},
+        {"metadata_file": "b/metadata.yml", "handlers": 3, "seconds": 0.25}])
+
+    lines = table.splitlines()
+    assert lines[0].startswith("service")
+    assert "a/metadata.yml" in lines[2] and lines[2].endswith("0.500")
+    assert lines[-1].split() == ["total", "5"]
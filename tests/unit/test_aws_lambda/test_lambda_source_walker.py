@@ -0,0 +1,166 @@
+import os
+
+import pytest
+
+from bisslog_aws_lambda.aws_lambda.lambda_source_walker import (
+    LambdaSourceWalker,
+    PathPattern,
+    PathRules
+)
+
+
+@pytest.fixture
+def project(tmp_path):
+    files = [
+        "src/__init__.py",
+        "src/domain/use_case.py",
+        "src/domain/schema.json",
+        "src/domain/use_case_test.py",
+        "src/tests/test_use_case.py",
+        "src/migrations/0001_initial.py",
+        "src/__pycache__/cached.py",
+        "src/scratch/tmp_generated.py",
+    ]
+    for name in files:
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("")
+    return tmp_path
+
+
+def walk(walker, folder):
+    return [arcname for _, arcname in walker(folder)]
+
+
+@pytest.mark.parametrize("pattern, path, is_dir, expected", [
+    ("*.py", "src/domain/use_case.py", False, True),
+    ("*.py", "src/domain/schema.json", False, False),
+    ("tests/", "src/tests", True, True),
+    ("tests/", "src/tests", False, False),
+    ("src/tests", "src/tests", True, True),
+    ("/tests", "src/tests", True, False),
+    ("src/**/*_test.py", "src/domain/use_case_test.py", False, True),
+    ("src/**/*_test.py", "src/use_case_test.py", False, True),
+    ("**/migrations", "src/migrations", True, True),
+    ("0???_*.py", "src/migrations/0001_initial.py", False, True),
+    ("[!a-z]*.py", "src/1.py", False, True),
+    ("[!a-z]*.py", "src/a.py", False, False),
+])
+def test_path_pattern_matches(pattern, path, is_dir, expected):
+    assert PathPattern(pattern).matches(path, is_dir) is expected
+
+
+def test_path_rules_last_match_wins():
+    rules = PathRules(["# comment", "", "*.py", "!keep.py"])
+
+    assert rules.match("src/drop.py", False) is True
+    assert rules.match("src/keep.py", False) is False
+    assert rules.match("src/data.json", False) is None
+
+
+def test_path_rules_relative_to_base():
+    rules = PathRules(["/local.py"], base="src/domain")
+
+    assert rules.match("src/domain/local.py", False) is True
+    assert rules.match("src/local.py", False) is None
+
+
+def test_default_walker_includes_python_files_and_skips_pycache(project):
+    arcnames = walk(LambdaSourceWalker(), project / "src")
+
+    assert "src/domain/use_case.py" in arcnames
+    assert "src/tests/test_use_case.py" in arcnames
+    assert "src/domain/schema.json" not in arcnames
+    assert "src/__pycache__/cached.py" not in arcnames
+
+
+def test_exclude_patterns_prune_directories(project, monkeypatch):
+    scanned = []
+    original_scandir = os.scandir
+
+    def tracking_scandir(path):
+        scanned.append(os.path.basename(path))
+        return original_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", tracking_scandir)
+    walker = LambdaSourceWalker(exclude=["tests/", "migrations/", "*_test.py"])
+
+    arcnames = walk(walker, project / "src")
+
+    assert arcnames == ["src/__init__.py", "src/domain/use_case.py",
+                        "src/scratch/tmp_generated.py"]
+    assert "tests" not in scanned
+    assert "migrations" not in scanned
+
+
+def test_include_patterns(project):
+    walker = LambdaSourceWalker(include=["*.json", "src/__init__.py"])
+
+    assert walk(walker, project / "src") == ["src/__init__.py", "src/domain/schema.json"]
+
+
+def test_ignore_files_are_honoured(project):
+    (project / ".gitignore").write_text("scratch/\n")
+    (project / "src" / "domain" / ".lambdaignore").write_text("*_test.py\n")
+
+    arcnames = walk(LambdaSourceWalker(use_ignore_files=True), project / "src")
+
+    assert "src/scratch/tmp_generated.py" not in arcnames
+    assert "src/domain/use_case_test.py" not in arcnames
+    assert "src/domain/use_case.py" in arcnames
+    assert "src/tests/test_use_case.py" in arcnames
+
+
+def test_ignore_files_are_disabled_by_default(project):
+    (project / ".gitignore").write_text("scratch/\n")
+
+    assert "src/scratch/tmp_generated.py" in walk(LambdaSourceWalker(), project / "src")
+
+
+def test_explicit_exclude_overrides_ignore_file_negation(project):
+    (project / ".gitignore").write_text("!tests/\n")
+
+    walker = LambdaSourceWalker(exclude=["tests/"], use_ignore_files=True)
+
+    assert "src/tests/test_use_case.py" not in walk(walker, project / "src")
+
+
+def test_assets_are_matched_in_the_same_walk(project, monkeypatch):
+    (project / "src" / "templates").mkdir()
+    (project / "src" / "templates" / "mail.html").write_text("<p></p>")
+    scanned = []
+    original_scandir = os.scandir
+
+    def tracking_scandir(path):
+        scanned.append(path)
+        return original_scandir(path)
+
+    monkeypatch.setattr(os, "scandir", tracking_scandir)
+    walker = LambdaSourceWalker(exclude=["tests/", "migrations/", "scratch/"],
+                                assets=["*.json", "src/templates/**"])
+
+    arcnames = walk(walker, project / "src")
+
+    assert arcnames == ["src/__init__.py", "src/domain/schema.json", "src/domain/use_case.py",
+                        "src/domain/use_case_test.py", "src/templates/mail.html"]
+    assert len(scanned) == len(set(scanned)) == 3
+
+
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="symbolic links not supported")
+def test_symlinks_do_not_loop_or_leave_the_source_folder(project, tmp_path):
+    outside = tmp_path / "outside.py"
+    outside.write_text("")
+    try:
+        os.symlink(project / "src", project / "src" / "domain" / "loop",
+                   target_is_directory=True)
+        os.symlink(outside, project / "src" / "outside_link.py")
+        os.symlink(project / "src" / "domain" / "use_case.py", project / "src" / "alias.py")
+    except OSError:
+        pytest.skip("symbolic links not permitted")
+
+    arcnames = walk(LambdaSourceWalker(), project / "src")
+
+    assert not any("loop" in arcname for arcname in arcnames)
+    assert "src/outside_link.py" not in arcnames
+    assert "src/alias.py" in arcnames
+    assert "src/domain/use_case.py" in arcnames
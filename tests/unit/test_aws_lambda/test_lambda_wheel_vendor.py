@@ -0,0 +1,172 @@
+import zipfile
+
+import pytest
+
+from bisslog_aws_lambda.aws_lambda.lambda_wheel_vendor import LambdaWheelVendor
+
+
+def build_wheel(folder, filename, files):
+    path = folder / filename
+    with zipfile.ZipFile(path, "w") as z:
+        for name, content in files.items():
+            z.writestr(name, content)
+    return path
+
+
+@pytest.fixture
+def wheelhouse(tmp_path):
+    folder = tmp_path / "wheelhouse"
+    folder.mkdir()
+    build_wheel(folder, "bisslog-0.0.9-py3-none-any.whl", {
+        "bisslog/__init__.py": "VERSION = '0.0.9'",
+        "bisslog-0.0.9.dist-info/METADATA": "Name: bisslog",
+    })
+    build_wheel(folder, "bisslog_schema-0.0.8-py3-none-any.whl", {
+        "bisslog_schema/__init__.py": "",
+        "bisslog_schema-0.0.8.data/purelib/extra_module.py": "X = 1",
+        "bisslog_schema-0.0.8.data/scripts/tool": "#!/bin/sh",
+    })
+    build_wheel(folder, "pyyaml-6.0-py3-none-any.whl", {"yaml/__init__.py": "V = 6"})
+    build_wheel(folder, "pyyaml-5.4-py3-none-any.whl", {"yaml/__init__.py": "V = 5"})
+    (folder / "README.txt").write_text("not a wheel")
+    return folder
+
+
+def test_resolves_requirements_by_normalized_name(wheelhouse, tmp_path):
+    vendor = LambdaWheelVendor(str(wheelhouse), ["Bisslog_Schema", "bisslog==0.0.9"],
+                               cache_dir=str(tmp_path / "cache"))
+
+    wheels = vendor.resolve()
+
+    assert [w.name for w in wheels] == [
+        "bisslog_schema-0.0.8-py3-none-any.whl", "bisslog-0.0.9-py3-none-any.whl"]
+
+
+def test_pinned_version_selects_wheel(wheelhouse, tmp_path):
+    vendor = LambdaWheelVendor(str(wheelhouse), ["PyYAML==5.4 ; python_version >= '3'"],
+                               cache_dir=str(tmp_path / "cache"))
+
+    assert [w.name for w in vendor.resolve()] == ["pyyaml-5.4-py3-none-any.whl"]
+
+
+def test_unpinned_ambiguous_requirement_raises(wheelhouse, tmp_path):
+    vendor = LambdaWheelVendor(str(wheelhouse), ["pyyaml"], cache_dir=str(tmp_path / "cache"))
+
+    with pytest.raises(ValueError):
+        vendor.resolve()
+
+
+@pytest.fixture
+def platform_wheelhouse(tmp_path):
+    folder = tmp_path / "platform_wheelhouse"
+    folder.mkdir()
+    for platform in ("manylinux_2_17_x86_64.manylinux2014_x86_64", "manylinux2014_aarch64"):
+        build_wheel(folder, f"pkg-1.2.3-cp311-cp311-{platform}.whl",
+                    {"pkg/__init__.py": f"PLATFORM = {platform!r}"})
+    build_wheel(folder, "pure-1.0-py3-none-any.whl", {"pure/__init__.py": ""})
+    return folder
+
+
+def test_pinned_requirement_with_several_platforms_reports_tags(platform_wheelhouse, tmp_path):
+    vendor = LambdaWheelVendor(str(platform_wheelhouse), ["pkg==1.2.3"],
+                               cache_dir=str(tmp_path / "cache"))
+
+    with pytest.raises(ValueError, match="several platforms") as error:
+        vendor.resolve()
+    assert "manylinux2014_aarch64" in str(error.value)
+    assert "Pin an exact version" not in str(error.value)
+
+
+@pytest.mark.parametrize("platform, expected", [
+    ("manylinux2014_aarch64", "pkg-1.2.3-cp311-cp311-manylinux2014_aarch64.whl"),
+    ("manylinux2014_x86_64",
+     "pkg-1.2.3-cp311-cp311-manylinux_2_17_x86_64.manylinux2014_x86_64.whl"),
+])
+def test_platforms_select_the_wheel(platform_wheelhouse, tmp_path, platform, expected):
+    vendor = LambdaWheelVendor(str(platform_wheelhouse), ["pkg==1.2.3", "pure"],
+                               cache_dir=str(tmp_path / "cache"), platforms=[platform])
+
+    assert [w.name for w in vendor.resolve()] == [expected, "pure-1.0-py3-none-any.whl"]
+
+
+def test_missing_requirement_raises(wheelhouse, tmp_path):
+    vendor = LambdaWheelVendor(str(wheelhouse), ["boto3"], cache_dir=str(tmp_path / "cache"))
+
+    with pytest.raises(FileNotFoundError):
+        vendor.resolve()
+
+
+def test_missing_wheelhouse_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        LambdaWheelVendor(str(tmp_path / "missing"), [])
+
+
+def test_extracts_installed_layout_into_content_addressed_cache(wheelhouse, tmp_path):
+    cache = tmp_path / "cache"
+    vendor = LambdaWheelVendor(str(wheelhouse), ["bisslog-schema"], cache_dir=str(cache))
+
+    folders = vendor()
+
+    assert len(folders) == 1
+    folder = folders[0]
+    assert folder.parent == cache
+    assert len(folder.name) == 64
+    assert (folder / "bisslog_schema" / "__init__.py").is_file()
+    assert (folder / "extra_module.py").read_text() == "X = 1"
+    assert not (folder / "tool").exists()
+    assert [p.name for p in cache.iterdir()] == [folder.name]
+
+
+@pytest.mark.parametrize("member", [
+    "../../escaped.py",
+    "evil-1.0.data/purelib/../../escaped.py",
+    "evil/../../escaped.py",
+])
+def test_members_outside_the_install_folder_are_rejected(tmp_path, member):
+    wheelhouse = tmp_path / "wheelhouse"
+    wheelhouse.mkdir()
+    build_wheel(wheelhouse, "evil-1.0-py3-none-any.whl", {
+        "evil/__init__.py": "",
+        member: "PWNED = True",
+    })
+    cache = tmp_path / "deep" / "cache"
+    vendor = LambdaWheelVendor(str(wheelhouse), ["evil"], cache_dir=str(cache))
+
+    with pytest.raises(ValueError, match="outside its install folder"):
+        vendor()
+
+    assert not list(tmp_path.rglob("escaped.py"))
+    assert list(cache.iterdir()) == []
+
+
+def test_cache_is_reused_across_vendors(wheelhouse, tmp_path, monkeypatch):
+    cache = tmp_path / "cache"
+    first = LambdaWheelVendor(str(wheelhouse), ["bisslog"], cache_dir=str(cache))()
+    marker = first[0] / "marker"
+    marker.write_text("kept")
+
+    def fail_open(*_, **__):
+        raise AssertionError("wheel should not be extracted again")
+
+    monkeypatch.setattr(zipfile, "ZipFile", fail_open)
+    second = LambdaWheelVendor(str(wheelhouse), ["bisslog"], cache_dir=str(cache))()
+
+    assert second == first
+    assert marker.read_text() == "kept"
+
+
+def test_default_cache_dir_from_env(wheelhouse, tmp_path, monkeypatch):
+    monkeypatch.setenv("BISSLOG_WHEEL_CACHE", str(tmp_path / "env_cache"))
+
+    vendor = LambdaWheelVendor(str(wheelhouse), [])
+
+    assert vendor.cache_dir == tmp_path / "env_cache"
+
+
+def test_read_requirements_file_skips_comments_and_options(tmp_path):
+    requirements = tmp_path / "requirements.txt"
+    requirements.write_text(
+        "# deps\n--index-url https://example.org\nbisslog>=0.0.6  # core\n\nbisslog-schema\n")
+
+    assert LambdaWheelVendor.read_requirements_file(str(requirements)) == [
+        "bisslog>=0.0.6", "bisslog-schema"]
@@ -0,0 +1,77 @@
+import zipfile
+
+import pytest
+
+from bisslog_aws_lambda.aws_lambda.lambda_zip_compression import (
+    LambdaZipCompression,
+    format_compression_benchmark
+)
+
+
+def test_default_deflates_sources():
+    assert LambdaZipCompression().resolve("src/main.py", 100) == (zipfile.ZIP_DEFLATED, None)
+
+
+def test_default_level_is_applied():
+    compression = LambdaZipCompression(level=9)
+    assert compression.resolve("src/main.py", 100) == (zipfile.ZIP_DEFLATED, 9)
+
+
+def test_precompressed_extensions_are_stored():
+    compression = LambdaZipCompression(level=9)
+    assert compression.resolve("assets/logo.PNG", 100) == (zipfile.ZIP_STORED, None)
+
+
+def test_large_files_are_stored():
+    compression = LambdaZipCompression(store_larger_than=1000)
+    assert compression.resolve("lib/huge.so", 1001) == (zipfile.ZIP_STORED, None)
+    assert compression.resolve("lib/small.so", 1000) == (zipfile.ZIP_DEFLATED, None)
+
+
+def test_extension_rules_take_precedence():
+    compression = LambdaZipCompression(
+        method="store", store_larger_than=10,
+        extension_rules={"json": ("deflate", 9), ".gz": ("deflate", 1)})
+
+    assert compression.resolve("schemas/user.json", 100) == (zipfile.ZIP_DEFLATED, 9)
+    assert compression.resolve("data/archive.gz", 100) == (zipfile.ZIP_DEFLATED, 1)
+    assert compression.resolve("src/main.py", 5) == (zipfile.ZIP_STORED, None)
+
+
+def test_files_without_extension():
+    assert LambdaZipCompression(method="store").resolve("bin/tool", 5) == (zipfile.ZIP_STORED, None)
+
+
+@pytest.mark.parametrize("rule, expected", [
+    (".json=deflate:9", (".json", ("deflate", 9))),
+    ("SO=store", (".so", ("store", None))),
+])
+def test_parse_rule(rule, expected):
+    assert LambdaZipCompression.parse_rule(rule) == expected
+
+
+@pytest.mark.parametrize("rule", ["json", "=store", "json="])
+def test_parse_rule_rejects_malformed(rule):
+    with pytest.raises(ValueError):
+        LambdaZipCompression.parse_rule(rule)
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"method": "lzma"},
+    {"level": 10},
+    {"extension_rules": {".json": ("bzip2", None)}},
+])
+def test_rejects_invalid_configuration(kwargs):
+    with pytest.raises(ValueError):
+        LambdaZipCompression(**kwargs)
+
+
+def test_format_compression_benchmark():
+    table = format_compression_benchmark([{
+        "strategy": "store", "zip_size": 10, "uncompressed_size": 10,
+        "build_ms": 1.5, "extract_ms": 0.25
+    }])
+
+    assert "strategy" in table.splitlines()[0]
+    assert "store" in table.splitlines()[2]
+    assert "1.50" in table
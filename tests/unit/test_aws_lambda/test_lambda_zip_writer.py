@@ -0,0 +1,61 @@
+import io
+import zipfile
+
+import pytest
+
+from bisslog_aws_lambda.aws_lambda.lambda_bytecode_compiler import LambdaBytecodeCompiler
+from bisslog_aws_lambda.aws_lambda.lambda_zip_compression import LambdaZipCompression
+from bisslog_aws_lambda.aws_lambda.lambda_zip_writer import LambdaZipWriter
+
+
+@pytest.fixture
+def zip_buffer():
+    return io.BytesIO()
+
+
+def test_writestr_is_world_readable_and_uses_strategy(zip_buffer):
+    with zipfile.ZipFile(zip_buffer, "w") as zipf:
+        writer = LambdaZipWriter(zipf, compression=LambdaZipCompression(method="store"))
+        writer.writestr("lambda_function.py", b"x = 1")
+
+    with zipfile.ZipFile(zip_buffer) as zipf:
+        info = zipf.getinfo("lambda_function.py")
+        assert info.compress_type == zipfile.ZIP_STORED
+        assert info.external_attr >> 16 == 0o644
+
+
+def test_write_file_uses_per_extension_rule(zip_buffer, tmp_path):
+    image = tmp_path / "logo.png"
+    image.write_bytes(b"\x89PNG" * 100)
+    source = tmp_path / "main.py"
+    source.write_text("x = 1\n" * 100)
+
+    with zipfile.ZipFile(zip_buffer, "w") as zipf:
+        writer = LambdaZipWriter(zipf)
+        writer.write_file(image, "assets/logo.png")
+        writer.write_file(source, "src/main.py")
+
+    with zipfile.ZipFile(zip_buffer) as zipf:
+        assert zipf.getinfo("assets/logo.png").compress_type == zipfile.ZIP_STORED
+        assert zipf.getinfo("src/main.py").compress_type == zipfile.ZIP_DEFLATED
+
+
+def test_write_python_source_keeps_source_when_requested(zip_buffer):
+    compiler = LambdaBytecodeCompiler()
+    with zipfile.ZipFile(zip_buffer, "w") as zipf:
+        writer = LambdaZipWriter(zipf, compiler, strip_sources=True)
+        writer.write_python_source(b"x = 1", "lambda_function.py", keep_source=True)
+        writer.write_python_source(b"y = 2", "module.py")
+
+    with zipfile.ZipFile(zip_buffer) as zipf:
+        names = zipf.namelist()
+        assert "lambda_function.py" in names
+        assert compiler.pyc_arcname("lambda_function.py") in names
+        assert "module.pyc" in names
+        assert "module.py" not in names
+
+
+def test_strip_sources_requires_compiler(zip_buffer):
+    with zipfile.ZipFile(zip_buffer, "w") as zipf:
+        with pytest.raises(ValueError):
+            LambdaZipWriter(zipf, strip_sources=True)
@@ -0,0 +1,12 @@
+import pytest
+
+from bisslog_aws_lambda.aws_lambda.latency_stats import percentile
+
+
+@pytest.mark.parametrize("percent, expected", [(0, 1), (50, 5), (90, 9), (99, 10), (100, 10)])
+def test_percentile_uses_nearest_rank(percent, expected):
+    assert percentile(list(range(1, 11)), percent) == expected
+
+
+def test_percentile_of_a_single_value():
+    assert percentile([3.5], 99) == 3.5
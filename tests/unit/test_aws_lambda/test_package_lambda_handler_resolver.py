@@ -0,0 +1,51 @@
+import zipfile
+from unittest.mock import MagicMock
+
+import pytest
+
+from bisslog_aws_lambda.aws_lambda.lambda_aws_packager import LambdaAWSPackager
+from bisslog_aws_lambda.aws_lambda.lambda_zip_compression import LambdaZipCompression
+from bisslog_aws_lambda.aws_lambda.package_lambda_handler_resolver import \
+    PackageLambdaHandlerResolver
+
+
+@pytest.fixture
+def src_folder(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    src = tmp_path / "src"
+    (src / "use_cases").mkdir(parents=True)
+    (src / "use_cases" / "get_user.py").write_text("get_user = None\n")
+    return src
+
+
+def use_case(name):
+    info = MagicMock()
+    info.name = name
+    return info
+
+
+def test_handler_is_packaged_as_lambda_function(src_folder, tmp_path):
+    resolver = PackageLambdaHandlerResolver("src")
+
+    res = resolver(MagicMock(), use_case("get_user"), "def lambda_handler(e, c): pass\n",
+                   output_dir="dist", compression=LambdaZipCompression(method="store"))
+
+    assert res == "Handler packaged to get_user_handler.zip"
+    assert resolver.zip_paths == [str(tmp_path / "dist" / "get_user_handler.zip")]
+    with zipfile.ZipFile(resolver.zip_paths[0]) as z:
+        assert z.read("lambda_function.py") == b"def lambda_handler(e, c): pass\n"
+        assert "src/use_cases/get_user.py" in z.namelist()
+        assert z.getinfo("src/use_cases/get_user.py").compress_type == zipfile.ZIP_STORED
+    assert not (tmp_path / "framework").exists()
+
+
+def test_sources_are_scanned_once(src_folder):
+    packager = LambdaAWSPackager()
+    packager.scan_sources = MagicMock(wraps=packager.scan_sources)
+    resolver = PackageLambdaHandlerResolver(["src"], packager=packager)
+
+    for name in ("get_user", "list_users", "create_user"):
+        resolver(MagicMock(), use_case(name), "x = 1\n", output_dir="dist")
+
+    packager.scan_sources.assert_called_once_with(["src"], None, None)
+    assert len(resolver.zip_paths) == 3
@@ -0,0 +1,96 @@
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from bisslog_aws_lambda.aws_lambda.service_metadata_cache import ServiceMetadataCache
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("SERVICE_METADATA_PATH", raising=False)
+    monkeypatch.delenv("BISSLOG_USE_CASES_FOLDER", raising=False)
+    (tmp_path / "metadata.yml").write_text("name: users\n", encoding="utf-8")
+    package = tmp_path / "src" / "use_cases"
+    package.mkdir(parents=True)
+    (tmp_path / "src" / "__init__.py").write_text("", encoding="utf-8")
+    (package / "__init__.py").write_text("", encoding="utf-8")
+    (package / "get_user.py").write_text("get_user = None\n", encoding="utf-8")
+    return tmp_path
+
+
+@pytest.fixture
+def reader():
+    return MagicMock(side_effect=lambda **kwargs: {"read": kwargs})
+
+
+def test_second_read_is_served_from_cache(project, reader, capsys):
+    cache = ServiceMetadataCache(str(project / ".cache" / "metadata.pickle"), reader)
+
+    first = cache(metadata_file="metadata.yml", use_cases_folder_path="src/use_cases")
+    second = cache(metadata_file="metadata.yml", use_cases_folder_path="src/use_cases")
+
+    assert first == second == {"read": {"metadata_file": "metadata.yml",
+                                        "use_cases_folder_path": "src/use_cases",
+                                        "encoding": "utf-8"}}
+    reader.assert_called_once()
+    assert "Using cached service metadata" in capsys.readouterr().err
+
+
+def test_default_locations_are_resolved(project, reader):
+    cache = ServiceMetadataCache(str(project / "metadata.pickle"), reader)
+
+    cache()
+    cache(metadata_file="./metadata.yml", use_cases_folder_path="src.use_cases")
+
+    reader.assert_called_once()
+
+
+@pytest.mark.parametrize("change", ["metadata", "use_case", "new_module", "encoding"])
+def test_changes_invalidate_the_cache(project, reader, change):
+    cache = ServiceMetadataCache(str(project / "metadata.pickle"), reader)
+    cache(metadata_file="metadata.yml")
+    encoding = "utf-8"
+
+    if change == "metadata":
+        (project / "metadata.yml").write_text("name: accounts\n", encoding="utf-8")
+    elif change == "use_case":
+        module = project / "src" / "use_cases" / "get_user.py"
+        stat = module.stat()
+        os.utime(module, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    elif change == "new_module":
+        (project / "src" / "use_cases" / "create_user.py").write_text("", encoding="utf-8")
+    else:
+        encoding = "latin-1"
+    cache(metadata_file="metadata.yml", encoding=encoding)
+
+    assert reader.call_count == 2
+
+
+def test_corrupted_cache_is_ignored(project, reader):
+    cache_file = project / "metadata.pickle"
+    cache_file.write_bytes(b"not a pickle")
+
+    result = ServiceMetadataCache(str(cache_file), reader)(metadata_file="metadata.yml")
+
+    assert result["read"]["metadata_file"] == "metadata.yml"
+    assert ServiceMetadataCache(str(cache_file), reader)(metadata_file="metadata.yml") == result
+    reader.assert_called_once()
+
+
+def test_unpicklable_result_is_returned_without_caching(project, capsys):
+    reader = MagicMock(side_effect=lambda **kwargs: {"fn": lambda: None})
+    cache_file = project / "metadata.pickle"
+
+    result = ServiceMetadataCache(str(cache_file), reader)(metadata_file="metadata.yml")
+
+    assert "fn" in result
+    assert not cache_file.exists()
+    assert "could not be cached" in capsys.readouterr().err
+
+
+def test_missing_metadata_file_raises(project, reader):
+    with pytest.raises(ValueError):
+        ServiceMetadataCache(str(project / "metadata.pickle"), reader)(metadata_file="nope.yml")
+    reader.assert_not_called()
@@ -0,0 +1,41 @@
+import pytest
+
+from bisslog_aws_lambda.aws_lambda.shard_selector import ShardSelector
+
+NAMES = [f"use_case_{i}" for i in range(200)]
+
+
+def test_shards_are_disjoint_and_cover_every_name():
+    shards = [set(filter(ShardSelector(i, 4), NAMES)) for i in range(1, 5)]
+
+    assert set().union(*shards) == set(NAMES)
+    assert sum(map(len, shards)) == len(NAMES)
+    assert all(shards)
+
+
+def test_assignment_is_stable():
+    assert [ShardSelector(1, 5).shard_of(name) for name in NAMES[:6]] == [3, 2, 4, 2, 3, 2]
+
+
+def test_handler_names_follow_their_use_case():
+    selector = ShardSelector(1, 3)
+
+    assert all(selector.shard_of(f"{name}_handler") == selector.shard_of(name) for name in NAMES)
+
+
+def test_single_shard_selects_everything():
+    assert all(map(ShardSelector(1, 1), NAMES))
+
+
+@pytest.mark.parametrize("value, index, count", [("1/1", 1, 1), ("2/4", 2, 4), (" 3/ 3", 3, 3)])
+def test_parse(value, index, count):
+    selector = ShardSelector.parse(value)
+
+    assert (selector.index, selector.count) == (index, count)
+    assert str(selector) == f"{index}/{count}"
+
+
+@pytest.mark.parametrize("value", ["2", "0/3", "4/3", "1/0", "a/b", "1/2/3"])
+def test_parse_rejects_invalid_shards(value):
+    with pytest.raises(ValueError, match="Invalid shard"):
+        ShardSelector.parse(value)
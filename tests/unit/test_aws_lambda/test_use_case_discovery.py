@@ -0,0 +1,84 @@
+import importlib
+import json
+
+import pytest
+
+from bisslog_aws_lambda.aws_lambda.use_case_discovery import (
+    FilteredPackageTreeReader, FilteredServiceMetadataReader, use_case_matcher)
+
+
+@pytest.mark.parametrize("pattern, keyname, expected", [
+    ("get", "get_user", True),
+    ("user", "get_user", True),
+    ("create", "get_user", False),
+    ("^(get|list)_user$", "list_user", True),
+    ("^(get|list)_user$", "list_users", False),
+    ("^(get|list)_[a-z]+$", "list_users", True),
+    ("get_.*", "get_user", True),
+    ("^get_", "forget_password", False),
+    ("glob:get_*", "get_user", True),
+    ("glob:get_*", "list_users", False),
+    ("glob:get_*", "forget_password", False),
+    ("glob:get_*", "budget_report", False),
+    ("glob:get_*", "target", False),
+    ("glob:[[]get*", "[get_user", True),
+    ("re:^get_.*$", "get_user", True),
+    ("re:^get_.*$", "forget_password", False),
+    ("re:glob:x", "glob:x", True),
+])
+def test_use_case_matcher(pattern, keyname, expected):
+    assert use_case_matcher(pattern)(keyname) is expected
+
+
+def test_use_case_matcher_rejects_invalid_regex():
+    with pytest.raises(ValueError, match="Invalid use case filter"):
+        use_case_matcher("re:(get")
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    package = tmp_path / "discovery_use_cases"
+    (package / "admin").mkdir(parents=True)
+    (package / "__init__.py").write_text("", encoding="utf-8")
+    (package / "admin" / "__init__.py").write_text("", encoding="utf-8")
+    (package / "get_user.py").write_text("VALUE = 1\n", encoding="utf-8")
+    (package / "admin" / "get_admin.py").write_text("VALUE = 2\n", encoding="utf-8")
+    (package / "delete_user.py").write_text("raise RuntimeError('imported')\n",
+                                            encoding="utf-8")
+    (tmp_path / "metadata.json").write_text(json.dumps({
+        "name": "users",
+        "use_cases": {"get_user": {"name": "Get user"}, "get_admin": {"name": "Get admin"},
+                      "delete_user": {"name": "Delete user"}},
+    }), encoding="utf-8")
+    return tmp_path
+
+
+def inspect_module(module_path):
+    return importlib.import_module(module_path).VALUE
+
+
+def test_filtered_reader_only_imports_matching_modules(project):
+    reader = FilteredPackageTreeReader(inspect_module, use_case_matcher("glob:get_*"))
+
+    assert reader("discovery_use_cases") == {"get_user": 1, "get_admin": 2}
+
+
+def test_filtered_metadata_reader_selects_declared_and_discovered(project, capsys):
+    result = FilteredServiceMetadataReader(inspect_module)(
+        metadata_file="metadata.json", use_cases_folder_path="discovery_use_cases",
+        filter_uc="get_user")
+
+    assert list(result.declared_metadata.use_cases) == ["get_user"]
+    assert result.discovered_use_cases == {"get_user": 1}
+    out = capsys.readouterr().out
+    assert "No code was found" not in out
+    assert "There are 1 use cases matching 'get_user'" in out
+
+
+def test_filtered_metadata_reader_rejects_filters_selecting_nothing(project):
+    with pytest.raises(ValueError, match="selects no use case"):
+        FilteredServiceMetadataReader(inspect_module)(
+            metadata_file="metadata.json", use_cases_folder_path="discovery_use_cases",
+            filter_uc="^create_")
@@ -1,3 +1,7 @@
+import json
+import subprocess
+import zipfile
+
 import pytest
 import sys
 from unittest.mock import patch, MagicMock
@@ -9,7 +13,7 @@ def import_main():
     return main
 
 
-@patch("bisslog_aws_lambda.cli.lambda_aws_packager")
+@patch("bisslog_aws_lambda.aws_lambda.lambda_aws_packager.lambda_aws_packager")
 def test_generate_lambda_zips_command(mock_packager, import_main):
     test_args = ["bisslog_aws_lambda", "generate_lambda_zips", "--handler-name", "my_handler"]
     with patch.object(sys, "argv", test_args):
@@ -17,7 +21,7 @@ def test_generate_lambda_zips_command(mock_packager, import_main):
         mock_packager.assert_called_once()
 
 
-@patch("bisslog_aws_lambda.cli.lambda_handler_generator_manager_saver")
+@patch("bisslog_aws_lambda.aws_lambda.lambda_handler_generator_manager.lambda_handler_generator_manager_saver")
 def test_generate_lambda_handlers_command(mock_manager, import_main):
     test_args = [
         "bisslog_aws_lambda", "generate_lambda_handlers",
@@ -30,7 +34,35 @@ def test_generate_lambda_handlers_command(mock_manager, import_main):
         mock_manager.assert_called_once()
 
 
-@patch("bisslog_aws_lambda.cli.lambda_handler_generator_manager_printer")
+@patch("bisslog_aws_lambda.aws_lambda.lambda_handler_watcher.LambdaHandlerWatcher")
+@patch("bisslog_aws_lambda.aws_lambda.lambda_handler_generator_manager.lambda_handler_generator_manager_saver")
+def test_generate_lambda_handlers_watch_command(mock_manager, mock_watcher, import_main):
+    test_args = ["bisslog_aws_lambda", "generate_lambda_handlers", "--metadata-file", "file.yaml",
+                 "--watch", "--watch-interval", "0.2", "--target-folder", "generated"]
+    with patch.object(sys, "argv", test_args):
+        import_main()
+    mock_manager.assert_not_called()
+    mock_watcher.assert_called_once_with(interval=0.2)
+    kwargs = mock_watcher.return_value.call_args[1]
+    assert kwargs["metadata_file"] == "file.yaml"
+    assert kwargs["target_folder"] == "generated"
+
+
+@pytest.mark.parametrize("option", [["--shard", "1/2"], ["--metadata-cache", "cache.pickle"],
+                                    ["--timing", "text"], ["--timing-file", "timing.json"],
+                                    ["--validate", "compile"]])
+@patch("bisslog_aws_lambda.aws_lambda.lambda_handler_watcher.LambdaHandlerWatcher")
+def test_generate_lambda_handlers_watch_rejects_unsupported_options(mock_watcher, option,
+                                                                   import_main, capsys):
+    test_args = ["bisslog_aws_lambda", "generate_lambda_handlers", "--watch", *option]
+    with patch.object(sys, "argv", test_args), pytest.raises(SystemExit) as exc_info:
+        import_main()
+    assert exc_info.value.code == 2
+    assert f"--watch cannot be combined with {option[0]}" in capsys.readouterr().err
+    mock_watcher.assert_not_called()
+
+
+@patch("bisslog_aws_lambda.aws_lambda.lambda_handler_generator_manager.lambda_handler_generator_manager_printer")
 def test_print_lambda_handlers_command(mock_printer, import_main):
     test_args = [
         "bisslog_aws_lambda", "print_lambda_handlers",
@@ -42,7 +74,85 @@ def test_print_lambda_handlers_command(mock_printer, import_main):
         mock_printer.assert_called_once()
 
 
-@patch("bisslog_aws_lambda.cli.lambda_aws_packager", side_effect=RuntimeError("fail"))
+@patch("bisslog_aws_lambda.aws_lambda.lambda_handler_generator_manager.lambda_handler_generator_manager_printer")
+def test_print_lambda_handlers_timing_json(mock_printer, import_main, capsys):
+    test_args = ["bisslog_aws_lambda", "print_lambda_handlers", "--metadata-file", "file.yaml",
+                 "--timing", "json", "--timing-top", "3"]
+    with patch.object(sys, "argv", test_args):
+        import_main()
+
+    assert mock_printer.call_args[1]["timer"] is not None
+    report = json.loads(capsys.readouterr().err)
+    assert set(report["phases"]) == {"metadata", "discovery", "generation", "validation",
+                                      "resolver"}
+    assert report["slowest_use_cases"] == []
+
+
+@patch("bisslog_aws_lambda.aws_lambda.lambda_handler_generator_manager.lambda_handler_generator_manager_saver")
+def test_generate_lambda_handlers_timing_text(mock_manager, import_main, capsys):
+    test_args = ["bisslog_aws_lambda", "generate_lambda_handlers", "--metadata-file",
+                 "file.yaml", "--timing", "text"]
+    with patch.object(sys, "argv", test_args):
+        import_main()
+
+    assert mock_manager.call_args[1]["timer"] is not None
+    assert "discovery" in capsys.readouterr().err
+
+
+@patch("bisslog_aws_lambda.aws_lambda.lambda_handler_generator_manager.lambda_handler_generator_manager_saver")
+def test_generate_lambda_handlers_without_timing(mock_manager, import_main, capsys):
+    test_args = ["bisslog_aws_lambda", "generate_lambda_handlers", "--metadata-file", "file.yaml"]
+    with patch.object(sys, "argv", test_args):
+        import_main()
+
+    assert mock_manager.call_args[1]["timer"] is None
+    assert capsys.readouterr().out == ""
+
+
+@patch("bisslog_aws_lambda.aws_lambda.lambda_handler_generator_manager.lambda_handler_generator_manager_saver")
+def test_generate_lambda_handlers_validate_command(mock_manager, import_main):
+    test_args = ["bisslog_aws_lambda", "generate_lambda_handlers", "--metadata-file",
+                 "file.yaml", "--validate", "import", "--validate-workers", "3",
+                 "--validate-timeout", "5"]
+    with patch.object(sys, "argv", test_args):
+        import_main()
+
+    validator = mock_manager.call_args[1]["validator"]
+    assert (validator.import_check, validator.workers, validator.timeout) == (True, 3, 5)
+
+
+@patch("bisslog_aws_lambda.aws_lambda.lambda_handler_generator_manager.lambda_handler_generator_manager_saver")
+def test_generate_lambda_handlers_validates_only_on_request(mock_manager, import_main):
+    test_args = ["bisslog_aws_lambda", "generate_lambda_handlers", "--metadata-file", "file.yaml"]
+    with patch.object(sys, "argv", test_args):
+        import_main()
+
+    assert mock_manager.call_args[1]["validator"] is None
+
+
+@patch("bisslog_aws_lambda.aws_lambda.lambda_handler_generator_manager.lambda_handler_generator_manager_saver")
+@patch("bisslog_aws_lambda.aws_lambda.lambda_aws_packager.lambda_aws_packager", return_value=[])
+def test_shard_is_forwarded_to_both_generation_commands(mock_packager, mock_manager, import_main):
+    with patch.object(sys, "argv", ["bisslog_aws_lambda", "generate_lambda_zips",
+                                    "--shard", "2/3"]):
+        import_main()
+    with patch.object(sys, "argv", ["bisslog_aws_lambda", "generate_lambda_handlers",
+                                    "--shard", "3/3"]):
+        import_main()
+
+    assert str(mock_packager.call_args[1]["shard"]) == "2/3"
+    assert str(mock_manager.call_args[1]["shard"]) == "3/3"
+
+
+def test_invalid_shard_is_rejected(import_main, capsys):
+    test_args = ["bisslog_aws_lambda", "generate_lambda_zips", "--shard", "4/3"]
+    with patch.object(sys, "argv", test_args), pytest.raises(SystemExit) as e:
+        import_main()
+    assert e.value.code == 2
+    assert "--shard" in capsys.readouterr().err
+
+
+@patch("bisslog_aws_lambda.aws_lambda.lambda_aws_packager.lambda_aws_packager", side_effect=RuntimeError("fail"))
 def test_main_exits_on_error(mock_packager, import_main, capsys):
     test_args = ["bisslog_aws_lambda", "generate_lambda_zips", "--handler-name", "bad"]
     with patch.object(sys, "argv", test_args), pytest.raises(SystemExit) as e:
@@ -50,3 +160,194 @@ def test_main_exits_on_error(mock_packager, import_main, capsys):
     assert e.value.code == 2
     _, err = capsys.readouterr()
     assert "Error: fail" in err
+
+
+@patch("bisslog_aws_lambda.aws_lambda.lambda_aws_packager.lambda_aws_packager")
+def test_generate_lambda_zips_requirements_need_wheelhouse(mock_packager, import_main, capsys):
+    test_args = ["bisslog_aws_lambda", "generate_lambda_zips", "--requirements", "bisslog"]
+    with patch.object(sys, "argv", test_args), pytest.raises(SystemExit) as e:
+        import_main()
+    assert e.value.code == 2
+    mock_packager.assert_not_called()
+
+
+@patch("bisslog_aws_lambda.aws_lambda.lambda_aws_packager.lambda_aws_packager")
+def test_generate_lambda_zips_budget_exceeded_exits(mock_packager, import_main, tmp_path, capsys):
+    zip_path = tmp_path / "my_handler.zip"
+    with zipfile.ZipFile(zip_path, "w") as z:
+        z.writestr("lambda_function.py", "x" * 2000)
+    mock_packager.return_value = [str(zip_path)]
+    report_file = tmp_path / "report.json"
+    test_args = ["bisslog_aws_lambda", "generate_lambda_zips", "--handler-name", "my_handler",
+                 "--max-unzipped-size", "1KiB", "--report-file", str(report_file)]
+
+    with patch.object(sys, "argv", test_args), pytest.raises(SystemExit) as e:
+        import_main()
+
+    assert e.value.code == 2
+    report = json.loads(report_file.read_text())
+    assert report["packages"][0]["uncompressed_size"] == 2000
+    assert "budget" in capsys.readouterr().err
+
+
+@patch("bisslog_aws_lambda.cli.profile_lambda_imports", return_value="report")
+def test_profile_lambda_imports_command(mock_profile, import_main, capsys):
+    test_args = ["bisslog_aws_lambda", "profile_lambda_imports", "--handler-name", "my_handler",
+                 "--min-ms", "1.5", "--format", "json"]
+    with patch.object(sys, "argv", test_args):
+        import_main()
+    args = mock_profile.call_args[0][0]
+    assert args.handler_name == "my_handler"
+    assert args.min_ms == 1.5
+    assert capsys.readouterr().out.strip() == "report"
+
+
+@patch("bisslog_aws_lambda.cli.benchmark_lambda_handlers", return_value="table")
+def test_benchmark_lambda_handlers_command(mock_benchmark, import_main, capsys):
+    test_args = ["bisslog_aws_lambda", "benchmark_lambda_handlers", "--metadata-file", "m.yml",
+                 "--iterations", "10"]
+    with patch.object(sys, "argv", test_args):
+        import_main()
+    args = mock_benchmark.call_args[0][0]
+    assert args.metadata_file == "m.yml"
+    assert args.iterations == 10
+    assert capsys.readouterr().out.strip() == "table"
+
+
+@patch("bisslog_aws_lambda.aws_lambda.lambda_handler_benchmark.LambdaHandlerBenchmark")
+def test_benchmark_lambda_handlers_forwards_cold_start(mock_benchmark, import_main):
+    mock_benchmark.return_value.return_value = []
+    test_args = ["bisslog_aws_lambda", "benchmark_lambda_handlers", "--metadata-file", "m.yml",
+                 "--cold-start-metrics"]
+    with patch.object(sys, "argv", test_args):
+        import_main()
+
+    assert mock_benchmark.return_value.call_args[1]["cold_start"] is True
+
+
+@pytest.mark.parametrize("argv", [["--help"], ["generate_lambda_handlers", "--help"],
+                                  ["generate_lambda_zips", "--help"],
+                                  ["replay_lambda_events", "--help"]])
+def test_cli_startup_does_not_import_command_dependencies(argv):
+    script = (
+        "import sys\n"
+        "from bisslog_aws_lambda.cli import main\n"
+        f"sys.argv = ['bisslog_aws_lambda'] + {argv!r}\n"
+        "try:\n"
+        "    main()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "heavy = ('bisslog_schema', 'bisslog_aws_lambda.aws_lambda')\n"
+        "print(sorted(m for m in sys.modules if m.startswith(heavy)), file=sys.stderr)\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True,
+                            check=True)
+    assert result.stderr.strip() == "[]"
+
+
+@patch("bisslog_aws_lambda.aws_lambda.lambda_services_generator.LambdaServicesGenerator.__call__",
+       return_value=[{"metadata_file": "a.yml", "handlers": 1, "seconds": 0.1}])
+def test_generate_services_handlers_command(mock_generate, import_main, tmp_path, capsys):
+    manifest = tmp_path / "services.json"
+    manifest.write_text(json.dumps([{"metadata_file": "a.yml", "encoding": "latin-1"}]))
+    test_args = ["bisslog_aws_lambda", "generate_services_handlers", "--manifest", str(manifest),
+                 "--service", "b.yml", "b/use_cases", "out/b", "--workers", "2",
+                 "--instrument", "emf", "--format", "json"]
+    with patch.object(sys, "argv", test_args):
+        import_main()
+    services = mock_generate.call_args[0][0]
+    assert services == [
+        {"metadata_file": "a.yml", "encoding": "latin-1"},
+        {"metadata_file": "b.yml", "use_cases_folder_path": "b/use_cases",
+         "target_folder": "out/b", "encoding": "utf-8"}]
+    assert mock_generate.call_args[1] == {"instrument": "emf", "cold_start": False}
+    assert json.loads(capsys.readouterr().out)[0]["handlers"] == 1
+
+
+def test_generate_services_handlers_requires_services(import_main, capsys):
+    test_args = ["bisslog_aws_lambda", "generate_services_handlers"]
+    with patch.object(sys, "argv", test_args), pytest.raises(SystemExit) as e:
+        import_main()
+    assert e.value.code == 2
+    assert "requires --manifest or --service" in capsys.readouterr().err
+
+
+@pytest.fixture
+def items_project(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    package = tmp_path / "fused_pkg" / "use_cases"
+    package.mkdir(parents=True)
+    (tmp_path / "fused_pkg" / "__init__.py").write_text("")
+    (package / "__init__.py").write_text("")
+    (package / "get_item.py").write_text(
+        "from bisslog import use_case\n\n\n@use_case\ndef get_item(**kwargs):\n"
+        "    return None\n")
+    (tmp_path / "metadata.json").write_text(json.dumps({"name": "items", "use_cases": {
+        "get_item": {"name": "Get item", "triggers": [
+            {"type": "http", "options": {"method": "get", "path": "/items"}}]}}}))
+    yield tmp_path
+    for name in [name for name in sys.modules if name.startswith("fused_pkg")]:
+        del sys.modules[name]
+
+
+def test_generate_lambda_packages_builds_zips_without_handler_files(import_main, items_project):
+    tmp_path = items_project
+    test_args = ["bisslog_aws_lambda", "generate_lambda_packages", "--metadata-file",
+                 "metadata.json", "--use-cases-folder-path", "fused_pkg/use_cases",
+                 "--src-folders", "fused_pkg", "--output-dir", "dist",
+                 "--report-file", "report.json"]
+    with patch.object(sys, "argv", test_args):
+        import_main()
+
+    with zipfile.ZipFile(tmp_path / "dist" / "get_item_handler.zip") as z:
+        assert "from fused_pkg.use_cases.get_item import get_item" in \
+            z.read("lambda_function.py").decode()
+        assert "fused_pkg/use_cases/get_item.py" in z.namelist()
+    assert not (tmp_path / "framework").exists()
+    assert json.loads((tmp_path / "report.json").read_text())["packages"]
+
+
+@pytest.mark.parametrize("command", ["print_lambda_handlers", "generate_lambda_handlers"])
+def test_timing_file_is_a_json_document(command, import_main, items_project, capsys):
+    test_args = ["bisslog_aws_lambda", command, "--metadata-file", "metadata.json",
+                 "--use-cases-folder-path", "fused_pkg/use_cases", "--timing-file",
+                 "timing.json"]
+    with patch.object(sys, "argv", test_args):
+        import_main()
+
+    report = json.loads((items_project / "timing.json").read_text())
+    assert [row["use_case"] for row in report["slowest_use_cases"]] == ["get_item"]
+    assert "Resolver result for get_item" in capsys.readouterr().out
+
+
+def test_generate_services_handlers_json_output_is_parseable(import_main, items_project,
+                                                             capsys):
+    (items_project / "services.json").write_text(json.dumps([{
+        "metadata_file": "metadata.json", "use_cases_folder_path": "fused_pkg/use_cases",
+        "target_folder": "generated", "metadata_cache": "cache.pickle"}]))
+    test_args = ["bisslog_aws_lambda", "generate_services_handlers", "--manifest",
+                 "services.json", "--format", "json"]
+    for _ in range(2):
+        with patch.object(sys, "argv", test_args):
+            import_main()
+
+        captured = capsys.readouterr()
+        assert [row["handlers"] for row in json.loads(captured.out)] == [1]
+    assert "Using cached service metadata" in captured.err
+    assert (items_project / "generated" / "get_item_handler.py").exists()
+
+
+def test_replay_lambda_events_command(import_main, tmp_path, capsys):
+    (tmp_path / "ping_handler.py").write_text(
+        "def lambda_handler(event, context):\n    return {'statusCode': 200}\n")
+    (tmp_path / "events.jsonl").write_text(json.dumps({"httpMethod": "GET"}) + "\n")
+    test_args = ["bisslog_aws_lambda", "replay_lambda_events", "--handler-name", "ping_handler",
+                 "--handlers-folder", str(tmp_path), "--events", str(tmp_path / "events.jsonl"),
+                 "--workers", "2", "--repeat", "3", "--format", "json"]
+    with patch.object(sys, "argv", test_args):
+        import_main()
+
+    report = json.loads(capsys.readouterr().out)
+    assert (report["events"], report["errors"], report["workers"]) == (3, 0, 2)
+    assert report["sources"][0]["source"] == "http"